@@ -1,14 +1,42 @@
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
 
+# Rotas de leitura de alto volume cujo access log de sucesso é descartado
+QUIET_ACCESS_LOG_PATHS = ("/api/cars",)
 
-def setup_logging(level: str = "INFO") -> None:
+
+class QuietAccessLogFilter(logging.Filter):
+    """
+    Descarta o access log do uvicorn para GETs bem-sucedidos nas rotas de QUIET_ACCESS_LOG_PATHS.
+    
+    Erros (status >= 400) e as demais rotas continuam sendo registrados.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Formato do uvicorn.access: (cliente, método, caminho, versão HTTP, status)
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5:
+            _, method, path, _, status_code = args
+            if method == "GET" and status_code < 400 and path.startswith(QUIET_ACCESS_LOG_PATHS):
+                return False
+        return True
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
     """
     Configura o logging da aplicação.
     
+    Os registros entram em uma fila e são escritos no console por uma thread
+    própria (QueueListener), então o event loop não bloqueia na escrita em stdout.
+    
     Args:
         level: Nível de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        
+    Returns:
+        QueueListener: Listener já iniciado; chamar stop() no encerramento para esvaziar a fila
     """
     
     # Formatador personalizado
@@ -21,10 +49,16 @@ def setup_logging(level: str = "INFO") -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     
+    # Handler do logger raiz só enfileira; a escrita acontece na thread do listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    
     # Configuração do logger raiz
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        handlers=[console_handler],
+        handlers=[queue_handler],
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
@@ -42,4 +76,7 @@ def setup_logging(level: str = "INFO") -> None:
         logger = logging.getLogger(logger_name)
         logger.setLevel(getattr(logging, config["level"]))
     
+    logging.getLogger("uvicorn.access").addFilter(QuietAccessLogFilter())
+    
     logging.info("Sistema de logging configurado com sucesso")
+    return listener
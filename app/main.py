@@ -1,20 +1,29 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from app.src.infrastructure.adapters.driving.api import router as api_router
+from app.src.infrastructure.adapters.driving.api.application_routes import ensure_unique_routes
 from app.src.infrastructure.startup.system_initializer import initialize_system
+from app.src.infrastructure.startup.blacklist_cache_refresher import refresh_blacklist_cache_periodically
+from app.src.application.services.vehicle_image_service import start_thumbnail_executor, shutdown_thumbnail_executor
 from app.config.logging_config import setup_logging
+from app.src.domain.exceptions import AuthenticationError, BusinessRuleError, ConflictError, NotFoundError
+import asyncio
 import logging
 
 # Configurar logging
-setup_logging("INFO")
+log_listener = setup_logging("INFO")
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Iniciando aplicação Car Sales")
     
+    # Cada sub-router deve ter sido incluído uma única vez
+    ensure_unique_routes(app.routes)
+    
     # Criar diretórios de upload se não existirem
     static_dir = Path("static/uploads")
     static_dir.mkdir(parents=True, exist_ok=True)
@@ -26,8 +35,20 @@ async def lifespan(app: FastAPI):
     # Inicializar sistema automaticamente (criar usuário admin, etc.)
     await initialize_system()
     
+    # Pool de processos que gera os thumbnails das imagens enviadas
+    start_thumbnail_executor()
+    
+    # Manter cache da blacklist de tokens atualizado em segundo plano
+    blacklist_task = asyncio.create_task(refresh_blacklist_cache_periodically())
+    
     yield
+    
+    blacklist_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await blacklist_task
+    shutdown_thumbnail_executor()
     logger.info("🔄 Finalizando aplicação Car Sales")
+    log_listener.stop()
 
 app = FastAPI(
     title="🚗 Car Sales API",
@@ -75,6 +96,45 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Handlers globais: erros esperados viram resposta direto, sem try/except em cada rota
+@app.exception_handler(AuthenticationError)
+async def authentication_error_handler(request: Request, exc: AuthenticationError):
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": str(exc)},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+@app.exception_handler(BusinessRuleError)
+async def business_rule_error_handler(request: Request, exc: BusinessRuleError):
+    logger.warning("Regra de negócio violada em %s %s: %s", request.method, request.url.path, exc)
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(NotFoundError)
+async def not_found_error_handler(request: Request, exc: NotFoundError):
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(ConflictError)
+async def conflict_error_handler(request: Request, exc: ConflictError):
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(Exception)
+async def unexpected_error_handler(request: Request, exc: Exception):
+    logger.exception("Erro interno em %s %s", request.method, request.url.path)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Erro interno do servidor"},
+    )
+
 # Criar diretório static se não existir (antes de montar)
 static_path = Path("static")
 static_path.mkdir(parents=True, exist_ok=True)
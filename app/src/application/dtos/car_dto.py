@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from decimal import Decimal
 
@@ -9,13 +9,13 @@ class CreateCarRequest(BaseModel):
     """
     # Dados do veículo base (MotorVehicle)
     model: str = Field(..., min_length=1, max_length=100, description="Modelo do veículo")
-    year: str = Field(..., min_length=4, max_length=20, description="Ano do veículo")
+    year: int = Field(..., ge=1900, le=2100, description="Ano do veículo")
     mileage: int = Field(..., ge=0, description="Quilometragem do veículo")
-    fuel_type: str = Field(..., min_length=1, max_length=20, description="Tipo de combustível")
-    color: str = Field(..., min_length=1, max_length=50, description="Cor do veículo")
+    fuel_type: str = Field(..., min_length=1, max_length=15, description="Tipo de combustível")
+    color: str = Field(..., min_length=1, max_length=30, description="Cor do veículo")
     city: str = Field(..., min_length=1, max_length=100, description="Cidade onde está o veículo")
     price: Decimal = Field(..., gt=0, description="Preço do veículo (deve ser maior que zero)")
-    additional_description: Optional[str] = Field(None, description="Descrição adicional do veículo")
+    additional_description: Optional[str] = Field(None, max_length=1000, description="Descrição adicional do veículo")
     
     # Dados específicos do carro
     bodywork: str = Field(..., min_length=1, max_length=20, description="Tipo de carroceria")
@@ -25,7 +25,7 @@ class CreateCarRequest(BaseModel):
         json_schema_extra = {
             "example": {
                 "model": "Honda Civic",
-                "year": "2020",
+                "year": 2020,
                 "mileage": 25000,
                 "fuel_type": "Flex",
                 "color": "Branco",
@@ -55,7 +55,7 @@ class CarResponse(BaseModel):
     """
     id: int
     model: str
-    year: str
+    year: int
     mileage: int
     fuel_type: str
     color: str
@@ -75,7 +75,7 @@ class CarResponse(BaseModel):
             "example": {
                 "id": 1,
                 "model": "Honda Civic",
-                "year": "2020",
+                "year": 2020,
                 "mileage": 25000,
                 "fuel_type": "Flex",
                 "color": "Branco",
@@ -116,7 +116,7 @@ class CarsListResponse(BaseModel):
                     {
                         "id": 1,
                         "model": "Honda Civic",
-                        "year": "2020",
+                        "year": 2020,
                         "mileage": 25000,
                         "fuel_type": "Flex",
                         "color": "Branco",
@@ -9,8 +9,8 @@ class CreateClientRequest(BaseModel):
     # Dados do cliente
     name: str = Field(..., min_length=1, max_length=100, description="Nome do cliente")
     email: EmailStr = Field(..., description="Email do cliente")
-    phone: Optional[str] = Field(None, max_length=50, description="Telefone do cliente")
-    cpf: str = Field(..., min_length=11, max_length=14, description="CPF do cliente")
+    phone: Optional[str] = Field(None, max_length=20, description="Telefone do cliente")
+    cpf: str = Field(..., min_length=11, max_length=14, pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$', description="CPF do cliente")
     
     # Dados do endereço (opcional)
     street: Optional[str] = Field(None, max_length=100, description="Rua do endereço")
@@ -41,8 +41,8 @@ class UpdateClientRequest(BaseModel):
     """
     name: Optional[str] = Field(None, min_length=1, max_length=100, description="Nome do cliente")
     email: Optional[EmailStr] = Field(None, description="Email do cliente")
-    phone: Optional[str] = Field(None, max_length=50, description="Telefone do cliente")
-    cpf: Optional[str] = Field(None, min_length=11, max_length=14, description="CPF do cliente")
+    phone: Optional[str] = Field(None, max_length=20, description="Telefone do cliente")
+    cpf: Optional[str] = Field(None, min_length=11, max_length=14, pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$', description="CPF do cliente")
     
     # Dados do endereço (opcional)
     street: Optional[str] = Field(None, max_length=100, description="Rua do endereço")
@@ -71,7 +71,6 @@ class AddressResponse(BaseModel):
     """
     DTO para resposta do endereço.
     """
-    id: int
     street: Optional[str]
     city: Optional[str]
     state: Optional[str]
@@ -105,7 +104,6 @@ class ClientResponse(BaseModel):
                 "phone": "(11) 99999-9999",
                 "cpf": "123.456.789-00",
                 "address": {
-                    "id": 1,
                     "street": "Rua das Flores, 123",
                     "city": "São Paulo",
                     "state": "SP",
@@ -10,8 +10,8 @@ class CreateEmployeeRequest(BaseModel):
     # Dados do funcionário
     name: str = Field(..., min_length=1, max_length=100, description="Nome do funcionário")
     email: EmailStr = Field(..., description="Email do funcionário")
-    phone: Optional[str] = Field(None, max_length=50, description="Telefone do funcionário")
-    cpf: str = Field(..., min_length=11, max_length=14, description="CPF do funcionário")
+    phone: Optional[str] = Field(None, max_length=20, description="Telefone do funcionário")
+    cpf: str = Field(..., min_length=11, max_length=14, pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$', description="CPF do funcionário")
     
     # Dados do endereço (opcional)
     street: Optional[str] = Field(None, max_length=100, description="Rua do endereço")
@@ -42,8 +42,8 @@ class UpdateEmployeeRequest(BaseModel):
     """
     name: Optional[str] = Field(None, min_length=1, max_length=100, description="Nome do funcionário")
     email: Optional[EmailStr] = Field(None, description="Email do funcionário")
-    phone: Optional[str] = Field(None, max_length=50, description="Telefone do funcionário")
-    cpf: Optional[str] = Field(None, min_length=11, max_length=14, description="CPF do funcionário")
+    phone: Optional[str] = Field(None, max_length=20, description="Telefone do funcionário")
+    cpf: Optional[str] = Field(None, min_length=11, max_length=14, pattern=r'^\d{3}\.?\d{3}\.?\d{3}-?\d{2}$', description="CPF do funcionário")
     status: Optional[str] = Field(None, description="Status do funcionário (Ativo/Inativo)")
     
     # Dados do endereço (opcional)
@@ -94,7 +94,6 @@ class EmployeeResponse(BaseModel):
                 "cpf": "123.456.789-00",
                 "status": "Ativo",
                 "address": {
-                    "id": 1,
                     "street": "Rua das Empresas, 456",
                     "city": "São Paulo",
                     "state": "SP",
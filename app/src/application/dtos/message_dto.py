@@ -45,10 +45,12 @@ class MessageResponse(BaseModel):
 
 class MessagesListResponse(BaseModel):
     messages: List[MessageResponse]
-    total: int
-    page: int
+    # Paginação por cursor não conta registros nem tem número de página: nesse modo
+    # total, page e total_pages vêm null (na paginação por page são sempre preenchidos)
+    total: Optional[int] = Field(None, description="Total de mensagens filtradas; null na paginação por cursor")
+    page: Optional[int] = Field(None, description="Página atual; null na paginação por cursor")
     limit: int
-    total_pages: int
+    total_pages: Optional[int] = Field(None, description="Total de páginas; null na paginação por cursor")
 
 class MessageCreatedResponse(BaseModel):
     id: int
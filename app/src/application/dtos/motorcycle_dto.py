@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from decimal import Decimal
 
@@ -20,13 +20,13 @@ class CreateMotorcycleRequest(BaseModel):
     """
     # Dados do veículo base (MotorVehicle)
     model: str = Field(..., min_length=1, max_length=100, description="Modelo do veículo")
-    year: str = Field(..., min_length=4, max_length=20, description="Ano do veículo")
+    year: int = Field(..., ge=1900, le=2100, description="Ano do veículo")
     mileage: int = Field(..., ge=0, description="Quilometragem do veículo")
-    fuel_type: str = Field(..., min_length=1, max_length=20, description="Tipo de combustível")
-    color: str = Field(..., min_length=1, max_length=50, description="Cor do veículo")
+    fuel_type: str = Field(..., min_length=1, max_length=15, description="Tipo de combustível")
+    color: str = Field(..., min_length=1, max_length=30, description="Cor do veículo")
     city: str = Field(..., min_length=1, max_length=100, description="Cidade onde está o veículo")
     price: Decimal = Field(..., gt=0, description="Preço do veículo (deve ser maior que zero)")
-    additional_description: Optional[str] = Field(None, description="Descrição adicional do veículo")
+    additional_description: Optional[str] = Field(None, max_length=1000, description="Descrição adicional do veículo")
     
     # Dados específicos da moto
     starter: str = Field(..., min_length=1, max_length=50, description="Tipo de partida")
@@ -42,7 +42,7 @@ class CreateMotorcycleRequest(BaseModel):
         json_schema_extra = {
             "example": {
                 "model": "Honda CB 600F Hornet",
-                "year": "2021",
+                "year": 2021,
                 "mileage": 15000,
                 "fuel_type": "Gasolina",
                 "color": "Azul",
@@ -67,7 +67,7 @@ class MotorcycleResponse(BaseModel):
     """
     id: int
     model: str
-    year: str
+    year: int
     mileage: int
     fuel_type: str
     color: str
@@ -93,7 +93,7 @@ class MotorcycleResponse(BaseModel):
             "example": {
                 "id": 1,
                 "model": "Honda CB 600F Hornet",
-                "year": "2021",
+                "year": 2021,
                 "mileage": 15000,
                 "fuel_type": "Gasolina",
                 "color": "Azul",
@@ -140,7 +140,7 @@ class MotorcyclesListResponse(BaseModel):
                     {
                         "id": 1,
                         "model": "Honda CB 600F Hornet",
-                        "year": "2021",
+                        "year": 2021,
                         "mileage": 15000,
                         "fuel_type": "Gasolina",
                         "color": "Azul",
@@ -149,7 +149,7 @@ class VehicleSummary(BaseModel):
     """
     id: int
     model: str
-    year: str
+    year: int
     color: str
     price: Decimal
 
@@ -197,7 +197,7 @@ class SaleResponse(BaseModel):
                 "vehicle": {
                     "id": 1,
                     "model": "Civic",
-                    "year": "2023",
+                    "year": 2023,
                     "color": "Preto",
                     "price": "85000.00"
                 },
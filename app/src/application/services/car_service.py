@@ -2,6 +2,7 @@ from typing import Optional, List
 from app.src.domain.ports.car_repository import CarRepositoryInterface
 from app.src.domain.entities.car_model import Car
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
+from app.src.domain.entities.vehicle_image_model import VehicleImageSummary
 from app.src.application.dtos.car_dto import CreateCarRequest, CarResponse, CarsListResponse, VehicleImageInfo
 from app.src.infrastructure.driven.persistence.vehicle_image_repository_impl import VehicleImageRepositoryImpl
 from decimal import Decimal
@@ -54,7 +55,7 @@ class CarService:
             created_car = await self.car_repository.create_car(motor_vehicle, car)
             
             # Converter para DTO de resposta
-            response = self._car_to_response(created_car)
+            response = await self._car_to_response(created_car)
             
             logger.info(f"Carro criado com sucesso. ID: {response.id}")
             return response
@@ -81,7 +82,7 @@ class CarService:
                 logger.info(f"Carro não encontrado. ID: {car_id}")
                 return None
             
-            response = self._car_to_response(car)
+            response = await self._car_to_response(car)
             logger.info(f"Carro encontrado. ID: {car_id}")
             return response
             
@@ -128,7 +129,7 @@ class CarService:
                 logger.info(f"Carro não encontrado para atualização. ID: {car_id}")
                 return None
             
-            response = self._car_to_response(updated_car)
+            response = await self._car_to_response(updated_car)
             logger.info(f"Carro atualizado com sucesso. ID: {car_id}")
             return response
             
@@ -182,7 +183,7 @@ class CarService:
             
             # Criar entidade motor_vehicle com status 'Inativo', mantendo os outros dados
             motor_vehicle = current_car.motor_vehicle
-            motor_vehicle.status = 'Inativo'
+            motor_vehicle.status = MotorVehicle.STATUS_INATIVO
             
             # Atualizar no repositório
             updated_car = await self.car_repository.update_car(car_id, motor_vehicle, current_car)
@@ -190,7 +191,7 @@ class CarService:
                 logger.info(f"Falha ao inativar carro. ID: {car_id}")
                 return None
             
-            response = self._car_to_response(updated_car)
+            response = await self._car_to_response(updated_car)
             logger.info(f"Carro inativado com sucesso. ID: {car_id}")
             return response
             
@@ -219,7 +220,7 @@ class CarService:
             
             # Criar entidade motor_vehicle com status 'Ativo', mantendo os outros dados
             motor_vehicle = current_car.motor_vehicle
-            motor_vehicle.status = 'Ativo'
+            motor_vehicle.status = MotorVehicle.STATUS_ATIVO
             
             # Atualizar no repositório
             updated_car = await self.car_repository.update_car(car_id, motor_vehicle, current_car)
@@ -227,7 +228,7 @@ class CarService:
                 logger.info(f"Falha ao ativar carro. ID: {car_id}")
                 return None
             
-            response = self._car_to_response(updated_car)
+            response = await self._car_to_response(updated_car)
             logger.info(f"Carro ativado com sucesso. ID: {car_id}")
             return response
             
@@ -265,9 +266,16 @@ class CarService:
             )
             
             # Converter para DTOs de resposta
-            car_responses = [self._car_to_response(car) for car in cars]
+            # Imagens de todos os veículos da página em uma única consulta (evita N+1)
+            images_by_vehicle = await self.vehicle_image_repository.find_by_vehicle_ids(
+                [car.motor_vehicle.id for car in cars]
+            )
+            car_responses = [
+                await self._car_to_response(car, images_by_vehicle[car.motor_vehicle.id])
+                for car in cars
+            ]
             
-            response = CarsListResponse(
+            response = CarsListResponse.model_construct(
                 cars=car_responses,
                 total=len(car_responses),
                 skip=skip,
@@ -281,25 +289,27 @@ class CarService:
             logger.error(f"Erro ao buscar carros com filtros: {str(e)}")
             raise Exception(f"Erro ao buscar carros: {str(e)}")
     
-    def _car_to_response(self, car: Car) -> CarResponse:
+    async def _car_to_response(self, car: Car, vehicle_images: Optional[List[VehicleImageSummary]] = None) -> CarResponse:
         """
         Converte uma entidade Car para CarResponse.
         
         Args:
             car: Entidade do domínio
+            vehicle_images: Imagens já carregadas do veículo (opcional; buscadas se ausentes)
             
         Returns:
             CarResponse: DTO de resposta
         """
         motor_vehicle = car.motor_vehicle
         
-        # Buscar imagens do veículo
-        vehicle_images = self.vehicle_image_repository.find_by_vehicle_id(motor_vehicle.id)
+        # Buscar imagens do veículo, se não vieram pré-carregadas
+        if vehicle_images is None:
+            vehicle_images = await self.vehicle_image_repository.find_by_vehicle_id(motor_vehicle.id)
         
-        # Converter imagens para VehicleImageInfo
+        # Dados vêm do banco já tipados: model_construct evita revalidar cada campo
         images = []
         for img in vehicle_images:
-            images.append(VehicleImageInfo(
+            images.append(VehicleImageInfo.model_construct(
                 id=img.id,
                 url=f"/static/uploads/cars/{motor_vehicle.id}/{img.filename}",
                 thumbnail_url=f"/static/uploads/thumbnails/cars/{motor_vehicle.id}/thumb_{img.filename}" if img.thumbnail_path else None,
@@ -307,7 +317,7 @@ class CarService:
                 is_primary=img.is_primary
             ))
         
-        return CarResponse(
+        return CarResponse.model_construct(
             id=motor_vehicle.id,
             model=motor_vehicle.model,
             year=motor_vehicle.year,
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from app.src.domain.ports.client_repository import ClientRepositoryInterface
-from app.src.domain.entities.client_model import Client, Address
+from app.src.domain.entities.client_model import Client, ClientSummary
+from app.src.domain.exceptions import BusinessRuleError
 from app.src.application.dtos.client_dto import CreateClientRequest, UpdateClientRequest, ClientResponse, ClientListResponse, AddressResponse
 import logging
 
@@ -35,15 +36,15 @@ class ClientService:
             # Verificar se já existe cliente com mesmo email
             existing_client = await self.client_repository.get_client_by_email(request.email)
             if existing_client:
-                raise ValueError(f"Já existe um cliente cadastrado com o email: {request.email}")
+                raise BusinessRuleError(f"Já existe um cliente cadastrado com o email: {request.email}")
             
             # Verificar se já existe cliente com mesmo CPF
             existing_client_cpf = await self.client_repository.get_client_by_cpf(request.cpf)
             if existing_client_cpf:
-                raise ValueError(f"Já existe um cliente cadastrado com o CPF: {request.cpf}")
+                raise BusinessRuleError(f"Já existe um cliente cadastrado com o CPF: {request.cpf}")
             
-            # Criar entidades do domínio
-            address, client = Client.create_with_address(
+            # Criar entidade do domínio
+            client = Client.create_with_address(
                 name=request.name,
                 email=request.email,
                 cpf=request.cpf,
@@ -56,7 +57,7 @@ class ClientService:
             )
             
             # Persistir no repositório
-            created_client = await self.client_repository.create_client(address, client)
+            created_client = await self.client_repository.create_client(client)
             
             logger.info(f"Cliente criado com sucesso. ID: {created_client.id}")
             
@@ -122,6 +123,32 @@ class ClientService:
             logger.error(f"Erro ao buscar cliente por CPF {cpf}: {e}")
             raise Exception(f"Erro interno do servidor ao buscar cliente: {str(e)}")
     
+    async def get_client_summary_by_cpf(self, cpf: str) -> Optional[ClientListResponse]:
+        """
+        Busca o resumo de listagem de um cliente pelo CPF.
+        
+        Usa a mesma busca (com cache) de get_client_by_cpf, mas monta direto o
+        ClientListResponse, sem passar pelo ClientResponse completo com endereço.
+        
+        Args:
+            cpf: CPF do cliente
+            
+        Returns:
+            Optional[ClientListResponse]: Resumo do cliente ou None se não encontrado
+        """
+        try:
+            client = await self.client_repository.get_client_by_cpf(cpf)
+            if not client:
+                return None
+            
+            return ClientListResponse.model_construct(
+                **{column.key: getattr(client, column.key) for column in Client.list_columns()}
+            )
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar resumo do cliente por CPF {cpf}: {e}")
+            raise Exception(f"Erro interno do servidor ao buscar cliente: {str(e)}")
+    
     async def update_client(self, client_id: int, request: UpdateClientRequest) -> Optional[ClientResponse]:
         """
         Atualiza um cliente existente.
@@ -149,39 +176,43 @@ class ClientService:
             if request.email and request.email != existing_client.email:
                 email_client = await self.client_repository.get_client_by_email(request.email)
                 if email_client and email_client.id != client_id:
-                    raise ValueError(f"Já existe outro cliente cadastrado com o email: {request.email}")
+                    raise BusinessRuleError(f"Já existe outro cliente cadastrado com o email: {request.email}")
             
             # Verificar se CPF está sendo alterado e se já existe
             if request.cpf and request.cpf != existing_client.cpf:
                 cpf_client = await self.client_repository.get_client_by_cpf(request.cpf)
                 if cpf_client and cpf_client.id != client_id:
-                    raise ValueError(f"Já existe outro cliente cadastrado com o CPF: {request.cpf}")
-            
-            # Criar entidades atualizadas
-            address = None
-            if any([request.street, request.city, request.state, request.zip_code, request.country]):
-                address = Address(
-                    street=request.street,
-                    city=request.city,
-                    state=request.state,
-                    zip_code=request.zip_code,
-                    country=request.country
-                )
-                if existing_client.address_id:
-                    address.id = existing_client.address_id
+                    raise BusinessRuleError(f"Já existe outro cliente cadastrado com o CPF: {request.cpf}")
             
             # Atualizar dados do cliente
             client = Client(
                 name=request.name or existing_client.name,
                 email=request.email or existing_client.email,
                 cpf=request.cpf or existing_client.cpf,
-                phone=request.phone if request.phone is not None else existing_client.phone,
-                address_id=existing_client.address_id
+                phone=request.phone if request.phone is not None else existing_client.phone
             )
+            
+            # Atualizar endereço se fornecido, senão manter o atual
+            if request.street or request.city or request.state or request.zip_code or request.country:
+                client.set_address(
+                    street=request.street,
+                    city=request.city,
+                    state=request.state,
+                    zip_code=request.zip_code,
+                    country=request.country
+                )
+            else:
+                client.set_address(
+                    street=existing_client.street,
+                    city=existing_client.city,
+                    state=existing_client.state,
+                    zip_code=existing_client.zip_code,
+                    country=existing_client.country
+                )
             client.id = client_id
             
             # Persistir no repositório
-            updated_client = await self.client_repository.update_client(client_id, address, client)
+            updated_client = await self.client_repository.update_client(client_id, client)
             
             if not updated_client:
                 logger.warning(f"Falha ao atualizar cliente. ID: {client_id}")
@@ -250,6 +281,25 @@ class ClientService:
             logger.error(f"Erro ao listar clientes: {e}")
             raise Exception(f"Erro interno do servidor ao listar clientes: {str(e)}")
     
+    async def get_clients_after(self, cursor_id: int, limit: int = 100) -> List[ClientListResponse]:
+        """
+        Lista clientes com paginação por cursor.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[ClientListResponse]: Lista de clientes ordenada por id
+        """
+        try:
+            clients = await self.client_repository.get_clients_after(cursor_id, limit)
+            return [self._convert_to_client_list_response(client) for client in clients]
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar clientes após o id {cursor_id}: {e}")
+            raise Exception(f"Erro interno do servidor ao listar clientes: {str(e)}")
+    
     async def search_clients_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[ClientListResponse]:
         """
         Busca clientes por nome.
@@ -286,14 +336,13 @@ class ClientService:
             ClientResponse: DTO de resposta do cliente
         """
         address_response = None
-        if client.address:
+        if client.has_address():
             address_response = AddressResponse(
-                id=client.address.id,
-                street=client.address.street,
-                city=client.address.city,
-                state=client.address.state,
-                zip_code=client.address.zip_code,
-                country=client.address.country
+                street=client.street,
+                city=client.city,
+                state=client.state,
+                zip_code=client.zip_code,
+                country=client.country
             )
         
         return ClientResponse(
@@ -307,25 +356,15 @@ class ClientService:
             updated_at=client.updated_at.isoformat() if client.updated_at else ""
         )
     
-    def _convert_to_client_list_response(self, client: Client) -> ClientListResponse:
+    def _convert_to_client_list_response(self, client: ClientSummary) -> ClientListResponse:
         """
-        Converte uma entidade Client para ClientListResponse.
+        Converte o resumo de listagem do cliente para ClientListResponse.
         
         Args:
-            client: Entidade do cliente
+            client: Resumo do cliente devolvido pelo repositório
             
         Returns:
             ClientListResponse: DTO de resposta simplificada do cliente
         """
-        city = None
-        if client.address:
-            city = client.address.city
-        
-        return ClientListResponse(
-            id=client.id,
-            name=client.name,
-            email=client.email,
-            phone=client.phone,
-            cpf=client.cpf,
-            city=city
-        )
+        # Dados vêm do banco já tipados: model_construct evita revalidar cada campo
+        return ClientListResponse.model_construct(**client._asdict())
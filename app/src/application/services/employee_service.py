@@ -1,10 +1,10 @@
 from typing import Optional, List
 from app.src.domain.ports.employee_repository import EmployeeRepositoryInterface
 from app.src.domain.entities.employee_model import Employee
-from app.src.domain.entities.client_model import Address
+from app.src.domain.exceptions import BusinessRuleError
 from app.src.application.dtos.employee_dto import (
     CreateEmployeeRequest, UpdateEmployeeRequest, EmployeeResponse, 
-    EmployeeListResponse, EmployeesListResponse, AddressResponse
+    EmployeeListResponse, AddressResponse
 )
 import logging
 
@@ -39,15 +39,15 @@ class EmployeeService:
             # Verificar se já existe funcionário com mesmo email
             existing_employee = await self.employee_repository.get_employee_by_email(request.email)
             if existing_employee:
-                raise ValueError(f"Já existe um funcionário cadastrado com o email: {request.email}")
+                raise BusinessRuleError(f"Já existe um funcionário cadastrado com o email: {request.email}")
             
             # Verificar se já existe funcionário com mesmo CPF
             existing_employee_cpf = await self.employee_repository.get_employee_by_cpf(request.cpf)
             if existing_employee_cpf:
-                raise ValueError(f"Já existe um funcionário cadastrado com o CPF: {request.cpf}")
+                raise BusinessRuleError(f"Já existe um funcionário cadastrado com o CPF: {request.cpf}")
             
-            # Criar entidades do domínio
-            address, employee = Employee.create_with_address(
+            # Criar entidade do domínio
+            employee = Employee.create_with_address(
                 name=request.name,
                 email=request.email,
                 cpf=request.cpf,
@@ -60,7 +60,7 @@ class EmployeeService:
             )
             
             # Persistir no repositório
-            created_employee = await self.employee_repository.create_employee(address, employee)
+            created_employee = await self.employee_repository.create_employee(employee)
             
             logger.info(f"Funcionário criado com sucesso. ID: {created_employee.id}")
             
@@ -153,26 +153,13 @@ class EmployeeService:
             if request.email and request.email != existing_employee.email:
                 email_employee = await self.employee_repository.get_employee_by_email(request.email)
                 if email_employee and email_employee.id != employee_id:
-                    raise ValueError(f"Já existe outro funcionário cadastrado com o email: {request.email}")
+                    raise BusinessRuleError(f"Já existe outro funcionário cadastrado com o email: {request.email}")
             
             # Verificar se CPF está sendo alterado e se já existe
             if request.cpf and request.cpf != existing_employee.cpf:
                 cpf_employee = await self.employee_repository.get_employee_by_cpf(request.cpf)
                 if cpf_employee and cpf_employee.id != employee_id:
-                    raise ValueError(f"Já existe outro funcionário cadastrado com o CPF: {request.cpf}")
-            
-            # Criar entidades atualizadas
-            address = None
-            if any([request.street, request.city, request.state, request.zip_code, request.country]):
-                address = Address(
-                    street=request.street,
-                    city=request.city,
-                    state=request.state,
-                    zip_code=request.zip_code,
-                    country=request.country
-                )
-                if existing_employee.address_id:
-                    address.id = existing_employee.address_id
+                    raise BusinessRuleError(f"Já existe outro funcionário cadastrado com o CPF: {request.cpf}")
             
             # Atualizar dados do funcionário
             employee = Employee(
@@ -180,13 +167,30 @@ class EmployeeService:
                 email=request.email or existing_employee.email,
                 cpf=request.cpf or existing_employee.cpf,
                 phone=request.phone if request.phone is not None else existing_employee.phone,
-                status=request.status or existing_employee.status,
-                address_id=existing_employee.address_id
+                status=request.status or existing_employee.status
             )
+            
+            # Atualizar endereço se fornecido, senão manter o atual
+            if request.street or request.city or request.state or request.zip_code or request.country:
+                employee.set_address(
+                    street=request.street,
+                    city=request.city,
+                    state=request.state,
+                    zip_code=request.zip_code,
+                    country=request.country
+                )
+            else:
+                employee.set_address(
+                    street=existing_employee.street,
+                    city=existing_employee.city,
+                    state=existing_employee.state,
+                    zip_code=existing_employee.zip_code,
+                    country=existing_employee.country
+                )
             employee.id = employee_id
             
             # Persistir no repositório
-            updated_employee = await self.employee_repository.update_employee(employee_id, address, employee)
+            updated_employee = await self.employee_repository.update_employee(employee_id, employee)
             
             if not updated_employee:
                 logger.warning(f"Falha ao atualizar funcionário. ID: {employee_id}")
@@ -217,8 +221,8 @@ class EmployeeService:
             logger.info(f"Iniciando atualização de status do funcionário. ID: {employee_id}, Status: {status}")
             
             # Validar status
-            if status not in ["Ativo", "Inativo"]:
-                raise ValueError("Status deve ser 'Ativo' ou 'Inativo'")
+            if status not in Employee.VALID_STATUSES:
+                raise BusinessRuleError("Status deve ser 'Ativo' ou 'Inativo'")
             
             updated_employee = await self.employee_repository.update_employee_status(employee_id, status)
             
@@ -299,6 +303,25 @@ class EmployeeService:
             logger.error(f"Erro ao listar funcionários: {e}")
             raise Exception(f"Erro interno do servidor ao listar funcionários: {str(e)}")
 
+    async def get_employees_after(self, cursor_id: int, limit: int = 100) -> List[EmployeeListResponse]:
+        """
+        Lista funcionários com paginação por cursor.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[EmployeeListResponse]: Lista de funcionários ordenada por id
+        """
+        try:
+            employees = await self.employee_repository.get_employees_after(cursor_id, limit)
+            return [self._convert_to_employee_list_response(employee) for employee in employees]
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar funcionários após o id {cursor_id}: {e}")
+            raise Exception(f"Erro interno do servidor ao listar funcionários: {str(e)}")
+
     async def get_employees_with_filters(self, skip: int = 0, limit: int = 100,
                                         name: Optional[str] = None, cpf: Optional[str] = None,
                                         status: Optional[str] = None) -> List[EmployeeListResponse]:
@@ -364,14 +387,13 @@ class EmployeeService:
             EmployeeResponse: DTO de resposta do funcionário
         """
         address_response = None
-        if employee.address:
+        if employee.has_address():
             address_response = AddressResponse(
-                id=employee.address.id,
-                street=employee.address.street,
-                city=employee.address.city,
-                state=employee.address.state,
-                zip_code=employee.address.zip_code,
-                country=employee.address.country
+                street=employee.street,
+                city=employee.city,
+                state=employee.state,
+                zip_code=employee.zip_code,
+                country=employee.country
             )
         
         return EmployeeResponse(
@@ -396,10 +418,6 @@ class EmployeeService:
         Returns:
             EmployeeListResponse: DTO de resposta simplificada do funcionário
         """
-        city = None
-        if employee.address:
-            city = employee.address.city
-        
         return EmployeeListResponse(
             id=employee.id,
             name=employee.name,
@@ -407,5 +425,5 @@ class EmployeeService:
             phone=employee.phone,
             cpf=employee.cpf,
             status=employee.status,
-            city=city
+            city=employee.city
         )
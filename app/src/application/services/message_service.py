@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime
 from app.src.domain.entities.message_model import Message, MessageStatus
 from app.src.domain.ports.message_repository import MessageRepository
+from app.src.domain.exceptions import ConflictError, NotFoundError
 from app.src.application.dtos.message_dto import (
     MessageCreateRequest, 
     MessageStartServiceRequest, 
@@ -16,7 +17,7 @@ class MessageService:
     def __init__(self, message_repository: MessageRepository):
         self.message_repository = message_repository
     
-    def create_message(self, request: MessageCreateRequest) -> MessageCreatedResponse:
+    async def create_message(self, request: MessageCreateRequest) -> MessageCreatedResponse:
         """Criar uma nova mensagem"""
         message = Message(
             name=request.name,
@@ -29,7 +30,7 @@ class MessageService:
             service_start_time=None  # Não preenchido na criação
         )
         
-        created_message = self.message_repository.create(message)
+        created_message = await self.message_repository.create(message)
         
         return MessageCreatedResponse(
             id=created_message.id,
@@ -40,7 +41,7 @@ class MessageService:
             created_at=created_message.created_at
         )
     
-    def get_messages_with_filters(
+    async def get_messages_with_filters(
         self,
         status: Optional[str] = None,
         responsible_id: Optional[int] = None,
@@ -51,7 +52,8 @@ class MessageService:
         """Buscar mensagens com filtros"""
         offset = (page - 1) * limit
         
-        messages = self.message_repository.find_all_with_filters(
+        # Página e total em um único round-trip
+        messages, total = await self.message_repository.find_page_with_filters(
             status=status,
             responsible_id=responsible_id,
             vehicle_id=vehicle_id,
@@ -59,12 +61,6 @@ class MessageService:
             offset=offset
         )
         
-        total = self.message_repository.count_with_filters(
-            status=status,
-            responsible_id=responsible_id,
-            vehicle_id=vehicle_id
-        )
-        
         total_pages = (total + limit - 1) // limit
         
         message_responses = [
@@ -91,15 +87,37 @@ class MessageService:
             total_pages=total_pages
         )
     
-    def start_service(self, message_id: int, request: MessageStartServiceRequest) -> MessageResponse:
+    async def get_messages_before(
+        self,
+        before_id: Optional[int] = None,
+        status: Optional[str] = None,
+        responsible_id: Optional[int] = None,
+        vehicle_id: Optional[int] = None,
+        limit: int = 10
+    ) -> MessagesListResponse:
+        """Buscar mensagens com filtros usando paginação por cursor"""
+        messages = await self.message_repository.find_before_id_with_filters(
+            before_id=before_id,
+            status=status,
+            responsible_id=responsible_id,
+            vehicle_id=vehicle_id,
+            limit=limit
+        )
+        
+        return MessagesListResponse(
+            messages=[MessageResponse.model_validate(msg) for msg in messages],
+            limit=limit
+        )
+    
+    async def start_service(self, message_id: int, request: MessageStartServiceRequest) -> MessageResponse:
         """Iniciar atendimento de uma mensagem"""
-        message = self.message_repository.find_by_id(message_id)
+        message = await self.message_repository.find_by_id(message_id)
         
         if not message:
-            raise ValueError(f"Mensagem com ID {message_id} não encontrada")
+            raise NotFoundError(f"Mensagem com ID {message_id} não encontrada")
         
         if message.responsible_id is not None:
-            raise ValueError("Mensagem já possui responsável atribuído")
+            raise ConflictError("Mensagem já possui responsável atribuído")
         
         # Usar update_by_id para evitar problemas de sessão
         updates = {
@@ -108,7 +126,7 @@ class MessageService:
             'status': MessageStatus.CONTACT_INITIATED.value
         }
         
-        updated_message = self.message_repository.update_by_id(message_id, updates)
+        updated_message = await self.message_repository.update_by_id(message_id, updates)
         
         return MessageResponse(
             id=updated_message.id,
@@ -124,19 +142,19 @@ class MessageService:
             updated_at=updated_message.updated_at
         )
     
-    def update_status(self, message_id: int, request: MessageUpdateStatusRequest) -> MessageResponse:
+    async def update_status(self, message_id: int, request: MessageUpdateStatusRequest) -> MessageResponse:
         """Atualizar status de uma mensagem"""
-        message = self.message_repository.find_by_id(message_id)
+        message = await self.message_repository.find_by_id(message_id)
         
         if not message:
-            raise ValueError(f"Mensagem com ID {message_id} não encontrada")
+            raise NotFoundError(f"Mensagem com ID {message_id} não encontrada")
         
         # Usar update_by_id para evitar problemas de sessão
         updates = {
             'status': request.status.value
         }
         
-        updated_message = self.message_repository.update_by_id(message_id, updates)
+        updated_message = await self.message_repository.update_by_id(message_id, updates)
         
         return MessageResponse(
             id=updated_message.id,
@@ -152,12 +170,12 @@ class MessageService:
             updated_at=updated_message.updated_at
         )
     
-    def get_message_by_id(self, message_id: int) -> MessageResponse:
+    async def get_message_by_id(self, message_id: int) -> MessageResponse:
         """Buscar mensagem por ID"""
-        message = self.message_repository.find_by_id(message_id)
+        message = await self.message_repository.find_by_id(message_id)
         
         if not message:
-            raise ValueError(f"Mensagem com ID {message_id} não encontrada")
+            raise NotFoundError(f"Mensagem com ID {message_id} não encontrada")
         
         return MessageResponse(
             id=message.id,
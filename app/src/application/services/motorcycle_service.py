@@ -2,6 +2,7 @@ from typing import Optional, List
 from app.src.domain.ports.motorcycle_repository import MotorcycleRepositoryInterface
 from app.src.domain.entities.motorcycle_model import Motorcycle
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
+from app.src.domain.entities.vehicle_image_model import VehicleImageSummary
 from app.src.application.dtos.motorcycle_dto import CreateMotorcycleRequest, MotorcycleResponse, MotorcyclesListResponse, VehicleImageInfo
 from app.src.infrastructure.driven.persistence.vehicle_image_repository_impl import VehicleImageRepositoryImpl
 from decimal import Decimal
@@ -60,7 +61,7 @@ class MotorcycleService:
             created_motorcycle = await self.motorcycle_repository.create_motorcycle(motor_vehicle, motorcycle)
             
             # Converter para DTO de resposta
-            response = self._motorcycle_to_response(created_motorcycle)
+            response = await self._motorcycle_to_response(created_motorcycle)
             
             logger.info(f"Moto criada com sucesso. ID: {response.id}")
             return response
@@ -87,7 +88,7 @@ class MotorcycleService:
                 logger.info(f"Moto não encontrada. ID: {motorcycle_id}")
                 return None
             
-            response = self._motorcycle_to_response(motorcycle)
+            response = await self._motorcycle_to_response(motorcycle)
             logger.info(f"Moto encontrada. ID: {motorcycle_id}")
             return response
             
@@ -140,7 +141,7 @@ class MotorcycleService:
                 logger.info(f"Moto não encontrada para atualização. ID: {motorcycle_id}")
                 return None
             
-            response = self._motorcycle_to_response(updated_motorcycle)
+            response = await self._motorcycle_to_response(updated_motorcycle)
             logger.info(f"Moto atualizada com sucesso. ID: {motorcycle_id}")
             return response
             
@@ -194,7 +195,7 @@ class MotorcycleService:
             
             # Criar entidade motor_vehicle com status 'Inativo', mantendo os outros dados
             motor_vehicle = current_motorcycle.motor_vehicle
-            motor_vehicle.status = 'Inativo'
+            motor_vehicle.status = MotorVehicle.STATUS_INATIVO
             
             # Atualizar no repositório
             updated_motorcycle = await self.motorcycle_repository.update_motorcycle(motorcycle_id, motor_vehicle, current_motorcycle)
@@ -202,7 +203,7 @@ class MotorcycleService:
                 logger.info(f"Falha ao inativar moto. ID: {motorcycle_id}")
                 return None
             
-            response = self._motorcycle_to_response(updated_motorcycle)
+            response = await self._motorcycle_to_response(updated_motorcycle)
             logger.info(f"Moto inativada com sucesso. ID: {motorcycle_id}")
             return response
             
@@ -231,7 +232,7 @@ class MotorcycleService:
             
             # Criar entidade motor_vehicle com status 'Ativo', mantendo os outros dados
             motor_vehicle = current_motorcycle.motor_vehicle
-            motor_vehicle.status = 'Ativo'
+            motor_vehicle.status = MotorVehicle.STATUS_ATIVO
             
             # Atualizar no repositório
             updated_motorcycle = await self.motorcycle_repository.update_motorcycle(motorcycle_id, motor_vehicle, current_motorcycle)
@@ -239,7 +240,7 @@ class MotorcycleService:
                 logger.info(f"Falha ao ativar moto. ID: {motorcycle_id}")
                 return None
             
-            response = self._motorcycle_to_response(updated_motorcycle)
+            response = await self._motorcycle_to_response(updated_motorcycle)
             logger.info(f"Moto ativada com sucesso. ID: {motorcycle_id}")
             return response
             
@@ -277,7 +278,14 @@ class MotorcycleService:
             )
             
             # Converter para DTOs de resposta
-            motorcycle_responses = [self._motorcycle_to_response(motorcycle) for motorcycle in motorcycles]
+            # Imagens de todos os veículos da página em uma única consulta (evita N+1)
+            images_by_vehicle = await self.vehicle_image_repository.find_by_vehicle_ids(
+                [motorcycle.motor_vehicle.id for motorcycle in motorcycles]
+            )
+            motorcycle_responses = [
+                await self._motorcycle_to_response(motorcycle, images_by_vehicle[motorcycle.motor_vehicle.id])
+                for motorcycle in motorcycles
+            ]
             
             response = MotorcyclesListResponse(
                 motorcycles=motorcycle_responses,
@@ -293,20 +301,22 @@ class MotorcycleService:
             logger.error(f"Erro ao buscar motocicletas com filtros: {str(e)}")
             raise Exception(f"Erro ao buscar motocicletas: {str(e)}")
     
-    def _motorcycle_to_response(self, motorcycle: Motorcycle) -> MotorcycleResponse:
+    async def _motorcycle_to_response(self, motorcycle: Motorcycle, vehicle_images: Optional[List[VehicleImageSummary]] = None) -> MotorcycleResponse:
         """
         Converte uma entidade Motorcycle para MotorcycleResponse.
         
         Args:
             motorcycle: Entidade do domínio
+            vehicle_images: Imagens já carregadas do veículo (opcional; buscadas se ausentes)
             
         Returns:
             MotorcycleResponse: DTO de resposta
         """
         motor_vehicle = motorcycle.motor_vehicle
         
-        # Buscar imagens do veículo
-        vehicle_images = self.vehicle_image_repository.find_by_vehicle_id(motor_vehicle.id)
+        # Buscar imagens do veículo, se não vieram pré-carregadas
+        if vehicle_images is None:
+            vehicle_images = await self.vehicle_image_repository.find_by_vehicle_id(motor_vehicle.id)
         
         # Converter imagens para VehicleImageInfo
         images = []
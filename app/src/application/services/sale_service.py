@@ -6,7 +6,7 @@ from app.src.domain.entities.sale_model import Sale
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 from app.src.application.dtos.sale_dto import (
     CreateSaleRequest, UpdateSaleRequest, SaleResponse, 
-    SaleListResponse, SalesListResponse, ClientSummary,
+    SaleListResponse, ClientSummary,
     EmployeeSummary, VehicleSummary
 )
 from decimal import Decimal
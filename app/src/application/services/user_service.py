@@ -1,11 +1,15 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+import bcrypt
 import jwt
-import uuid
-from passlib.context import CryptContext
-from passlib.hash import bcrypt
+import secrets
+import sys
+import time
 from app.src.domain.entities.user_model import User
 from app.src.domain.entities.blacklisted_token_model import BlacklistedToken
+from app.src.domain.exceptions import AuthenticationError
 from app.src.domain.ports.user_repository import UserRepositoryInterface
 from app.src.domain.ports.blacklisted_token_repository import BlacklistedTokenRepositoryInterface
 from app.src.application.dtos.user_dto import (
@@ -21,8 +25,29 @@ SECRET_KEY = "your-secret-key-here-change-in-production"  # Mudar em produção
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Configuração para hash de senhas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Chave, algoritmos e codificador JWT preparados uma única vez no carregamento do módulo
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+_ALGORITHMS = [ALGORITHM]
+# exp obrigatório: o cache de payloads depende dele para saber quando descartar o token
+_DECODE_OPTIONS = {"require": ["exp"]}
+_jwt_codec = jwt.PyJWT()
+
+# Cache LRU de tokens já validados (token -> payload) para evitar HMAC e parse JSON repetidos
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_payload_cache: OrderedDict = OrderedDict()
+
+# Cache LRU do usuário autenticado (token -> (expira_em, user_id, UserResponseDto)).
+# TTL curto: requisições em sequência do mesmo cliente não refazem busca e conversão do usuário
+CURRENT_USER_CACHE_TTL_SECONDS = 30
+CURRENT_USER_CACHE_MAX_SIZE = 10_000
+_current_user_cache: OrderedDict = OrderedDict()
+
+# Intervalo de atualização do cache em memória da blacklist
+BLACKLIST_REFRESH_INTERVAL_SECONDS = 5
+
+# Configuração para hash de senhas (bcrypt considera apenas os primeiros 72 bytes)
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 
 class UserService:
@@ -30,6 +55,11 @@ class UserService:
     Serviço de aplicação para usuários e autenticação.
     """
     
+    # Cache em memória dos JTIs ativos na blacklist, compartilhado entre instâncias.
+    # Enquanto não for carregado, toda verificação consulta o banco.
+    _blacklisted_jtis: set = set()
+    _blacklist_loaded: bool = False
+    
     def __init__(self, user_repository: UserRepositoryInterface, blacklisted_token_repository: Optional[BlacklistedTokenRepositoryInterface] = None):
         self.user_repository = user_repository
         self.blacklisted_token_repository = blacklisted_token_repository
@@ -38,13 +68,15 @@ class UserService:
         """
         Gera hash da senha.
         """
-        return pwd_context.hash(password)
+        password_bytes = password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+        return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
     
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verifica se a senha está correta.
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        password_bytes = plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+        return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
     
     def _create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> tuple[str, str, datetime]:
         """
@@ -55,27 +87,71 @@ class UserService:
         """
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire_seconds = expires_delta.total_seconds()
         else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire_seconds = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        exp = int(time.time() + expire_seconds)
         
         # Gerar JTI único
-        jti = str(uuid.uuid4())
+        jti = secrets.token_hex(16)
         
         to_encode.update({
-            "exp": expire,
+            "exp": exp,
             "jti": jti  # JWT ID para identificar tokens únicos
         })
         
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-        return encoded_jwt, jti, expire
+        encoded_jwt = _jwt_codec.encode(to_encode, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
+        return encoded_jwt, jti, datetime.utcfromtimestamp(exp)
+    
+    def _decode_token(self, token: str) -> Mapping:
+        """
+        Decodifica e valida a assinatura de um token JWT.
+        Tokens já validados e ainda não expirados são servidos do cache.
+        O payload é somente leitura: a mesma instância é compartilhada entre requisições.
+        """
+        payload = _token_payload_cache.get(token)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                _token_payload_cache.move_to_end(token)
+                return payload
+            del _token_payload_cache[token]
+        
+        # Token sem exp gera MissingRequiredClaimError (PyJWTError), tratado por quem chama
+        payload = MappingProxyType(
+            _jwt_codec.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+        )
+        
+        _token_payload_cache[token] = payload
+        if len(_token_payload_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_payload_cache.popitem(last=False)
+        return payload
+    
+    async def refresh_blacklist_cache(self) -> None:
+        """
+        Recarrega do banco o cache em memória dos JTIs ativos na blacklist.
+        """
+        if not self.blacklisted_token_repository:
+            return
+        
+        jtis = await self.blacklisted_token_repository.get_active_blacklisted_jtis()
+        UserService._blacklisted_jtis = set(jtis)
+        UserService._blacklist_loaded = True
+    
+    async def _is_token_blacklisted(self, jti: str) -> bool:
+        """
+        Verifica se o token está na blacklist, consultando o banco apenas
+        quando o JTI consta no cache em memória.
+        """
+        if UserService._blacklist_loaded and jti not in UserService._blacklisted_jtis:
+            return False
+        return await self.blacklisted_token_repository.is_token_blacklisted(jti)
     
     async def _verify_token(self, token: str) -> Optional[TokenDataDto]:
         """
         Verifica e decodifica um token JWT, incluindo verificação de blacklist.
         """
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = self._decode_token(token)
             user_id: int = payload.get("sub")
             email: str = payload.get("email")
             role: str = payload.get("role")
@@ -86,7 +162,7 @@ class UserService:
             
             # Verificar se token está na blacklist
             if self.blacklisted_token_repository:
-                is_blacklisted = await self.blacklisted_token_repository.is_token_blacklisted(jti)
+                is_blacklisted = await self._is_token_blacklisted(jti)
                 if is_blacklisted:
                     logger.info(f"Token blacklisted rejeitado: {jti}")
                     return None
@@ -117,12 +193,7 @@ class UserService:
             
             created_user = await self.user_repository.create_user(user)
             
-            return UserResponseDto(
-                id=created_user.id,
-                email=created_user.email,
-                role=created_user.role,
-                employee_id=created_user.employee_id
-            )
+            return self._convert_to_user_response(created_user)
             
         except ValueError as e:
             logger.error(f"Erro de validação ao criar usuário: {str(e)}")
@@ -152,7 +223,7 @@ class UserService:
         try:
             user = await self.authenticate_user(login)
             if not user:
-                raise ValueError("Email ou senha incorretos")
+                raise AuthenticationError("Email ou senha incorretos")
             
             # Criar token
             access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -171,9 +242,9 @@ class UserService:
                 expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
             )
             
-        except ValueError as e:
-            logger.error(f"Erro de autenticação: {str(e)}")
-            raise e
+        except AuthenticationError as e:
+            logger.warning(f"Falha de autenticação: {str(e)}")
+            raise
         except Exception as e:
             logger.error(f"Erro no login: {str(e)}")
             raise Exception(f"Erro interno do servidor: {str(e)}")
@@ -194,13 +265,13 @@ class UserService:
                 return False
             
             # Decodificar token para obter informações
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = self._decode_token(token)
             jti = payload.get("jti")
             user_id = payload.get("sub")
             exp = payload.get("exp")
             
             if not jti or not user_id or not exp:
-                raise ValueError("Token inválido para logout")
+                raise AuthenticationError("Token inválido para logout")
             
             # Converter timestamp de expiração para datetime
             expires_at = datetime.utcfromtimestamp(exp)
@@ -215,13 +286,17 @@ class UserService:
             
             # Adicionar à blacklist
             await self.blacklisted_token_repository.add_token_to_blacklist(blacklisted_token)
+            UserService._blacklisted_jtis.add(jti)
+            _current_user_cache.pop(token, None)
             
             logger.info(f"Logout realizado com sucesso para usuário {user_id}")
             return True
             
+        except AuthenticationError:
+            raise
         except jwt.PyJWTError as e:
             logger.error(f"Erro ao decodificar token para logout: {str(e)}")
-            raise ValueError("Token inválido")
+            raise AuthenticationError("Token inválido")
         except Exception as e:
             logger.error(f"Erro no logout: {str(e)}")
             raise Exception(f"Erro interno do servidor: {str(e)}")
@@ -231,20 +306,28 @@ class UserService:
         Obtém o usuário atual baseado no token.
         """
         try:
+            # Assinatura, expiração e blacklist são sempre verificadas (todas em memória)
             token_data = await self._verify_token(token)
             if token_data is None or token_data.user_id is None:
                 return None
             
+            now = time.monotonic()
+            entry = _current_user_cache.get(token)
+            if entry is not None:
+                if entry[0] > now:
+                    _current_user_cache.move_to_end(token)
+                    return entry[2]
+                del _current_user_cache[token]
+            
             user = await self.user_repository.get_user_by_id(token_data.user_id)
             if user is None:
                 return None
             
-            return UserResponseDto(
-                id=user.id,
-                email=user.email,
-                role=user.role,
-                employee_id=user.employee_id
-            )
+            user_response = self._convert_to_user_response(user)
+            _current_user_cache[token] = (now + CURRENT_USER_CACHE_TTL_SECONDS, user.id, user_response)
+            if len(_current_user_cache) > CURRENT_USER_CACHE_MAX_SIZE:
+                _current_user_cache.popitem(last=False)
+            return user_response
             
         except Exception as e:
             logger.error(f"Erro ao obter usuário atual: {str(e)}")
@@ -259,12 +342,7 @@ class UserService:
             if not user:
                 return None
             
-            return UserResponseDto(
-                id=user.id,
-                email=user.email,
-                role=user.role,
-                employee_id=user.employee_id
-            )
+            return self._convert_to_user_response(user)
             
         except Exception as e:
             logger.error(f"Erro ao buscar usuário por ID: {str(e)}")
@@ -297,15 +375,11 @@ class UserService:
                 existing_user.employee_id = user_update.employee_id
             
             updated_user = await self.user_repository.update_user(user_id, existing_user)
+            self._invalidate_current_user_cache(user_id)
             if not updated_user:
                 return None
             
-            return UserResponseDto(
-                id=updated_user.id,
-                email=updated_user.email,
-                role=updated_user.role,
-                employee_id=updated_user.employee_id
-            )
+            return self._convert_to_user_response(updated_user)
             
         except ValueError as e:
             logger.error(f"Erro de validação ao atualizar usuário: {str(e)}")
@@ -319,12 +393,37 @@ class UserService:
         Remove um usuário.
         """
         try:
-            return await self.user_repository.delete_user(user_id)
+            deleted = await self.user_repository.delete_user(user_id)
+            self._invalidate_current_user_cache(user_id)
+            return deleted
             
         except Exception as e:
             logger.error(f"Erro ao deletar usuário: {str(e)}")
             raise Exception(f"Erro interno do servidor: {str(e)}")
     
+    @staticmethod
+    def _invalidate_current_user_cache(user_id: int) -> None:
+        """
+        Remove do cache de usuário autenticado todos os tokens do usuário informado.
+        """
+        stale_tokens = [token for token, (_, cached_user_id, _) in _current_user_cache.items() if cached_user_id == user_id]
+        for token in stale_tokens:
+            del _current_user_cache[token]
+    
+    def _convert_to_user_response(self, user: User) -> UserResponseDto:
+        """
+        Converte uma entidade User para UserResponseDto.
+        
+        O perfil é internado para que as comparações com as constantes
+        de perfil caiam no atalho de identidade de str.__eq__.
+        """
+        return UserResponseDto(
+            id=user.id,
+            email=user.email,
+            role=sys.intern(user.role),
+            employee_id=user.employee_id
+        )
+    
     def verify_admin_role(self, user: UserResponseDto) -> bool:
         """
         Verifica se o usuário tem perfil de administrador.
@@ -1,17 +1,76 @@
+import asyncio
+import io
+import logging
 import os
-import uuid
+import secrets
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 from fastapi import UploadFile, HTTPException
-from PIL import Image
 from pathlib import Path
-from app.src.domain.entities.vehicle_image_model import VehicleImage
+from app.src.domain.entities.vehicle_image_model import VehicleImage, VehicleImageSummary
 from app.src.domain.ports.vehicle_image_repository import VehicleImageRepository
 from app.src.application.dtos.vehicle_image_dto import (
     VehicleImageResponse, 
     VehicleImagesResponse, 
-    ImageUploadResponse
+    ImageUploadResponse,
+    ImagePositionItem
 )
 
+logger = logging.getLogger(__name__)
+
+# Pool de processos para gerar thumbnails em paralelo (redimensionamento é CPU-bound).
+# Criado e encerrado pelo lifespan da aplicação (app/main.py)
+_thumbnail_executor: Optional[ProcessPoolExecutor] = None
+
+
+def start_thumbnail_executor() -> None:
+    """Criar o pool de processos de thumbnails"""
+    global _thumbnail_executor
+    if _thumbnail_executor is None:
+        _thumbnail_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def shutdown_thumbnail_executor() -> None:
+    """Encerrar o pool de processos de thumbnails, aguardando as tarefas em andamento"""
+    global _thumbnail_executor
+    if _thumbnail_executor is not None:
+        _thumbnail_executor.shutdown(wait=True)
+        _thumbnail_executor = None
+
+
+def _get_thumbnail_executor() -> ProcessPoolExecutor:
+    """Pool de thumbnails; criado sob demanda se o serviço for usado fora do lifespan"""
+    start_thumbnail_executor()
+    return _thumbnail_executor
+
+
+def _write_file(path: str, content: bytes) -> None:
+    """Gravar os bytes da imagem original em disco"""
+    with open(path, "wb") as buffer:
+        buffer.write(content)
+
+
+def _create_thumbnail(content: bytes, thumbnail_path: str, size: tuple) -> None:
+    """Criar thumbnail a partir dos bytes já carregados da imagem"""
+    # Importado aqui: só os processos do pool usam o Pillow, então o processo da
+    # API não paga a carga do módulo na inicialização
+    from PIL import Image
+    
+    with Image.open(io.BytesIO(content)) as img:
+        # Imagens com paleta precisam virar RGB antes do redimensionamento
+        if img.mode == 'P':
+            img = img.convert('RGB')
+        
+        # Redimensionar mantendo proporção (thumbnail() já aplica draft() em JPEG)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        
+        # Converter para RGB se necessário (já na resolução reduzida)
+        if img.mode in ('RGBA', 'LA'):
+            img = img.convert('RGB')
+        
+        img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
+
+
 class VehicleImageService:
     
     # Configurações
@@ -19,70 +78,90 @@ class VehicleImageService:
     THUMBNAIL_DIR = "static/uploads/thumbnails"
     MAX_IMAGES_PER_VEHICLE = 10
     MIN_IMAGES_PER_VEHICLE = 1
-    ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+    ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+    READ_CHUNK_SIZE = 64 * 1024  # 64KB
     THUMBNAIL_SIZE = (300, 300)
     
+    # Diretórios já garantidos neste processo (compartilhado entre instâncias)
+    _dir_cache: set = set()
+    
     def __init__(self, vehicle_image_repository: VehicleImageRepository):
         self.vehicle_image_repository = vehicle_image_repository
-        self._ensure_directories()
     
-    def _ensure_directories(self):
-        """Garantir que os diretórios de upload existam"""
-        Path(self.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
-        Path(self.THUMBNAIL_DIR).mkdir(parents=True, exist_ok=True)
+    async def _create_thumbnail_safe(self, content: bytes, thumbnail_path: str) -> None:
+        """Gerar o thumbnail no pool de processos; falha não é crítica e só é registrada"""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                _get_thumbnail_executor(), _create_thumbnail, content, thumbnail_path, self.THUMBNAIL_SIZE
+            )
+        except Exception:
+            logger.exception("Erro ao criar thumbnail %s", thumbnail_path)
+    
+    def _ensure_directory(self, directory: str) -> None:
+        """Criar diretório apenas na primeira vez que for usado no processo"""
+        if directory not in self._dir_cache:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            self._dir_cache.add(directory)
     
     def _get_vehicle_directory(self, vehicle_type: str, vehicle_id: int) -> str:
         """Obter diretório específico do veículo"""
         return f"{self.UPLOAD_DIR}/{vehicle_type}/{vehicle_id}"
     
-    def _validate_file(self, file: UploadFile) -> None:
-        """Validar arquivo de upload"""
+    async def _read_validated_file(self, file: UploadFile, file_ext: str) -> bytearray:
+        """Ler arquivo de upload em blocos, validando extensão, tamanho e conteúdo"""
         # Verificar extensão
-        file_ext = Path(file.filename).suffix.lower()
         if file_ext not in self.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Extensão não permitida. Permitidas: {', '.join(self.ALLOWED_EXTENSIONS)}"
             )
         
-        # Verificar tamanho (se possível)
-        if hasattr(file.file, 'seek') and hasattr(file.file, 'tell'):
-            file.file.seek(0, 2)  # Ir para o final
-            size = file.file.tell()
-            file.file.seek(0)  # Voltar ao início
-            
-            if size > self.MAX_FILE_SIZE:
+        # Ler em blocos direto para um único buffer (sem lista de blocos + join),
+        # interrompendo assim que o tamanho máximo for excedido
+        content = bytearray()
+        while True:
+            chunk = await file.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            if len(content) + len(chunk) > self.MAX_FILE_SIZE:
                 raise HTTPException(
-                    status_code=400,
+                    status_code=413,
                     detail=f"Arquivo muito grande. Máximo: {self.MAX_FILE_SIZE / 1024 / 1024}MB"
                 )
+            content += chunk
+        
+        # Verificar assinatura do conteúdo em vez de confiar apenas na extensão
+        if not self._has_image_signature(content):
+            raise HTTPException(
+                status_code=400,
+                detail="Conteúdo do arquivo não corresponde a uma imagem JPG, PNG ou WEBP"
+            )
+        
+        return content
     
-    def _generate_filename(self, original_filename: str) -> str:
+    def _has_image_signature(self, content: bytes) -> bool:
+        """Verificar os bytes iniciais (magic numbers) dos formatos permitidos"""
+        if content.startswith(b"\xff\xd8\xff"):
+            return True
+        if content.startswith(b"\x89PNG\r\n\x1a\n"):
+            return True
+        return content[:4] == b"RIFF" and content[8:12] == b"WEBP"
+    
+    def _get_file_extension(self, filename: str) -> str:
+        """Obter a extensão do arquivo em minúsculas"""
+        return os.path.splitext(filename)[1].lower()
+    
+    def _generate_filename(self, file_ext: str) -> str:
         """Gerar nome único para o arquivo"""
-        file_ext = Path(original_filename).suffix.lower()
-        unique_id = str(uuid.uuid4())
+        unique_id = secrets.token_hex(16)
         return f"{unique_id}{file_ext}"
     
-    def _create_thumbnail(self, image_path: str, thumbnail_path: str) -> None:
-        """Criar thumbnail da imagem"""
-        try:
-            with Image.open(image_path) as img:
-                # Converter para RGB se necessário
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-                
-                # Redimensionar mantendo proporção
-                img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
-        except Exception as e:
-            print(f"Erro ao criar thumbnail: {e}")
-            # Se falhar, não é crítico - continuar sem thumbnail
-    
-    def upload_images(self, vehicle_type: str, vehicle_id: int, files: List[UploadFile]) -> List[ImageUploadResponse]:
+    async def upload_images(self, vehicle_type: str, vehicle_id: int, files: List[UploadFile]) -> List[ImageUploadResponse]:
         """Upload de múltiplas imagens para um veículo"""
         # Verificar se veículo não excederá o limite
-        current_count = self.vehicle_image_repository.count_by_vehicle_id(vehicle_id)
+        current_count = await self.vehicle_image_repository.count_by_vehicle_id(vehicle_id)
         total_after_upload = current_count + len(files)
         
         if total_after_upload > self.MAX_IMAGES_PER_VEHICLE:
@@ -94,91 +173,103 @@ class VehicleImageService:
         
         # Criar diretório do veículo
         vehicle_dir = self._get_vehicle_directory(vehicle_type, vehicle_id)
-        Path(vehicle_dir).mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(vehicle_dir)
         
         # Criar diretório de thumbnails do veículo
         thumbnail_dir = f"{self.THUMBNAIL_DIR}/{vehicle_type}/{vehicle_id}"
-        Path(thumbnail_dir).mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(thumbnail_dir)
         
-        uploaded_images = []
+        # Ler e validar todos os arquivos antes de gravar qualquer um em disco
+        file_exts = [self._get_file_extension(file.filename) for file in files]
+        contents = [
+            await self._read_validated_file(file, file_ext)
+            for file, file_ext in zip(files, file_exts)
+        ]
         
-        for i, file in enumerate(files):
-            # Validar arquivo
-            self._validate_file(file)
-            
+        # Preparar nomes e caminhos dos arquivos
+        saved_files = []
+        for file_ext, content in zip(file_exts, contents):
             # Gerar nome único
-            filename = self._generate_filename(file.filename)
+            filename = self._generate_filename(file_ext)
             
             # Caminhos dos arquivos
             image_path = f"{vehicle_dir}/{filename}"
             thumbnail_filename = f"thumb_{filename}"
             thumbnail_path = f"{thumbnail_dir}/{thumbnail_filename}"
             
-            # Salvar arquivo original
-            with open(image_path, "wb") as buffer:
-                content = file.file.read()
-                buffer.write(content)
-            
-            # Criar thumbnail
-            self._create_thumbnail(image_path, thumbnail_path)
-            
-            # Calcular posição
-            position = current_count + i + 1
-            
-            # Primeira imagem é primary por padrão se não houver outras
-            is_primary = (current_count == 0 and i == 0)
-            
-            # Salvar no banco
-            vehicle_image = VehicleImage(
+            saved_files.append((filename, image_path, thumbnail_path, content))
+        
+        # Gravar os originais (threads) e criar os thumbnails (processos) em paralelo,
+        # decodificando os bytes em memória
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(None, _write_file, image_path, content)
+                for _, image_path, _, content in saved_files
+            ],
+            *[
+                self._create_thumbnail_safe(content, thumbnail_path)
+                for _, _, thumbnail_path, content in saved_files
+            ]
+        )
+        
+        # Montar os registros; posição e principal derivam da ordem de envio
+        vehicle_images = [
+            VehicleImage(
                 vehicle_id=vehicle_id,
                 filename=filename,
                 path=image_path,
                 thumbnail_path=thumbnail_path,
-                position=position,
-                is_primary=is_primary
+                position=current_count + i + 1,
+                # Primeira imagem é primary por padrão se não houver outras
+                is_primary=(current_count == 0 and i == 0)
             )
-            
-            saved_image = self.vehicle_image_repository.create(vehicle_image)
-            
-            # Gerar URL para resposta
-            url = f"/static/uploads/{vehicle_type}/{vehicle_id}/{filename}"
-            
-            uploaded_images.append(ImageUploadResponse(
+            for i, (filename, image_path, thumbnail_path, _) in enumerate(saved_files)
+        ]
+        
+        # Salvar no banco em uma única transação
+        saved_images = await self.vehicle_image_repository.create_many(vehicle_images)
+        
+        # Gerar URLs para resposta
+        url_prefix = f"/static/uploads/{vehicle_type}/{vehicle_id}/"
+        uploaded_images = [
+            ImageUploadResponse(
                 id=saved_image.id,
-                filename=filename,
-                url=url,
-                position=position,
-                is_primary=is_primary,
+                filename=saved_image.filename,
+                url=url_prefix + saved_image.filename,
+                position=saved_image.position,
+                is_primary=saved_image.is_primary,
                 message="Upload realizado com sucesso"
-            ))
+            )
+            for saved_image in saved_images
+        ]
         
         return uploaded_images
     
-    def get_vehicle_images(self, vehicle_id: int, vehicle_type: str) -> VehicleImagesResponse:
+    async def get_vehicle_images(self, vehicle_id: int, vehicle_type: str) -> VehicleImagesResponse:
         """Obter todas as imagens de um veículo"""
-        images = self.vehicle_image_repository.find_by_vehicle_id(vehicle_id)
+        images = await self.vehicle_image_repository.find_by_vehicle_id(vehicle_id)
         
-        image_responses = []
-        for image in images:
-            # Gerar URLs
-            url = f"/static/uploads/{vehicle_type}/{vehicle_id}/{image.filename}"
-            thumbnail_url = None
-            if image.thumbnail_path:
-                thumb_filename = f"thumb_{image.filename}"
-                thumbnail_url = f"/static/uploads/thumbnails/{vehicle_type}/{vehicle_id}/{thumb_filename}"
-            
-            image_responses.append(VehicleImageResponse(
+        # Prefixos das URLs são os mesmos para todas as imagens do veículo
+        url_prefix = f"/static/uploads/{vehicle_type}/{vehicle_id}/"
+        thumb_prefix = f"/static/uploads/thumbnails/{vehicle_type}/{vehicle_id}/thumb_"
+        
+        # Dados vêm do banco já tipados: model_construct evita revalidar cada campo
+        image_responses = [
+            VehicleImageResponse.model_construct(
                 id=image.id,
                 vehicle_id=image.vehicle_id,
                 filename=image.filename,
                 path=image.path,
-                url=url,
+                url=url_prefix + image.filename,
                 thumbnail_path=image.thumbnail_path,
-                thumbnail_url=thumbnail_url,
+                thumbnail_url=thumb_prefix + image.filename if image.thumbnail_path else None,
                 position=image.position,
-                is_primary=image.is_primary,
+                is_primary=bool(image.is_primary),
                 uploaded_at=image.uploaded_at
-            ))
+            )
+            for image in images
+        ]
         
         return VehicleImagesResponse(
             vehicle_id=vehicle_id,
@@ -186,15 +277,19 @@ class VehicleImageService:
             total_images=len(image_responses)
         )
     
-    def delete_image(self, image_id: int) -> bool:
+    async def delete_image(self, image_id: int) -> bool:
         """Deletar uma imagem e reordenar automaticamente"""
         # Buscar imagem
-        image = self.vehicle_image_repository.find_by_id(image_id)
+        image = await self.vehicle_image_repository.find_by_id(image_id)
         if not image:
             raise HTTPException(status_code=404, detail="Imagem não encontrada")
         
+        # Carregar as imagens do veículo uma única vez: serve para a contagem
+        # e para a reordenação após a exclusão
+        vehicle_images = await self.vehicle_image_repository.find_by_vehicle_id(image.vehicle_id)
+        
         # Verificar se não é a última imagem
-        current_count = self.vehicle_image_repository.count_by_vehicle_id(image.vehicle_id)
+        current_count = len(vehicle_images)
         if current_count <= self.MIN_IMAGES_PER_VEHICLE:
             raise HTTPException(
                 status_code=400,
@@ -202,74 +297,65 @@ class VehicleImageService:
             )
         
         # Guardar informações antes da exclusão
-        deleted_position = image.position
         deleted_was_primary = image.is_primary
         vehicle_id = image.vehicle_id
         
-        # Deletar arquivos físicos
-        try:
-            if os.path.exists(image.path):
-                os.remove(image.path)
-            if image.thumbnail_path and os.path.exists(image.thumbnail_path):
-                os.remove(image.thumbnail_path)
-        except Exception as e:
-            print(f"Erro ao deletar arquivos: {e}")
+        # Deletar arquivos físicos (arquivo já ausente não é erro)
+        for file_path in (image.path, image.thumbnail_path):
+            if not file_path:
+                continue
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Erro ao deletar arquivo %s: %s", file_path, e)
         
         # Deletar do banco
-        success = self.vehicle_image_repository.delete_by_id(image_id)
+        success = await self.vehicle_image_repository.delete_by_id(image_id)
         
         if success:
             # Reordenar imagens automaticamente
-            self._reorder_after_deletion(vehicle_id, deleted_position, deleted_was_primary)
+            remaining_images = [img for img in vehicle_images if img.id != image_id]
+            await self._reorder_after_deletion(vehicle_id, remaining_images, deleted_was_primary)
         
         return success
     
-    def _reorder_after_deletion(self, vehicle_id: int, deleted_position: int, deleted_was_primary: bool):
+    async def _reorder_after_deletion(self, vehicle_id: int, remaining_images: List[VehicleImageSummary], deleted_was_primary: bool):
         """Reordenar imagens após exclusão"""
-        # Buscar todas as imagens restantes
-        remaining_images = self.vehicle_image_repository.find_by_vehicle_id(vehicle_id)
-        
         # Reordenar posições para preencher lacunas
-        reorder_updates = []
-        new_position = 1
-        
-        for img in remaining_images:
-            if img.position != new_position:
-                reorder_updates.append((img.id, new_position))
-            new_position += 1
+        reorder_updates = [
+            (img.id, new_position)
+            for new_position, img in enumerate(remaining_images, start=1)
+            if img.position != new_position
+        ]
         
         # Aplicar reordenação se necessário
         if reorder_updates:
-            self.vehicle_image_repository.update_positions(vehicle_id, reorder_updates)
+            await self.vehicle_image_repository.update_positions(vehicle_id, reorder_updates)
         
         # Se a imagem deletada era principal, definir nova principal
         if deleted_was_primary and remaining_images:
-            # A nova primeira imagem (posição 1) será a principal
-            first_image = min(remaining_images, key=lambda x: x.position)
-            self.vehicle_image_repository.set_primary_image(vehicle_id, first_image.id)
+            # A nova primeira imagem (posição 1) será a principal; a lista já vem ordenada por posição
+            first_image = remaining_images[0]
+            await self.vehicle_image_repository.set_primary_image(vehicle_id, first_image.id)
     
-    def set_primary_image(self, vehicle_id: int, image_id: int) -> bool:
+    async def set_primary_image(self, vehicle_id: int, image_id: int) -> bool:
         """Definir imagem como principal"""
-        return self.vehicle_image_repository.set_primary_image(vehicle_id, image_id)
+        return await self.vehicle_image_repository.set_primary_image(vehicle_id, image_id)
     
-    def reorder_images(self, vehicle_id: int, image_positions: List) -> bool:
+    async def reorder_images(self, vehicle_id: int, image_positions: List[ImagePositionItem]) -> bool:
         """Reordenar imagens"""
-        # Converter de ImagePositionItem para tuplas
-        positions_tuples = []
-        for item in image_positions:
-            if hasattr(item, 'image_id') and hasattr(item, 'position'):
-                # É um ImagePositionItem
-                positions_tuples.append((item.image_id, item.position))
-            else:
-                # É uma tupla já
-                positions_tuples.append(item)
-        
-        # Validar posições
-        for _, position in positions_tuples:
-            if position < 1 or position > self.MAX_IMAGES_PER_VEHICLE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Posição deve estar entre 1 e {self.MAX_IMAGES_PER_VEHICLE}"
-                )
+        # Validar e converter para tuplas em uma única passada
+        positions_tuples = [
+            (item.image_id, item.position)
+            for item in image_positions
+            if 1 <= item.position <= self.MAX_IMAGES_PER_VEHICLE
+        ]
+        if len(positions_tuples) != len(image_positions):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Posição deve estar entre 1 e {self.MAX_IMAGES_PER_VEHICLE}"
+            )
         
-        return self.vehicle_image_repository.update_positions(vehicle_id, positions_tuples)
+        return await self.vehicle_image_repository.update_positions(vehicle_id, positions_tuples)
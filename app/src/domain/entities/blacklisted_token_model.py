@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, TIMESTAMP, func, BIGINT
+from sqlalchemy import String, TIMESTAMP, func, BIGINT
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
 from datetime import datetime
 from typing import Optional
@@ -9,13 +10,14 @@ class BlacklistedToken(Base):
     Entidade BlacklistedToken que representa tokens invalidados (logout).
     """
     __tablename__ = 'blacklisted_tokens'
+    _REPR = "<BlacklistedToken(jti=%r, user_id=%s)>"
 
-    id = Column(BIGINT, primary_key=True, autoincrement=True)
-    jti = Column(String(255), nullable=False, unique=True, index=True)  # JWT ID
-    token = Column(String(1000), nullable=False)  # Token completo (para referência)
-    user_id = Column(BIGINT, nullable=False, index=True)
-    blacklisted_at = Column(TIMESTAMP, default=func.current_timestamp())
-    expires_at = Column(TIMESTAMP, nullable=False)  # Quando o token expira naturalmente
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
+    jti: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)  # JWT ID
+    token: Mapped[str] = mapped_column(String(1000), nullable=False)  # Token completo (para referência)
+    user_id: Mapped[int] = mapped_column(BIGINT, nullable=False, index=True)
+    blacklisted_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)  # Quando o token expira naturalmente
 
     def __init__(self, jti: str, token: str, user_id: int, expires_at: datetime):
         self.jti = jti
@@ -42,4 +44,4 @@ class BlacklistedToken(Base):
         )
 
     def __repr__(self):
-        return f"<BlacklistedToken(jti='{self.jti}', user_id={self.user_id})>"
+        return self._REPR % (self.jti, self.user_id)
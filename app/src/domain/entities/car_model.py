@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, TIMESTAMP, func, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.src.infrastructure.driven.database.connection_mysql import Base
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 from typing import Optional
+from decimal import Decimal
+from datetime import datetime
 
 
 class Car(Base):
@@ -11,23 +13,24 @@ class Car(Base):
     Representa a tabela cars no banco de dados.
     """
     __tablename__ = 'cars'
+    _REPR = "<Car(vehicle_id=%s, bodywork=%r, transmission=%r)>"
 
-    vehicle_id = Column(Integer, ForeignKey('motor_vehicles.id', ondelete='CASCADE'), primary_key=True)
-    bodywork = Column(String(20), nullable=False)
-    transmission = Column(String(20), nullable=False)
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    vehicle_id: Mapped[int] = mapped_column(Integer, ForeignKey('motor_vehicles.id', ondelete='CASCADE'), primary_key=True)
+    bodywork: Mapped[str] = mapped_column(String(20), nullable=False)
+    transmission: Mapped[str] = mapped_column(String(20), nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
-    # Relacionamento com MotorVehicle
-    motor_vehicle = relationship("MotorVehicle", backref="car", uselist=False)
+    # Relacionamento com MotorVehicle (lazy="raise": o carregamento deve ser explícito via selectinload)
+    motor_vehicle: Mapped["MotorVehicle"] = relationship("MotorVehicle", backref="car", uselist=False, lazy="raise")
 
-    def __init__(self, vehicle_id: int, bodywork: str, transmission: str):
+    def __init__(self, vehicle_id: Optional[int], bodywork: str, transmission: str):
         self.vehicle_id = vehicle_id
         self.bodywork = bodywork
         self.transmission = transmission
 
     @classmethod
-    def create_with_motor_vehicle(cls, model: str, year: str, mileage: int, fuel_type: str,
-                                  color: str, city: str, price: int, bodywork: str, transmission: str,
+    def create_with_motor_vehicle(cls, model: str, year: int, mileage: int, fuel_type: str,
+                                  color: str, city: str, price: Decimal, bodywork: str, transmission: str,
                                   additional_description: Optional[str] = None):
         """
         Método de classe para criar um carro com seu veículo base.
@@ -41,11 +44,11 @@ class Car(Base):
             city=city,
             price=price,
             additional_description=additional_description,
-            status="Ativo"  # Definindo status como "Ativo" para carros
+            status=MotorVehicle.STATUS_ATIVO  # Definindo status como "Ativo" para carros
         )
         
         car = cls(
-            vehicle_id=0,  # Será definido após a inserção do motor_vehicle
+            vehicle_id=None,  # Definido pelo repositório com o ID gerado para o motor_vehicle
             bodywork=bodywork,
             transmission=transmission
         )
@@ -53,4 +56,4 @@ class Car(Base):
         return motor_vehicle, car
 
     def __repr__(self):
-        return f"<Car(vehicle_id={self.vehicle_id}, bodywork='{self.bodywork}', transmission='{self.transmission}')>"
+        return self._REPR % (self.vehicle_id, self.bodywork, self.transmission)
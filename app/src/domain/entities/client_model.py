@@ -1,35 +1,20 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, TIMESTAMP, func, Index, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
-from typing import Optional
+from typing import NamedTuple, Optional
+from datetime import datetime
 
 
-class Address(Base):
+class ClientSummary(NamedTuple):
     """
-    Entidade Address que representa a tabela addresses no banco de dados.
+    Resumo somente leitura do cliente nas listagens (mesmos campos, na mesma ordem, de Client.list_columns()).
     """
-    __tablename__ = 'addresses'
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    street = Column(String(100), nullable=True)
-    city = Column(String(100), nullable=True)
-    state = Column(String(100), nullable=True)
-    zip_code = Column(String(20), nullable=True)
-    country = Column(String(100), nullable=True)
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
-
-    def __init__(self, street: Optional[str] = None, city: Optional[str] = None, 
-                 state: Optional[str] = None, zip_code: Optional[str] = None, 
-                 country: Optional[str] = None):
-        self.street = street
-        self.city = city
-        self.state = state
-        self.zip_code = zip_code
-        self.country = country
-
-    def __repr__(self):
-        return f"<Address(id={self.id}, street='{self.street}', city='{self.city}')>"
+    id: int
+    name: str
+    email: str
+    phone: Optional[str]
+    cpf: str
+    city: Optional[str]
 
 
 class Client(Base):
@@ -37,26 +22,40 @@ class Client(Base):
     Entidade Client que representa a tabela clients no banco de dados.
     """
     __tablename__ = 'clients'
+    __table_args__ = (
+        Index('ix_clients_email', 'email', unique=True),
+        Index('ix_clients_cpf', 'cpf', unique=True),
+        # Formato validado pelo banco: CPF com ou sem máscara e email com "@"
+        CheckConstraint("cpf REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'", name='ck_clients_cpf'),
+        CheckConstraint("email LIKE '%_@_%'", name='ck_clients_email'),
+        # Busca parcial por nome (MATCH ... AGAINST) sem varrer a tabela
+        Index('ft_clients_name', 'name', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
+    _REPR = "<Client(id=%s, name=%r, email=%r)>"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(100), nullable=False)
-    email = Column(String(100), nullable=False)
-    phone = Column(String(50), nullable=True)
-    cpf = Column(String(14), nullable=False)
-    address_id = Column(Integer, ForeignKey('addresses.id', ondelete='SET NULL'), nullable=True)
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
-
-    # Relacionamento com Address
-    address = relationship("Address", backref="clients", uselist=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    cpf: Mapped[str] = mapped_column(String(14), nullable=False)
+    # Endereço armazenado na própria tabela (relação 1:1, dispensa JOIN)
+    street: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    city: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    state: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    zip_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
-    def __init__(self, name: str, email: str, cpf: str, phone: Optional[str] = None, 
-                 address_id: Optional[int] = None):
+    def __init__(self, name: str, email: str, cpf: str, phone: Optional[str] = None,
+                 street: Optional[str] = None, city: Optional[str] = None,
+                 state: Optional[str] = None, zip_code: Optional[str] = None,
+                 country: Optional[str] = None):
         self.name = name
         self.email = email
         self.phone = phone
         self.cpf = cpf
-        self.address_id = address_id
+        self.set_address(street, city, state, zip_code, country)
 
     @classmethod
     def create_with_address(cls, name: str, email: str, cpf: str, phone: Optional[str] = None,
@@ -66,25 +65,42 @@ class Client(Base):
         """
         Método de classe para criar um cliente com endereço.
         """
-        address = None
-        if any([street, city, state, zip_code, country]):
-            address = Address(
-                street=street,
-                city=city,
-                state=state,
-                zip_code=zip_code,
-                country=country
-            )
-        
-        client = cls(
+        return cls(
             name=name,
             email=email,
             cpf=cpf,
             phone=phone,
-            address_id=0  # Será definido após a inserção do address
+            street=street,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            country=country
         )
-        
-        return address, client
+
+    def set_address(self, street: Optional[str] = None, city: Optional[str] = None,
+                    state: Optional[str] = None, zip_code: Optional[str] = None,
+                    country: Optional[str] = None):
+        """
+        Define todos os campos de endereço do cliente.
+        """
+        self.street = street
+        self.city = city
+        self.state = state
+        self.zip_code = zip_code
+        self.country = country
+
+    @classmethod
+    def list_columns(cls) -> tuple:
+        """
+        Colunas usadas nas listagens (mesmos campos de ClientListResponse).
+        """
+        return (cls.id, cls.name, cls.email, cls.phone, cls.cpf, cls.city)
+
+    def has_address(self) -> bool:
+        """
+        Indica se algum campo de endereço está preenchido.
+        """
+        return bool(self.street or self.city or self.state or self.zip_code or self.country)
 
     def update_fields(self, name: Optional[str] = None, email: Optional[str] = None,
                      phone: Optional[str] = None, cpf: Optional[str] = None):
@@ -101,4 +117,4 @@ class Client(Base):
             self.cpf = cpf
 
     def __repr__(self):
-        return f"<Client(id={self.id}, name='{self.name}', email='{self.email}')>"
+        return self._REPR % (self.id, self.name, self.email)
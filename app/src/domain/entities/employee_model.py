@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, TIMESTAMP, func, Index, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
 from typing import Optional
+from datetime import datetime
+import sys
 
 
 class Employee(Base):
@@ -9,28 +11,49 @@ class Employee(Base):
     Entidade Employee que representa a tabela employees no banco de dados.
     """
     __tablename__ = 'employees'
+    __table_args__ = (
+        Index('ix_employees_email', 'email', unique=True),
+        Index('ix_employees_cpf', 'cpf', unique=True),
+        # Formato validado pelo banco: CPF com ou sem máscara e email com "@"
+        CheckConstraint("cpf REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'", name='ck_employees_cpf'),
+        CheckConstraint("email LIKE '%_@_%'", name='ck_employees_email'),
+        Index('ix_employees_status', 'status'),
+        # Busca parcial por nome (MATCH ... AGAINST) sem varrer a tabela
+        Index('ft_employees_name', 'name', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
+    _REPR = "<Employee(id=%s, name=%r, email=%r, status=%r)>"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(100), nullable=False)
-    email = Column(String(100), nullable=False)
-    phone = Column(String(50), nullable=True)
-    cpf = Column(String(14), nullable=False)
-    status = Column(String(50), nullable=False)
-    address_id = Column(Integer, ForeignKey('addresses.id', ondelete='SET NULL'), nullable=True)
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    # Status possíveis para funcionários (internados: um único objeto por status no processo)
+    STATUS_ATIVO = sys.intern("Ativo")
+    STATUS_INATIVO = sys.intern("Inativo")
 
-    # Relacionamento com Address (importando da entidade client_model)
-    address = relationship("Address", backref="employees", uselist=False)
+    VALID_STATUSES = frozenset((STATUS_ATIVO, STATUS_INATIVO))
 
-    def __init__(self, name: str, email: str, cpf: str, phone: Optional[str] = None, 
-                 status: str = "Ativo", address_id: Optional[int] = None):
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    cpf: Mapped[str] = mapped_column(String(14), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Endereço armazenado na própria tabela (relação 1:1, dispensa JOIN)
+    street: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    city: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    state: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    zip_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    def __init__(self, name: str, email: str, cpf: str, phone: Optional[str] = None,
+                 status: str = STATUS_ATIVO, street: Optional[str] = None,
+                 city: Optional[str] = None, state: Optional[str] = None,
+                 zip_code: Optional[str] = None, country: Optional[str] = None):
         self.name = name
         self.email = email
         self.phone = phone
         self.cpf = cpf
         self.status = status
-        self.address_id = address_id
+        self.set_address(street, city, state, zip_code, country)
 
     @classmethod
     def create_with_address(cls, name: str, email: str, cpf: str, phone: Optional[str] = None,
@@ -40,28 +63,36 @@ class Employee(Base):
         """
         Método de classe para criar um funcionário com endereço.
         """
-        from app.src.domain.entities.client_model import Address
-        
-        address = None
-        if any([street, city, state, zip_code, country]):
-            address = Address(
-                street=street,
-                city=city,
-                state=state,
-                zip_code=zip_code,
-                country=country
-            )
-        
-        employee = cls(
+        return cls(
             name=name,
             email=email,
             cpf=cpf,
             phone=phone,
-            status="Ativo",  # Status padrão sempre "Ativo"
-            address_id=0  # Será definido após a inserção do address
+            status=cls.STATUS_ATIVO,  # Status padrão sempre "Ativo"
+            street=street,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            country=country
         )
-        
-        return address, employee
+
+    def set_address(self, street: Optional[str] = None, city: Optional[str] = None,
+                    state: Optional[str] = None, zip_code: Optional[str] = None,
+                    country: Optional[str] = None):
+        """
+        Define todos os campos de endereço do funcionário.
+        """
+        self.street = street
+        self.city = city
+        self.state = state
+        self.zip_code = zip_code
+        self.country = country
+
+    def has_address(self) -> bool:
+        """
+        Indica se algum campo de endereço está preenchido.
+        """
+        return bool(self.street or self.city or self.state or self.zip_code or self.country)
 
     def update_fields(self, name: Optional[str] = None, email: Optional[str] = None,
                      phone: Optional[str] = None, cpf: Optional[str] = None,
@@ -84,13 +115,13 @@ class Employee(Base):
         """
         Ativa o funcionário.
         """
-        self.status = "Ativo"
+        self.status = self.STATUS_ATIVO
 
     def deactivate(self):
         """
         Desativa o funcionário.
         """
-        self.status = "Inativo"
+        self.status = self.STATUS_INATIVO
 
     def __repr__(self):
-        return f"<Employee(id={self.id}, name='{self.name}', email='{self.email}', status='{self.status}')>"
+        return self._REPR % (self.id, self.name, self.email, self.status)
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, BigInteger, String, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import BigInteger, String, Text, TIMESTAMP, ForeignKey, text, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
-from datetime import datetime
 from enum import Enum
+from typing import Optional
+from datetime import datetime
 
 class MessageStatus(str, Enum):
     PENDING = "Pendente"
@@ -11,18 +13,25 @@ class MessageStatus(str, Enum):
 
 class Message(Base):
     __tablename__ = "messages"
+    _REPR = "<Message(id=%s, name=%r, status=%r)>"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    responsible_id = Column(BigInteger, ForeignKey("employees.id"), nullable=True)
-    vehicle_id = Column(BigInteger, ForeignKey("motor_vehicles.id"), nullable=True)
-    name = Column(String(100), nullable=False)
-    email = Column(String(100), nullable=False)
-    phone = Column(String(50), nullable=True)
-    message = Column(Text, nullable=False)
-    status = Column(String(50), nullable=False, default=MessageStatus.PENDING.value)
-    service_start_time = Column(TIMESTAMP, nullable=True)
-    created_at = Column(TIMESTAMP, default=datetime.utcnow)
-    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    responsible_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("employees.id"), nullable=True)
+    vehicle_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey("motor_vehicles.id"), nullable=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    # ENUM nativo do MySQL (armazenado como inteiro de 1 byte); valores continuam sendo strings no Python
+    status: Mapped[str] = mapped_column(
+        SQLEnum(*[status.value for status in MessageStatus], name="message_status"),
+        nullable=False,
+        default=MessageStatus.PENDING.value
+    )
+    service_start_time: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, nullable=True)
+    # Timestamps preenchidos pelo MySQL (DEFAULT / ON UPDATE CURRENT_TIMESTAMP)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), server_onupdate=text("CURRENT_TIMESTAMP"))
 
     def __repr__(self):
-        return f"<Message(id={self.id}, name='{self.name}', status='{self.status}')>"
+        return self._REPR % (self.id, self.name, self.status)
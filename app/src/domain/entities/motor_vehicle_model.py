@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, func, DECIMAL
+from sqlalchemy import Integer, SmallInteger, String, TIMESTAMP, func, DECIMAL, Index, CheckConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
+import sys
 
 
 class MotorVehicle(Base):
@@ -11,36 +13,42 @@ class MotorVehicle(Base):
     Representa a tabela motor_vehicles no banco de dados.
     """
     __tablename__ = 'motor_vehicles'
+    __table_args__ = (
+        # Filtro por status + faixa/ordenação de preço resolvidos com um range scan no índice
+        Index('ix_mv_status_price', 'status', 'price'),
+        # Preço positivo garantido pelo banco (e validado na borda pelos DTOs)
+        CheckConstraint('price > 0', name='ck_mv_price_positive'),
+    )
+    _REPR = "<MotorVehicle(id=%s, model=%r, year=%s)>"
 
-    # Status possíveis para veículos
-    STATUS_ATIVO = "Ativo"
-    STATUS_INATIVO = "Inativo"
-    STATUS_VENDIDO = "Vendido"
-    STATUS_RESERVADO = "Reservado"
-    STATUS_MANUTENCAO = "Em Manutenção"
+    # Status possíveis para veículos (internados: um único objeto por status no processo)
+    STATUS_ATIVO = sys.intern("Ativo")
+    STATUS_INATIVO = sys.intern("Inativo")
+    STATUS_VENDIDO = sys.intern("Vendido")
+    STATUS_RESERVADO = sys.intern("Reservado")
+    STATUS_MANUTENCAO = sys.intern("Em Manutenção")
     
     VALID_STATUSES = [STATUS_ATIVO, STATUS_INATIVO, STATUS_VENDIDO, STATUS_RESERVADO, STATUS_MANUTENCAO]
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    model = Column(String(100), nullable=False)
-    year = Column(String(20), nullable=False)
-    mileage = Column(Integer, nullable=False)
-    fuel_type = Column(String(20), nullable=False)
-    color = Column(String(50), nullable=False)
-    city = Column(String(100), nullable=False)
-    additional_description = Column(Text, nullable=True)
-    price = Column(DECIMAL(12, 2), nullable=False)
-    status = Column(String(50), nullable=False, default=STATUS_ATIVO)
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    year: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mileage: Mapped[int] = mapped_column(Integer, nullable=False)
+    fuel_type: Mapped[str] = mapped_column(String(15), nullable=False)
+    color: Mapped[str] = mapped_column(String(30), nullable=False)
+    city: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Coluna larga e adiada: só entra no SELECT quando a consulta pede undefer (respostas da API)
+    additional_description: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True, deferred=True)
+    price: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default=STATUS_ATIVO)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
-    def __init__(self, model: str, year: str, mileage: int, fuel_type: str, 
+    def __init__(self, model: str, year: int, mileage: int, fuel_type: str, 
                  color: str, city: str, price: Decimal, additional_description: Optional[str] = None, 
                  status: str = STATUS_ATIVO, id: Optional[int] = None):
         if id is not None:
             self.id = id
-        if price <= 0:
-            raise ValueError("Price deve ser maior que zero")
         self.model = model
         self.year = year
         self.mileage = mileage
@@ -52,4 +60,4 @@ class MotorVehicle(Base):
         self.status = status
 
     def __repr__(self):
-        return f"<MotorVehicle(id={self.id}, model='{self.model}', year='{self.year}')>"
+        return self._REPR % (self.id, self.model, self.year)
@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func, ForeignKey, SmallInteger
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, TIMESTAMP, func, ForeignKey, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.src.infrastructure.driven.database.connection_mysql import Base
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 from typing import Optional
+from decimal import Decimal
+from datetime import datetime
 
 
 class Motorcycle(Base):
@@ -11,22 +13,23 @@ class Motorcycle(Base):
     Representa a tabela motorcycles no banco de dados.
     """
     __tablename__ = 'motorcycles'
+    _REPR = "<Motorcycle(vehicle_id=%s, starter=%r, engine_displacement=%s)>"
 
-    vehicle_id = Column(Integer, ForeignKey('motor_vehicles.id', ondelete='CASCADE'), primary_key=True)
-    starter = Column(String(50), nullable=False)
-    fuel_system = Column(String(50), nullable=False)
-    engine_displacement = Column(Integer, nullable=False)
-    cooling = Column(String(50), nullable=False)
-    style = Column(String(50), nullable=False)
-    engine_type = Column(String(50), nullable=False)
-    gears = Column(SmallInteger, nullable=False)
-    front_rear_brake = Column(String(100), nullable=False)
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    vehicle_id: Mapped[int] = mapped_column(Integer, ForeignKey('motor_vehicles.id', ondelete='CASCADE'), primary_key=True)
+    starter: Mapped[str] = mapped_column(String(50), nullable=False)
+    fuel_system: Mapped[str] = mapped_column(String(50), nullable=False)
+    engine_displacement: Mapped[int] = mapped_column(Integer, nullable=False)
+    cooling: Mapped[str] = mapped_column(String(50), nullable=False)
+    style: Mapped[str] = mapped_column(String(50), nullable=False)
+    engine_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    gears: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    front_rear_brake: Mapped[str] = mapped_column(String(100), nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
-    # Relacionamento com MotorVehicle
-    motor_vehicle = relationship("MotorVehicle", backref="motorcycle", uselist=False)
+    # Relacionamento com MotorVehicle (lazy="raise": o carregamento deve ser explícito via selectinload)
+    motor_vehicle: Mapped["MotorVehicle"] = relationship("MotorVehicle", backref="motorcycle", uselist=False, lazy="raise")
 
-    def __init__(self, vehicle_id: int, starter: str, fuel_system: str, engine_displacement: int,
+    def __init__(self, vehicle_id: Optional[int], starter: str, fuel_system: str, engine_displacement: int,
                  cooling: str, style: str, engine_type: str, gears: int, front_rear_brake: str):
         self.vehicle_id = vehicle_id
         self.starter = starter
@@ -39,8 +42,8 @@ class Motorcycle(Base):
         self.front_rear_brake = front_rear_brake
 
     @classmethod
-    def create_with_motor_vehicle(cls, model: str, year: str, mileage: int, fuel_type: str,
-                                  color: str, city: str, price: int, starter: str, fuel_system: str,
+    def create_with_motor_vehicle(cls, model: str, year: int, mileage: int, fuel_type: str,
+                                  color: str, city: str, price: Decimal, starter: str, fuel_system: str,
                                   engine_displacement: int, cooling: str, style: str, engine_type: str,
                                   gears: int, front_rear_brake: str, additional_description: Optional[str] = None):
         """
@@ -55,11 +58,11 @@ class Motorcycle(Base):
             city=city,
             price=price,
             additional_description=additional_description,
-            status="Ativo"  # Definindo status como "Ativo" para motos
+            status=MotorVehicle.STATUS_ATIVO  # Definindo status como "Ativo" para motos
         )
         
         motorcycle = cls(
-            vehicle_id=0,  # Será definido após a inserção do motor_vehicle
+            vehicle_id=None,  # Definido pelo repositório com o ID gerado para o motor_vehicle
             starter=starter,
             fuel_system=fuel_system,
             engine_displacement=engine_displacement,
@@ -73,4 +76,4 @@ class Motorcycle(Base):
         return motor_vehicle, motorcycle
 
     def __repr__(self):
-        return f"<Motorcycle(vehicle_id={self.vehicle_id}, starter='{self.starter}', engine_displacement={self.engine_displacement})>"
+        return self._REPR % (self.vehicle_id, self.starter, self.engine_displacement)
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, DATE, TEXT, TIMESTAMP, func, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Integer, String, DECIMAL, DATE, TEXT, TIMESTAMP, func, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.src.infrastructure.driven.database.connection_mysql import Base
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from decimal import Decimal
-from datetime import date
+from datetime import date, datetime
+
+if TYPE_CHECKING:
+    from app.src.domain.entities.client_model import Client
+    from app.src.domain.entities.employee_model import Employee
+    from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 
 
 class Sale(Base):
@@ -11,6 +16,7 @@ class Sale(Base):
     Entidade Sale que representa a tabela sales no banco de dados.
     """
     __tablename__ = 'sales'
+    _REPR = "<Sale(id=%s, client_id=%s, total=%s, status=%r)>"
 
     # Status possíveis para vendas
     STATUS_PENDENTE = "Pendente"
@@ -34,26 +40,26 @@ class Sale(Base):
         PAYMENT_FINANCIAMENTO, PAYMENT_CONSORCIO, PAYMENT_PIX
     ]
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    client_id = Column(Integer, ForeignKey('clients.id', ondelete='RESTRICT'), nullable=False)
-    employee_id = Column(Integer, ForeignKey('employees.id', ondelete='RESTRICT'), nullable=False)
-    vehicle_id = Column(Integer, ForeignKey('motor_vehicles.id', ondelete='RESTRICT'), nullable=False)
-    total_amount = Column(DECIMAL(12, 2), nullable=False)
-    payment_method = Column(String(50), nullable=False)
-    status = Column(String(50), nullable=False, default=STATUS_PENDENTE)
-    sale_date = Column(DATE, nullable=False)
-    notes = Column(TEXT, nullable=True)
-    discount_amount = Column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
-    tax_amount = Column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
-    commission_rate = Column(DECIMAL(5, 2), nullable=False, default=Decimal('0.00'))
-    commission_amount = Column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    client_id: Mapped[int] = mapped_column(Integer, ForeignKey('clients.id', ondelete='RESTRICT'), nullable=False)
+    employee_id: Mapped[int] = mapped_column(Integer, ForeignKey('employees.id', ondelete='RESTRICT'), nullable=False)
+    vehicle_id: Mapped[int] = mapped_column(Integer, ForeignKey('motor_vehicles.id', ondelete='RESTRICT'), nullable=False)
+    total_amount: Mapped[Decimal] = mapped_column(DECIMAL(12, 2), nullable=False)
+    payment_method: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default=STATUS_PENDENTE)
+    sale_date: Mapped[date] = mapped_column(DATE, nullable=False)
+    notes: Mapped[Optional[str]] = mapped_column(TEXT, nullable=True)
+    discount_amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
+    tax_amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
+    commission_rate: Mapped[Decimal] = mapped_column(DECIMAL(5, 2), nullable=False, default=Decimal('0.00'))
+    commission_amount: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), nullable=False, default=Decimal('0.00'))
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relacionamentos
-    client = relationship("Client", backref="sales", uselist=False)
-    employee = relationship("Employee", backref="sales", uselist=False)
-    vehicle = relationship("MotorVehicle", backref="sales", uselist=False)
+    client: Mapped["Client"] = relationship("Client", backref="sales", uselist=False)
+    employee: Mapped["Employee"] = relationship("Employee", backref="sales", uselist=False)
+    vehicle: Mapped["MotorVehicle"] = relationship("MotorVehicle", backref="sales", uselist=False)
 
     def __init__(self, client_id: int, employee_id: int, vehicle_id: int, total_amount: Decimal,
                  payment_method: str, sale_date: date, status: str = STATUS_PENDENTE,
@@ -184,4 +190,4 @@ class Sale(Base):
         return payment_method in cls.VALID_PAYMENT_METHODS
 
     def __repr__(self):
-        return f"<Sale(id={self.id}, client_id={self.client_id}, total={self.total_amount}, status='{self.status}')>"
+        return self._REPR % (self.id, self.client_id, self.total_amount, self.status)
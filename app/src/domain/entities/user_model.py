@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func, ForeignKey, BIGINT
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, TIMESTAMP, func, ForeignKey, BIGINT, Enum
+from sqlalchemy.orm import Mapped, mapped_column, relationship, reconstructor, validates
+from sqlalchemy.orm.attributes import set_committed_value
 from app.src.infrastructure.driven.database.connection_mysql import Base
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from datetime import datetime
+import sys
+
+if TYPE_CHECKING:
+    from app.src.domain.entities.employee_model import Employee
 
 
 class User(Base):
@@ -10,23 +15,24 @@ class User(Base):
     Entidade User que representa a tabela users no banco de dados.
     """
     __tablename__ = 'users'
+    _REPR = "<User(id=%s, email=%r, role=%r)>"
 
-    # Roles possíveis para usuários
-    ROLE_VENDEDOR = "Vendedor"
-    ROLE_ADMINISTRADOR = "Administrador"
+    # Roles possíveis para usuários (internadas para comparação por identidade)
+    ROLE_VENDEDOR = sys.intern("Vendedor")
+    ROLE_ADMINISTRADOR = sys.intern("Administrador")
     
-    VALID_ROLES = [ROLE_VENDEDOR, ROLE_ADMINISTRADOR]
+    VALID_ROLES = frozenset({ROLE_VENDEDOR, ROLE_ADMINISTRADOR})
 
-    id = Column(BIGINT, primary_key=True, autoincrement=True)
-    email = Column(String(100), nullable=False, unique=True)
-    password = Column(String(255), nullable=False)  # Hash da senha
-    role = Column(String(50), nullable=False)
-    employee_id = Column(BIGINT, ForeignKey('employees.id', ondelete='SET NULL'), nullable=True)
-    created_at = Column(TIMESTAMP, default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
+    id: Mapped[int] = mapped_column(BIGINT, primary_key=True, autoincrement=True)
+    email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    password: Mapped[str] = mapped_column(String(255), nullable=False)  # Hash da senha
+    role: Mapped[str] = mapped_column(Enum(ROLE_VENDEDOR, ROLE_ADMINISTRADOR, name="user_role"), nullable=False)
+    employee_id: Mapped[Optional[int]] = mapped_column(BIGINT, ForeignKey('employees.id', ondelete='SET NULL'), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP, default=func.current_timestamp(), onupdate=func.current_timestamp())
 
-    # Relacionamentos
-    employee = relationship("Employee", backref="user", uselist=False)
+    # Relacionamentos (lazy="raise": o carregamento deve ser explícito via selectinload)
+    employee: Mapped["Employee"] = relationship("Employee", backref="user", uselist=False, lazy="raise")
 
     def __init__(self, email: str, password: str, role: str, employee_id: Optional[int] = None):
         self.email = email
@@ -34,6 +40,17 @@ class User(Base):
         self.role = role
         self.employee_id = employee_id
 
+    @validates('role')
+    def _intern_assigned_role(self, key, role):
+        """Interna a role atribuída, para que a comparação com as constantes seja por identidade"""
+        return sys.intern(role) if role is not None else role
+
+    @reconstructor
+    def _intern_loaded_role(self):
+        """Interna a role carregada do banco sem marcar o objeto como modificado"""
+        if self.role is not None:
+            set_committed_value(self, 'role', sys.intern(self.role))
+
     @classmethod
     def create_user(cls, email: str, password_hash: str, role: str, employee_id: Optional[int] = None):
         """
@@ -46,7 +63,7 @@ class User(Base):
             employee_id: ID do funcionário associado (opcional)
         """
         if role not in cls.VALID_ROLES:
-            raise ValueError(f"Role inválida. Deve ser uma de: {', '.join(cls.VALID_ROLES)}")
+            raise ValueError(f"Role inválida. Deve ser uma de: {cls.ROLE_VENDEDOR}, {cls.ROLE_ADMINISTRADOR}")
         
         return cls(
             email=email,
@@ -55,10 +72,10 @@ class User(Base):
             employee_id=employee_id
         )
 
-    @classmethod
-    def is_valid_role(cls, role: str) -> bool:
+    @staticmethod
+    def is_valid_role(role: str) -> bool:
         """Verifica se a role é válida"""
-        return role in cls.VALID_ROLES
+        return role in User.VALID_ROLES
 
     def is_admin(self) -> bool:
         """Verifica se o usuário é administrador"""
@@ -69,4 +86,4 @@ class User(Base):
         return self.role == self.ROLE_VENDEDOR
 
     def __repr__(self):
-        return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
+        return self._REPR % (self.id, self.email, self.role)
@@ -1,19 +1,44 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, SMALLINT, DATETIME, ForeignKey
+from sqlalchemy import BigInteger, String, Boolean, SMALLINT, DATETIME, ForeignKey, Index, Computed, text
+from sqlalchemy.orm import Mapped, mapped_column
 from app.src.infrastructure.driven.database.connection_mysql import Base
+from typing import NamedTuple, Optional
 from datetime import datetime
-from typing import Optional
+
+class VehicleImageSummary(NamedTuple):
+    """
+    Imagem de veículo somente leitura para galerias (mesmos campos, na mesma ordem, de VehicleImage.summary_columns()).
+    """
+    id: int
+    vehicle_id: int
+    filename: str
+    path: str
+    thumbnail_path: Optional[str]
+    position: int
+    is_primary: Optional[bool]
+    uploaded_at: Optional[datetime]
 
 class VehicleImage(Base):
     __tablename__ = "vehicle_images"
+    __table_args__ = (
+        # Busca da imagem principal de um veículo com um único seek
+        Index('ix_vi_vehicle_primary', 'vehicle_id', 'is_primary', 'position'),
+        # No máximo uma imagem principal por veículo (MySQL não tem índice parcial;
+        # a coluna gerada é NULL para as demais imagens e NULLs não conflitam no UNIQUE)
+        Index('uq_primary_per_vehicle', 'primary_vehicle_id', unique=True),
+    )
+    _REPR = "<VehicleImage(id=%s, vehicle_id=%s, position=%s)>"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    vehicle_id = Column(BigInteger, ForeignKey("motor_vehicles.id"), nullable=False)
-    filename = Column(String(255), nullable=False)
-    path = Column(String(500), nullable=False)
-    thumbnail_path = Column(String(500), nullable=True)
-    position = Column(SMALLINT, nullable=False)
-    is_primary = Column(Boolean, default=False)
-    uploaded_at = Column(DATETIME, default=datetime.utcnow)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    vehicle_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("motor_vehicles.id"), nullable=False)
+    filename: Mapped[str] = mapped_column(String(128), nullable=False)
+    path: Mapped[str] = mapped_column(String(255), nullable=False)
+    thumbnail_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    position: Mapped[int] = mapped_column(SMALLINT, nullable=False)
+    is_primary: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    primary_vehicle_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, Computed("IF(is_primary, vehicle_id, NULL)", persisted=False)
+    )
+    uploaded_at: Mapped[Optional[datetime]] = mapped_column(DATETIME, server_default=text("CURRENT_TIMESTAMP"))  # Preenchido pelo MySQL
 
     def __init__(self, vehicle_id: int, filename: str, path: str, position: int,
                  thumbnail_path: Optional[str] = None, is_primary: bool = False):
@@ -24,5 +49,11 @@ class VehicleImage(Base):
         self.position = position
         self.is_primary = is_primary
 
+    @classmethod
+    def summary_columns(cls) -> tuple:
+        """Colunas lidas nas galerias (campos de VehicleImageSummary)"""
+        return (cls.id, cls.vehicle_id, cls.filename, cls.path, cls.thumbnail_path,
+                cls.position, cls.is_primary, cls.uploaded_at)
+
     def __repr__(self):
-        return f"<VehicleImage(id={self.id}, vehicle_id={self.vehicle_id}, position={self.position})>"
+        return self._REPR % (self.id, self.vehicle_id, self.position)
@@ -0,0 +1,40 @@
+"""
+Exceções da aplicação.
+
+Erros esperados (ex.: credenciais inválidas) são convertidos em respostas HTTP
+por handlers globais registrados em app/main.py, sem try/except em cada rota.
+"""
+
+
+class AppError(Exception):
+    """
+    Base para erros esperados da aplicação.
+    """
+
+
+class AuthenticationError(AppError, ValueError):
+    """
+    Credenciais ou token inválidos (resposta 401).
+    Herda de ValueError para continuar compatível com os tratamentos existentes.
+    """
+
+
+class NotFoundError(AppError, ValueError):
+    """
+    Recurso solicitado não existe (resposta 404).
+    Herda de ValueError para continuar compatível com os tratamentos existentes.
+    """
+
+
+class BusinessRuleError(AppError, ValueError):
+    """
+    Dados violam uma regra de negócio (resposta 400).
+    Herda de ValueError para continuar compatível com os tratamentos existentes.
+    """
+
+
+class ConflictError(AppError, ValueError):
+    """
+    Operação conflita com o estado atual do recurso (resposta 409).
+    Herda de ValueError para continuar compatível com os tratamentos existentes.
+    """
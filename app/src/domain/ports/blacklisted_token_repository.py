@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List
 from app.src.domain.entities.blacklisted_token_model import BlacklistedToken
 
 
@@ -35,6 +35,16 @@ class BlacklistedTokenRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_active_blacklisted_jtis(self) -> List[str]:
+        """
+        Lista os JTIs dos tokens blacklisted que ainda não expiraram.
+        
+        Returns:
+            List[str]: JTIs ativos na blacklist
+        """
+        pass
+
     @abstractmethod
     async def get_blacklisted_token_by_jti(self, jti: str) -> Optional[BlacklistedToken]:
         """
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
-from app.src.domain.entities.client_model import Client, Address
+from app.src.domain.entities.client_model import Client, ClientSummary
 
 
 class ClientRepositoryInterface(ABC):
@@ -10,12 +10,11 @@ class ClientRepositoryInterface(ABC):
     """
     
     @abstractmethod
-    async def create_client(self, address: Optional[Address], client: Client) -> Client:
+    async def create_client(self, client: Client) -> Client:
         """
         Cria um novo cliente no banco de dados.
         
         Args:
-            address: Dados do endereço (opcional)
             client: Dados do cliente
             
         Returns:
@@ -31,6 +30,9 @@ class ClientRepositoryInterface(ABC):
         """
         Busca um cliente pelo ID.
         
+        Implementações podem servir a busca de um cache em memória, desde que
+        update_client e delete_client o invalidem.
+        
         Args:
             client_id: ID do cliente
             
@@ -40,13 +42,12 @@ class ClientRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def update_client(self, client_id: int, address: Optional[Address], client: Client) -> Optional[Client]:
+    async def update_client(self, client_id: int, client: Client) -> Optional[Client]:
         """
         Atualiza um cliente existente.
         
         Args:
             client_id: ID do cliente
-            address: Dados atualizados do endereço (opcional)
             client: Dados atualizados do cliente
             
         Returns:
@@ -74,7 +75,7 @@ class ClientRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[Client]:
+    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[ClientSummary]:
         """
         Busca todos os clientes com paginação.
         
@@ -83,7 +84,24 @@ class ClientRepositoryInterface(ABC):
             limit: Número máximo de registros para retornar
             
         Returns:
-            List[Client]: Lista de clientes encontrados
+            List[ClientSummary]: Resumos dos clientes para a listagem
+        """
+        pass
+    
+    @abstractmethod
+    async def get_clients_after(self, cursor_id: int, limit: int = 100) -> List[ClientSummary]:
+        """
+        Busca a próxima página de clientes a partir de um cursor (id > cursor_id), ordenada por id.
+        
+        Alternativa ao skip/limit para páginas profundas: percorre um intervalo
+        da PRIMARY KEY(id) em vez de descartar skip linhas com OFFSET.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[ClientSummary]: Resumos dos clientes para a listagem
         """
         pass
     
@@ -114,16 +132,19 @@ class ClientRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def search_clients_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
+    async def search_clients_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[ClientSummary]:
         """
         Busca clientes por nome (busca parcial).
         
+        A implementação deve usar o índice FULLTEXT ngram ft_clients_name
+        (MATCH ... AGAINST), evitando LIKE '%nome%' sobre a tabela inteira.
+        
         Args:
             name: Nome ou parte do nome para buscar
             skip: Número de registros para pular
             limit: Número máximo de registros para retornar
             
         Returns:
-            List[Client]: Lista de clientes encontrados
+            List[ClientSummary]: Resumos dos clientes para a listagem
         """
         pass
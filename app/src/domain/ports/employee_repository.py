@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from app.src.domain.entities.employee_model import Employee
-from app.src.domain.entities.client_model import Address
 
 
 class EmployeeRepositoryInterface(ABC):
@@ -11,12 +10,11 @@ class EmployeeRepositoryInterface(ABC):
     """
     
     @abstractmethod
-    async def create_employee(self, address: Optional[Address], employee: Employee) -> Employee:
+    async def create_employee(self, employee: Employee) -> Employee:
         """
         Cria um novo funcionário no banco de dados.
         
         Args:
-            address: Dados do endereço (opcional)
             employee: Dados do funcionário
             
         Returns:
@@ -27,11 +25,30 @@ class EmployeeRepositoryInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    async def create_employees(self, employees: List[Employee]) -> List[Employee]:
+        """
+        Cria vários funcionários em uma única transação (importações/cargas em lote).
+        
+        Args:
+            employees: Funcionários a serem criados (endereço já embutido em cada um)
+            
+        Returns:
+            List[Employee]: Os funcionários criados com IDs gerados, na mesma ordem recebida
+            
+        Raises:
+            Exception: Se houver erro na criação
+        """
+        pass
+    
     @abstractmethod
     async def get_employee_by_id(self, employee_id: int) -> Optional[Employee]:
         """
         Busca um funcionário pelo ID.
         
+        Implementações podem servir a busca de um cache em memória, desde que
+        update_employee, update_employee_status e delete_employee o invalidem.
+        
         Args:
             employee_id: ID do funcionário
             
@@ -41,13 +58,12 @@ class EmployeeRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def update_employee(self, employee_id: int, address: Optional[Address], employee: Employee) -> Optional[Employee]:
+    async def update_employee(self, employee_id: int, employee: Employee) -> Optional[Employee]:
         """
         Atualiza um funcionário existente.
         
         Args:
             employee_id: ID do funcionário
-            address: Dados atualizados do endereço (opcional)
             employee: Dados atualizados do funcionário
             
         Returns:
@@ -88,6 +104,23 @@ class EmployeeRepositoryInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_employees_after(self, cursor_id: int, limit: int = 100) -> List[Employee]:
+        """
+        Busca a próxima página de funcionários a partir de um cursor (id > cursor_id), ordenada por id.
+        
+        Alternativa ao skip/limit para páginas profundas: percorre um intervalo
+        da PRIMARY KEY(id) em vez de descartar skip linhas com OFFSET.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[Employee]: Lista de funcionários encontrados
+        """
+        pass
+    
     @abstractmethod
     async def get_employee_by_email(self, email: str) -> Optional[Employee]:
         """
@@ -119,6 +152,9 @@ class EmployeeRepositoryInterface(ABC):
         """
         Busca funcionários por nome (busca parcial).
         
+        A implementação deve usar o índice FULLTEXT ngram ft_employees_name
+        (MATCH ... AGAINST), evitando LIKE '%nome%' sobre a tabela inteira.
+        
         Args:
             name: Nome ou parte do nome para buscar
             skip: Número de registros para pular
@@ -132,7 +168,10 @@ class EmployeeRepositoryInterface(ABC):
     @abstractmethod
     async def get_employees_by_status(self, status: str, skip: int = 0, limit: int = 100) -> List[Employee]:
         """
-        Busca funcionários por status.
+        Busca funcionários por status, ordenados por id.
+        
+        Índice esperado: ix_employees_status (status), que no InnoDB
+        já inclui a PK (status, id) e atende filtro e ordenação.
         
         Args:
             status: Status dos funcionários (Ativo/Inativo)
@@ -1,21 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from app.src.domain.entities.message_model import Message
 
 class MessageRepository(ABC):
     
     @abstractmethod
-    def create(self, message: Message) -> Message:
+    async def create(self, message: Message) -> Message:
         """Criar uma nova mensagem"""
         pass
     
     @abstractmethod
-    def find_by_id(self, message_id: int) -> Optional[Message]:
+    async def find_by_id(self, message_id: int) -> Optional[Message]:
         """Buscar mensagem por ID"""
         pass
     
     @abstractmethod
-    def find_all_with_filters(
+    async def find_all_with_filters(
         self, 
         status: Optional[str] = None,
         responsible_id: Optional[int] = None,
@@ -27,22 +27,22 @@ class MessageRepository(ABC):
         pass
     
     @abstractmethod
-    def update(self, message: Message) -> Message:
+    async def update(self, message: Message) -> Message:
         """Atualizar uma mensagem"""
         pass
     
     @abstractmethod
-    def update_by_id(self, message_id: int, updates: Dict[str, Any]) -> Message:
+    async def update_by_id(self, message_id: int, updates: Dict[str, Any]) -> Message:
         """Atualizar uma mensagem por ID com campos específicos"""
         pass
     
     @abstractmethod
-    def delete(self, message_id: int) -> bool:
+    async def delete(self, message_id: int) -> bool:
         """Deletar uma mensagem"""
         pass
     
     @abstractmethod
-    def count_with_filters(
+    async def count_with_filters(
         self,
         status: Optional[str] = None,
         responsible_id: Optional[int] = None,
@@ -50,3 +50,27 @@ class MessageRepository(ABC):
     ) -> int:
         """Contar mensagens com filtros"""
         pass
+    
+    @abstractmethod
+    async def find_page_with_filters(
+        self,
+        status: Optional[str] = None,
+        responsible_id: Optional[int] = None,
+        vehicle_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[Message], int]:
+        """Buscar uma página de mensagens com filtros (mais recentes primeiro, por id) e o total de registros filtrados"""
+        pass
+    
+    @abstractmethod
+    async def find_before_id_with_filters(
+        self,
+        before_id: Optional[int] = None,
+        status: Optional[str] = None,
+        responsible_id: Optional[int] = None,
+        vehicle_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Message]:
+        """Buscar a próxima página de mensagens por cursor (id < before_id), mais recentes primeiro"""
+        pass
@@ -76,6 +76,9 @@ class MotorcycleRepositoryInterface(ABC):
         """
         Busca todas as motocicletas com filtros opcionais.
         
+        Índice esperado: ix_mv_status_price (status, price) em motor_vehicles,
+        que resolve o filtro por status com faixa/ordenação de preço em um range scan.
+        
         Args:
             skip: Número de registros para pular
             limit: Número máximo de registros para retornar
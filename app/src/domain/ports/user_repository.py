@@ -30,6 +30,10 @@ class UserRepositoryInterface(ABC):
         """
         Busca um usuário pelo ID.
         
+        Consultada em praticamente toda requisição autenticada: implementações
+        podem servir a busca de um cache em memória, desde que update_user e
+        delete_user o invalidem.
+        
         Args:
             user_id: ID do usuário
             
@@ -43,6 +47,8 @@ class UserRepositoryInterface(ABC):
         """
         Busca um usuário pelo email.
         
+        Pode ser servida do mesmo cache de get_user_by_id (mesmas regras de invalidação).
+        
         Args:
             email: Email do usuário
             
@@ -1,45 +1,55 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.src.domain.entities.vehicle_image_model import VehicleImage
+from typing import Dict, List, Optional
+from app.src.domain.entities.vehicle_image_model import VehicleImage, VehicleImageSummary
 
 class VehicleImageRepository(ABC):
     
     @abstractmethod
-    def create(self, vehicle_image: VehicleImage) -> VehicleImage:
+    async def create(self, vehicle_image: VehicleImage) -> VehicleImage:
         """Criar uma nova imagem de veículo"""
         pass
     
     @abstractmethod
-    def find_by_vehicle_id(self, vehicle_id: int) -> List[VehicleImage]:
-        """Buscar todas as imagens de um veículo ordenadas por position"""
+    async def create_many(self, vehicle_images: List[VehicleImage]) -> List[VehicleImage]:
+        """Criar várias imagens de veículo em uma única transação"""
         pass
     
     @abstractmethod
-    def find_by_id(self, image_id: int) -> Optional[VehicleImage]:
+    async def find_by_vehicle_id(self, vehicle_id: int) -> List[VehicleImageSummary]:
+        """Buscar todas as imagens de um veículo ordenadas por position (resumos somente leitura)"""
+        pass
+    
+    @abstractmethod
+    async def find_by_vehicle_ids(self, vehicle_ids: List[int]) -> Dict[int, List[VehicleImageSummary]]:
+        """Buscar as imagens de vários veículos em uma consulta, agrupadas por vehicle_id e ordenadas por position"""
+        pass
+    
+    @abstractmethod
+    async def find_by_id(self, image_id: int) -> Optional[VehicleImage]:
         """Buscar imagem por ID"""
         pass
     
     @abstractmethod
-    def count_by_vehicle_id(self, vehicle_id: int) -> int:
+    async def count_by_vehicle_id(self, vehicle_id: int) -> int:
         """Contar quantas imagens um veículo possui"""
         pass
     
     @abstractmethod
-    def delete_by_id(self, image_id: int) -> bool:
+    async def delete_by_id(self, image_id: int) -> bool:
         """Deletar uma imagem por ID"""
         pass
     
     @abstractmethod
-    def delete_by_vehicle_id(self, vehicle_id: int) -> bool:
+    async def delete_by_vehicle_id(self, vehicle_id: int) -> bool:
         """Deletar todas as imagens de um veículo"""
         pass
     
     @abstractmethod
-    def update_positions(self, vehicle_id: int, positions: List[tuple]) -> bool:
+    async def update_positions(self, vehicle_id: int, positions: List[tuple]) -> bool:
         """Atualizar posições das imagens: [(image_id, new_position), ...]"""
         pass
     
     @abstractmethod
-    def set_primary_image(self, vehicle_id: int, image_id: int) -> bool:
+    async def set_primary_image(self, vehicle_id: int, image_id: int) -> bool:
         """Definir uma imagem como principal"""
         pass
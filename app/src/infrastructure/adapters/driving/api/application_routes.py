@@ -1,4 +1,7 @@
+from collections import Counter
+from typing import Iterable
 from fastapi import APIRouter
+from starlette.routing import BaseRoute
 from app.src.infrastructure.adapters.driving.api.car_routes import router as car_router
 from app.src.infrastructure.adapters.driving.api.motorcycle_routes import router as motorcycle_router
 from app.src.infrastructure.adapters.driving.api.client_routes import router as client_router
@@ -10,33 +13,42 @@ from app.src.infrastructure.adapters.driving.api.auth_routes import auth_router,
 
 router = APIRouter()
 
-# Incluir as rotas de autenticação
-router.include_router(auth_router)
-router.include_router(users_router)
-
-# Incluir as rotas de carros
-router.include_router(car_router)
-
-# Incluir as rotas de motos
-router.include_router(motorcycle_router)
-
-# Incluir as rotas de clientes
-router.include_router(client_router)
-
-# Incluir as rotas de funcionários
-router.include_router(employee_router)
-
-# Incluir as rotas de vendas
-router.include_router(sale_router)
-
-# Incluir as rotas de mensagens
-router.include_router(message_router)
-
-# Incluir as rotas de imagens de veículos
-router.include_router(vehicle_image_router)
-router.include_router(vehicle_image_router)
+# Sub-routers na ordem de registro
+_ROUTERS = (
+    auth_router,            # Autenticação
+    users_router,           # Usuários
+    car_router,             # Carros
+    motorcycle_router,      # Motos
+    client_router,          # Clientes
+    employee_router,        # Funcionários
+    sale_router,            # Vendas
+    message_router,         # Mensagens
+    vehicle_image_router,   # Imagens de veículos
+)
+
+for sub_router in _ROUTERS:
+    router.include_router(sub_router)
 
 # Rota de Health Check
 @router.get("/health_check")
 async def health_check():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+def ensure_unique_routes(routes: Iterable[BaseRoute]) -> None:
+    """
+    Garante que cada rota (caminho + métodos) foi registrada uma única vez.
+    Chamada no startup da aplicação; um sub-router incluído duas vezes dobraria
+    as entradas percorridas pelo matcher a cada requisição.
+
+    Raises:
+        RuntimeError: Se houver rotas duplicadas
+    """
+    registrations = Counter(
+        (route.path, frozenset(getattr(route, "methods", None) or ()))
+        for route in routes
+        if hasattr(route, "path")
+    )
+    duplicated = sorted(path for (path, _), count in registrations.items() if count > 1)
+    if duplicated:
+        raise RuntimeError(f"Rotas duplicadas registradas na aplicação: {', '.join(duplicated)}")
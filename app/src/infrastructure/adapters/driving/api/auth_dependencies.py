@@ -1,6 +1,7 @@
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
+import re
 from app.src.application.services.user_service import UserService
 from app.src.application.dtos.user_dto import UserResponseDto
 from app.src.infrastructure.driven.persistence.user_repository_impl import UserRepositoryImpl
@@ -9,6 +10,10 @@ from app.src.infrastructure.driven.persistence.blacklisted_token_repository_impl
 # Configuração do bearer token
 security = HTTPBearer()
 
+# Formato de um JWT (header.payload.assinatura em base64url): tokens malformados
+# são rejeitados antes de qualquer decodificação ou consulta
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+
 # Instância dos serviços
 user_repository = UserRepositoryImpl()
 blacklisted_token_repository = BlacklistedTokenRepositoryImpl()
@@ -25,8 +30,11 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    token = credentials.credentials
+    if not _TOKEN_RE.fullmatch(token):
+        raise credentials_exception
+    
     try:
-        token = credentials.credentials
         user = await user_service.get_current_user(token)
         if user is None:
             raise credentials_exception
@@ -35,10 +43,13 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         raise credentials_exception
 
 
-async def get_current_admin_user(current_user: UserResponseDto = Depends(get_current_user)) -> UserResponseDto:
+# As dependências de perfil recebem as credenciais direto e chamam get_current_user
+# como função: um nível a menos no grafo que o FastAPI resolve a cada requisição
+async def get_current_admin_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserResponseDto:
     """
     Dependency para verificar se o usuário atual é administrador.
     """
+    current_user = await get_current_user(credentials)
     if not user_service.verify_admin_role(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -47,10 +58,11 @@ async def get_current_admin_user(current_user: UserResponseDto = Depends(get_cur
     return current_user
 
 
-async def get_current_vendedor_user(current_user: UserResponseDto = Depends(get_current_user)) -> UserResponseDto:
+async def get_current_vendedor_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserResponseDto:
     """
     Dependency para verificar se o usuário atual é vendedor.
     """
+    current_user = await get_current_user(credentials)
     if not user_service.verify_vendedor_role(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -59,10 +71,11 @@ async def get_current_vendedor_user(current_user: UserResponseDto = Depends(get_
     return current_user
 
 
-async def get_current_admin_or_vendedor_user(current_user: UserResponseDto = Depends(get_current_user)) -> UserResponseDto:
+async def get_current_admin_or_vendedor_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserResponseDto:
     """
     Dependency para verificar se o usuário atual é administrador ou vendedor.
     """
+    current_user = await get_current_user(credentials)
     if not (user_service.verify_admin_role(current_user) or user_service.verify_vendedor_role(current_user)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -80,8 +93,11 @@ async def get_current_user_optional(credentials: Optional[HTTPAuthorizationCrede
     if not credentials:
         return None
     
+    token = credentials.credentials
+    if not _TOKEN_RE.fullmatch(token):
+        return None
+    
     try:
-        token = credentials.credentials
         user = await user_service.get_current_user(token)
         return user
     except Exception:
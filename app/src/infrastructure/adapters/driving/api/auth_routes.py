@@ -1,14 +1,12 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.src.application.services.user_service import UserService
+from fastapi.security import HTTPAuthorizationCredentials
 from app.src.application.dtos.user_dto import (
     UserCreateDto, UserUpdateDto, UserResponseDto, 
     LoginDto, TokenDto
 )
-from app.src.infrastructure.driven.persistence.user_repository_impl import UserRepositoryImpl
-from app.src.infrastructure.driven.persistence.blacklisted_token_repository_impl import BlacklistedTokenRepositoryImpl
 from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
-    get_current_user, get_current_admin_user
+    get_current_user, get_current_admin_user,
+    security, user_service  # Instâncias compartilhadas com as dependências de autenticação
 )
 
 # Router para autenticação
@@ -17,35 +15,15 @@ auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 # Router para usuários (operações CRUD)
 users_router = APIRouter(prefix="/users", tags=["Users"])
 
-# Configuração do bearer token
-security = HTTPBearer()
-
-# Instância dos serviços
-user_repository = UserRepositoryImpl()
-blacklisted_token_repository = BlacklistedTokenRepositoryImpl()
-user_service = UserService(user_repository, blacklisted_token_repository)
-
 
 @auth_router.post("/login", response_model=TokenDto)
 async def login(login_data: LoginDto):
     """
     Endpoint para autenticação de usuários.
     Retorna um token JWT válido por 30 minutos.
+    Credenciais inválidas (AuthenticationError) viram 401 no handler global.
     """
-    try:
-        token = await user_service.login(login_data)
-        return token
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
-        )
+    return await user_service.login(login_data)
 
 
 @auth_router.get("/me", response_model=UserResponseDto)
@@ -61,30 +39,17 @@ async def logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """
     Endpoint para logout (invalidação de token).
     Adiciona o token atual à blacklist, invalidando-o.
+    Token inválido (AuthenticationError) vira 401 no handler global.
     """
-    try:
-        token = credentials.credentials
-        success = await user_service.logout(token)
-        
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Falha ao realizar logout"
-            )
-        
-        return {"message": "Logout realizado com sucesso"}
-        
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except Exception as e:
+    success = await user_service.logout(credentials.credentials)
+    
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            detail="Falha ao realizar logout"
         )
+    
+    return {"message": "Logout realizado com sucesso"}
 
 
 @users_router.post("/", response_model=UserResponseDto, status_code=status.HTTP_201_CREATED)
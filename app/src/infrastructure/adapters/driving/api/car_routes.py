@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends, Query
+from typing import Literal, Optional
 from app.src.application.services.car_service import CarService
 from app.src.application.dtos.car_dto import CreateCarRequest, CarResponse, CarsListResponse
 from app.src.application.dtos.user_dto import UserResponseDto
@@ -7,20 +7,23 @@ from app.src.infrastructure.driven.persistence.car_repository_impl import CarRep
 from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
     get_current_admin_or_vendedor_user
 )
+from app.src.infrastructure.adapters.driving.api.model_response import ModelJSONResponse, conditional_model_response
 from decimal import Decimal
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Criar instâncias dos serviços
+car_repository = CarRepository()
+car_service = CarService(car_repository)
+
 router = APIRouter(prefix="/cars", tags=["Cars"])
 
 
-def get_car_service() -> CarService:
+async def get_car_service() -> CarService:
     """
     Dependency injection para o serviço de carros.
     """
-    car_repository = CarRepository()
-    car_service = CarService(car_repository)
     return car_service
 
 
@@ -46,34 +49,21 @@ async def create_car(
     Raises:
         HTTPException: 400 se dados inválidos, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para criar carro: {request.model}")
-        
-        car_response = await service.create_car(request)
-        
-        logger.info(f"Carro criado com sucesso via API. ID: {car_response.id}")
-        return car_response
-        
-    except ValueError as e:
-        logger.warning(f"Dados inválidos para criação de carro: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Dados inválidos: {str(e)}"
-        )
-    except Exception as e:
-        logger.error(f"Erro interno ao criar carro via API: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
-        )
+    logger.info("Recebida requisição para criar carro: %s", request.model)
+    
+    car_response = await service.create_car(request)
+    
+    logger.info("Carro criado com sucesso via API. ID: %s", car_response.id)
+    return ModelJSONResponse(car_response, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/", response_model=CarsListResponse)
 async def get_cars(
+    request: Request,
     skip: int = Query(0, ge=0, description="Número de registros para pular"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros para retornar"),
-    order_by_price: Optional[str] = Query(None, regex="^(asc|desc)$", description="Ordenação por preço: 'asc' ou 'desc'"),
-    status: Optional[str] = Query(None, description="Status dos carros para filtrar"),
+    order_by_price: Optional[Literal["asc", "desc"]] = Query(None, description="Ordenação por preço: 'asc' ou 'desc'"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Status dos carros para filtrar"),
     min_price: Optional[Decimal] = Query(None, ge=0, description="Preço mínimo para filtrar"),
     max_price: Optional[Decimal] = Query(None, ge=0, description="Preço máximo para filtrar"),
     service: CarService = Depends(get_car_service)
@@ -82,60 +72,47 @@ async def get_cars(
     Lista carros com filtros opcionais.
     
     Args:
+        request: Requisição HTTP (cabeçalho If-None-Match)
         skip: Número de registros para pular (paginação)
         limit: Número máximo de registros para retornar
         order_by_price: Ordenação por preço - 'asc' crescente ou 'desc' decrescente
-        status: Status dos carros para filtrar (ex: 'Ativo', 'Inativo')
+        status_filter: Status dos carros para filtrar (ex: 'Ativo', 'Inativo'), parâmetro 'status' na query
         min_price: Preço mínimo para filtrar
         max_price: Preço máximo para filtrar
         service: Serviço de carros (injetado)
         
     Returns:
-        CarsListResponse: Lista de carros com metadados
+        CarsListResponse: Lista de carros com metadados (304 se o ETag não mudou)
         
     Raises:
         HTTPException: 400 se parâmetros inválidos, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para listar carros. Filtros: order_by_price={order_by_price}, status={status}, min_price={min_price}, max_price={max_price}")
-        
-        # Validação do range de preços
-        if min_price is not None and max_price is not None and min_price > max_price:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Preço mínimo não pode ser maior que o preço máximo"
-            )
-        
-        cars_response = await service.get_cars_with_filters(
-            skip=skip,
-            limit=limit,
-            order_by_price=order_by_price,
-            status=status,
-            min_price=min_price,
-            max_price=max_price
-        )
-        
-        logger.info(f"Encontrados {cars_response.total} carros com os filtros aplicados")
-        return cars_response
-        
-    except HTTPException:
-        raise
-    except ValueError as e:
-        logger.error(f"Erro de validação ao listar carros: {str(e)}")
+    logger.info("Recebida requisição para listar carros. Filtros: order_by_price=%s, status=%s, min_price=%s, max_price=%s",
+                order_by_price, status_filter, min_price, max_price)
+    
+    # Validação do range de preços
+    if min_price is not None and max_price is not None and min_price > max_price:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Erro interno ao listar carros via API: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            detail="Preço mínimo não pode ser maior que o preço máximo"
         )
+    
+    cars_response = await service.get_cars_with_filters(
+        skip=skip,
+        limit=limit,
+        order_by_price=order_by_price,
+        status=status_filter,
+        min_price=min_price,
+        max_price=max_price
+    )
+    
+    logger.info("Encontrados %s carros com os filtros aplicados", cars_response.total)
+    return conditional_model_response(request, cars_response)
 
 
 @router.get("/{car_id}", response_model=CarResponse)
 async def get_car(
+    request: Request,
     car_id: int,
     service: CarService = Depends(get_car_service)
 ) -> CarResponse:
@@ -143,37 +120,28 @@ async def get_car(
     Busca um carro pelo ID.
     
     Args:
+        request: Requisição HTTP (cabeçalho If-None-Match)
         car_id: ID do carro
         service: Serviço de carros (injetado)
         
     Returns:
-        CarResponse: Dados do carro encontrado
+        CarResponse: Dados do carro encontrado (304 se o ETag não mudou)
         
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para buscar carro ID: {car_id}")
-        
-        car_response = await service.get_car_by_id(car_id)
-        if not car_response:
-            logger.info(f"Carro não encontrado via API. ID: {car_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Carro não encontrado"
-            )
-        
-        logger.info(f"Carro encontrado via API. ID: {car_id}")
-        return car_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao buscar carro via API. ID {car_id}: {str(e)}")
+    logger.info("Recebida requisição para buscar carro ID: %s", car_id)
+    
+    car_response = await service.get_car_by_id(car_id)
+    if not car_response:
+        logger.info("Carro não encontrado via API. ID: %s", car_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Carro não encontrado"
         )
+    
+    logger.info("Carro encontrado via API. ID: %s", car_id)
+    return conditional_model_response(request, car_response)
 
 
 @router.put("/{car_id}", response_model=CarResponse)
@@ -200,34 +168,18 @@ async def update_car(
     Raises:
         HTTPException: 404 se não encontrado, 400 se dados inválidos, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para atualizar carro ID: {car_id}")
-        
-        car_response = await service.update_car(car_id, request)
-        if not car_response:
-            logger.info(f"Carro não encontrado para atualização via API. ID: {car_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Carro não encontrado"
-            )
-        
-        logger.info(f"Carro atualizado com sucesso via API. ID: {car_id}")
-        return car_response
-        
-    except HTTPException:
-        raise
-    except ValueError as e:
-        logger.warning(f"Dados inválidos para atualização de carro ID {car_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Dados inválidos: {str(e)}"
-        )
-    except Exception as e:
-        logger.error(f"Erro interno ao atualizar carro via API. ID {car_id}: {str(e)}")
+    logger.info("Recebida requisição para atualizar carro ID: %s", car_id)
+    
+    car_response = await service.update_car(car_id, request)
+    if not car_response:
+        logger.info("Carro não encontrado para atualização via API. ID: %s", car_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Carro não encontrado"
         )
+    
+    logger.info("Carro atualizado com sucesso via API. ID: %s", car_id)
+    return ModelJSONResponse(car_response)
 
 
 @router.delete("/{car_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -249,27 +201,18 @@ async def delete_car(
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para remover carro ID: {car_id}")
-        
-        result = await service.delete_car(car_id)
-        if not result:
-            logger.info(f"Carro não encontrado para remoção via API. ID: {car_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Carro não encontrado"
-            )
-        
-        logger.info(f"Carro removido com sucesso via API. ID: {car_id}")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao remover carro via API. ID {car_id}: {str(e)}")
+    logger.info("Recebida requisição para remover carro ID: %s", car_id)
+    
+    result = await service.delete_car(car_id)
+    if not result:
+        logger.info("Carro não encontrado para remoção via API. ID: %s", car_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Carro não encontrado"
         )
+    
+    logger.info("Carro removido com sucesso via API. ID: %s", car_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.patch("/{car_id}/deactivate", response_model=CarResponse)
@@ -294,28 +237,18 @@ async def deactivate_car(
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para desativar carro ID: {car_id}")
-        
-        car_response = await service.inactivate_car(car_id)
-        if not car_response:
-            logger.info(f"Carro não encontrado para desativação via API. ID: {car_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Carro não encontrado"
-            )
-        
-        logger.info(f"Carro desativado com sucesso via API. ID: {car_id}")
-        return car_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao desativar carro via API. ID {car_id}: {str(e)}")
+    logger.info("Recebida requisição para desativar carro ID: %s", car_id)
+    
+    car_response = await service.inactivate_car(car_id)
+    if not car_response:
+        logger.info("Carro não encontrado para desativação via API. ID: %s", car_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Carro não encontrado"
         )
+    
+    logger.info("Carro desativado com sucesso via API. ID: %s", car_id)
+    return ModelJSONResponse(car_response)
 
 
 @router.patch("/{car_id}/activate", response_model=CarResponse)
@@ -340,25 +273,15 @@ async def activate_car(
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para ativar carro ID: {car_id}")
-        
-        car_response = await service.activate_car(car_id)
-        if not car_response:
-            logger.info(f"Carro não encontrado para ativação via API. ID: {car_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Carro não encontrado"
-            )
-        
-        logger.info(f"Carro ativado com sucesso via API. ID: {car_id}")
-        return car_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao ativar carro via API. ID {car_id}: {str(e)}")
+    logger.info("Recebida requisição para ativar carro ID: %s", car_id)
+    
+    car_response = await service.activate_car(car_id)
+    if not car_response:
+        logger.info("Carro não encontrado para ativação via API. ID: %s", car_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Carro não encontrado"
         )
+    
+    logger.info("Carro ativado com sucesso via API. ID: %s", car_id)
+    return ModelJSONResponse(car_response)
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends, Query
 from typing import List, Optional
+from pydantic import TypeAdapter
 from app.src.application.services.client_service import ClientService
 from app.src.application.dtos.client_dto import CreateClientRequest, UpdateClientRequest, ClientResponse, ClientListResponse
 from app.src.application.dtos.user_dto import UserResponseDto
@@ -7,6 +8,7 @@ from app.src.infrastructure.driven.persistence.client_repository_impl import Cli
 from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
     get_current_admin_or_vendedor_user
 )
+from app.src.infrastructure.adapters.driving.api.model_response import conditional_model_response, next_cursor_headers
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,10 +17,13 @@ logger = logging.getLogger(__name__)
 client_repository = ClientRepository()
 client_service = ClientService(client_repository)
 
+# Serializa a lista inteira em uma única passada do pydantic-core, sem revalidar
+_client_list_adapter = TypeAdapter(List[ClientListResponse])
+
 router = APIRouter(prefix="/clients", tags=["Clients"])
 
 
-def get_client_service() -> ClientService:
+async def get_client_service() -> ClientService:
     """
     Dependency injection para o serviço de clientes.
     """
@@ -47,30 +52,17 @@ async def create_client(
     Raises:
         HTTPException: 400 se dados inválidos, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para criar cliente: {request.name}")
-        
-        client_response = await service.create_client(request)
-        
-        logger.info(f"Cliente criado com sucesso via API. ID: {client_response.id}")
-        return client_response
-        
-    except ValueError as e:
-        logger.error(f"Erro de validação ao criar cliente via API: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Erro interno ao criar cliente via API: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
-        )
+    logger.info("Recebida requisição para criar cliente: %s", request.name)
+    
+    client_response = await service.create_client(request)
+    
+    logger.info("Cliente criado com sucesso via API. ID: %s", client_response.id)
+    return client_response
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client_by_id(
+    request: Request,
     client_id: int,
     service: ClientService = Depends(get_client_service),
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
@@ -81,39 +73,30 @@ async def get_client_by_id(
     Requer autenticação: Administrador ou Vendedor
     
     Args:
+        request: Requisição HTTP (cabeçalho If-None-Match)
         client_id: ID do cliente
         service: Serviço de clientes (injetado)
         current_user: Usuário autenticado
         
     Returns:
-        ClientResponse: Dados do cliente
+        ClientResponse: Dados do cliente (304 se o ETag não mudou)
         
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para buscar cliente por ID: {client_id}")
-        
-        client = await service.get_client_by_id(client_id)
-        
-        if not client:
-            logger.warning(f"Cliente não encontrado via API. ID: {client_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cliente com ID {client_id} não encontrado"
-            )
-        
-        logger.info(f"Cliente encontrado via API. ID: {client_id}")
-        return client
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao buscar cliente por ID via API: {e}")
+    logger.info("Recebida requisição para buscar cliente por ID: %s", client_id)
+    
+    client = await service.get_client_by_id(client_id)
+    
+    if not client:
+        logger.warning("Cliente não encontrado via API. ID: %s", client_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cliente com ID {client_id} não encontrado"
         )
+    
+    logger.info("Cliente encontrado via API. ID: %s", client_id)
+    return conditional_model_response(request, client, cache_control="private, no-cache")
 
 
 @router.put("/{client_id}", response_model=ClientResponse)
@@ -140,35 +123,19 @@ async def update_client(
     Raises:
         HTTPException: 404 se não encontrado, 400 se dados inválidos, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para atualizar cliente ID: {client_id}")
-        
-        client = await service.update_client(client_id, request)
-        
-        if not client:
-            logger.warning(f"Cliente não encontrado para atualização via API. ID: {client_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cliente com ID {client_id} não encontrado"
-            )
-        
-        logger.info(f"Cliente atualizado com sucesso via API. ID: {client_id}")
-        return client
-        
-    except ValueError as e:
-        logger.error(f"Erro de validação ao atualizar cliente via API: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao atualizar cliente via API: {e}")
+    logger.info("Recebida requisição para atualizar cliente ID: %s", client_id)
+    
+    client = await service.update_client(client_id, request)
+    
+    if not client:
+        logger.warning("Cliente não encontrado para atualização via API. ID: %s", client_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cliente com ID {client_id} não encontrado"
         )
+    
+    logger.info("Cliente atualizado com sucesso via API. ID: %s", client_id)
+    return client
 
 
 @router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -190,34 +157,25 @@ async def delete_client(
     Raises:
         HTTPException: 404 se não encontrado, 500 se erro interno
     """
-    try:
-        logger.info(f"Recebida requisição para remover cliente ID: {client_id}")
-        
-        success = await service.delete_client(client_id)
-        
-        if not success:
-            logger.warning(f"Cliente não encontrado para remoção via API. ID: {client_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Cliente com ID {client_id} não encontrado"
-            )
-        
-        logger.info(f"Cliente removido com sucesso via API. ID: {client_id}")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao remover cliente via API: {e}")
+    logger.info("Recebida requisição para remover cliente ID: %s", client_id)
+    
+    success = await service.delete_client(client_id)
+    
+    if not success:
+        logger.warning("Cliente não encontrado para remoção via API. ID: %s", client_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Cliente com ID {client_id} não encontrado"
         )
+    
+    logger.info("Cliente removido com sucesso via API. ID: %s", client_id)
 
 
 @router.get("/", response_model=List[ClientListResponse])
 async def get_all_clients(
     skip: int = Query(0, ge=0, description="Número de registros para pular"),
     limit: int = Query(100, ge=1, le=1000, description="Número máximo de registros para retornar"),
+    cursor: Optional[int] = Query(None, ge=0, description="Paginação por cursor: 0 na primeira página, depois o cabeçalho X-Next-Cursor da resposta anterior"),
     name: Optional[str] = Query(None, min_length=1, description="Nome ou parte do nome para filtrar (opcional)"),
     cpf: Optional[str] = Query(None, min_length=11, max_length=14, description="CPF para filtrar (opcional)"),
     service: ClientService = Depends(get_client_service),
@@ -231,6 +189,7 @@ async def get_all_clients(
     Args:
         skip: Número de registros para pular
         limit: Número máximo de registros para retornar
+        cursor: Cursor (0 na primeira página); o próximo vem no cabeçalho X-Next-Cursor
         name: Nome ou parte do nome para filtrar (opcional)
         cpf: CPF para filtrar (opcional)
         service: Serviço de clientes (injetado)
@@ -242,49 +201,41 @@ async def get_all_clients(
     Raises:
         HTTPException: 400 se ambos os filtros forem fornecidos, 500 se erro interno
     """
-    try:
-        # Validar que apenas um filtro foi fornecido
-        if name and cpf:
+    # Validar que apenas um filtro foi fornecido
+    if name and cpf:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Forneça apenas um filtro por vez: 'name' ou 'cpf'"
+        )
+    
+    if cursor is not None:
+        if name or cpf:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Forneça apenas um filtro por vez: 'name' ou 'cpf'"
+                detail="A paginação por cursor (cursor) não pode ser combinada com 'name' ou 'cpf'"
             )
         
-        if cpf:
-            logger.info(f"Recebida requisição para buscar cliente por CPF: {cpf}")
-            # Buscar por CPF retorna um único cliente ou None
-            client = await service.get_client_by_cpf(cpf)
-            if client:
-                # Converter ClientResponse para ClientListResponse
-                client_list = [{
-                    "id": client.id,
-                    "name": client.name,
-                    "email": client.email,
-                    "phone": client.phone,
-                    "cpf": client.cpf,
-                    "city": client.address.city if client.address else None
-                }]
-                logger.info(f"Cliente encontrado por CPF via API")
-                return client_list
-            else:
-                logger.info(f"Nenhum cliente encontrado com CPF: {cpf}")
-                return []
-        elif name:
-            logger.info(f"Recebida requisição para buscar clientes por nome: {name}. Skip: {skip}, Limit: {limit}")
-            clients = await service.search_clients_by_name(name, skip, limit)
-            logger.info(f"Busca de clientes por nome realizada via API. Total: {len(clients)}")
-            return clients
+        clients = await service.get_clients_after(cursor, limit)
+        logger.info("Listagem de clientes por cursor realizada via API. Após id: %s, Total: %s", cursor, len(clients))
+        return Response(_client_list_adapter.dump_json(clients, by_alias=True), media_type="application/json",
+                        headers=next_cursor_headers(clients, limit))
+    
+    if cpf:
+        logger.info("Recebida requisição para buscar cliente por CPF: %s", cpf)
+        # Buscar por CPF retorna um único cliente ou None; o serviço já entrega o resumo de listagem
+        summary = await service.get_client_summary_by_cpf(cpf)
+        if summary:
+            logger.info("Cliente encontrado por CPF via API")
         else:
-            logger.info(f"Recebida requisição para listar todos os clientes. Skip: {skip}, Limit: {limit}")
-            clients = await service.get_all_clients(skip, limit)
-            logger.info(f"Listagem de clientes realizada via API. Total: {len(clients)}")
-            return clients
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro interno ao listar/buscar clientes via API: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Erro interno do servidor"
-        )
+            logger.info("Nenhum cliente encontrado com CPF: %s", cpf)
+        return Response(_client_list_adapter.dump_json([summary] if summary else [], by_alias=True), media_type="application/json")
+    elif name:
+        logger.info("Recebida requisição para buscar clientes por nome: %s. Skip: %s, Limit: %s", name, skip, limit)
+        clients = await service.search_clients_by_name(name, skip, limit)
+        logger.info("Busca de clientes por nome realizada via API. Total: %s", len(clients))
+        return Response(_client_list_adapter.dump_json(clients, by_alias=True), media_type="application/json")
+    else:
+        logger.info("Recebida requisição para listar todos os clientes. Skip: %s, Limit: %s", skip, limit)
+        clients = await service.get_all_clients(skip, limit)
+        logger.info("Listagem de clientes realizada via API. Total: %s", len(clients))
+        return Response(_client_list_adapter.dump_json(clients, by_alias=True), media_type="application/json")
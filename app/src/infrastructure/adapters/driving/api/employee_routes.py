@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from typing import Literal, Optional
 from app.src.application.dtos.employee_dto import (
     CreateEmployeeRequest, 
     UpdateEmployeeRequest, 
@@ -12,17 +12,21 @@ from app.src.infrastructure.driven.persistence.employee_repository_impl import E
 from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
     get_current_admin_user
 )
+from app.src.infrastructure.adapters.driving.api.model_response import ModelJSONResponse, conditional_model_response, next_cursor_headers
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Criar instâncias dos serviços
+employee_repository = EmployeeRepository()
+employee_service = EmployeeService(employee_repository)
+
 # Configuração do router
 router = APIRouter(prefix="/employees", tags=["employees"])
 
 # Dependência para o serviço de funcionários
-def get_employee_service() -> EmployeeService:
-    employee_repository = EmployeeRepository()
-    return EmployeeService(employee_repository)
+async def get_employee_service() -> EmployeeService:
+    return employee_service
 
 
 @router.post("/", response_model=EmployeeResponse, status_code=201)
@@ -44,26 +48,20 @@ async def create_employee(
     
     O funcionário é criado com status "Ativo" por padrão.
     """
-    try:
-        logger.info(f"Criando novo funcionário: {employee_request.name}")
-        employee = await employee_service.create_employee(employee_request)
-        logger.info(f"Funcionário criado com sucesso. ID: {employee.id}")
-        return employee
-    except ValueError as e:
-        logger.warning(f"Erro de validação ao criar funcionário: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Erro inesperado ao criar funcionário: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Criando novo funcionário: %s", employee_request.name)
+    employee = await employee_service.create_employee(employee_request)
+    logger.info("Funcionário criado com sucesso. ID: %s", employee.id)
+    return employee
 
 
 @router.get("/", response_model=EmployeesListResponse)
 async def list_employees(
     skip: int = Query(0, ge=0, description="Número de registros para pular"),
     limit: int = Query(100, ge=1, le=500, description="Número máximo de registros para retornar"),
+    cursor: Optional[int] = Query(None, ge=0, description="Paginação por cursor: 0 na primeira página, depois o cabeçalho X-Next-Cursor da resposta anterior"),
     name: Optional[str] = Query(None, description="Buscar por nome (busca parcial)"),
     cpf: Optional[str] = Query(None, description="Buscar por CPF exato"),
-    status: Optional[str] = Query(None, regex="^(Ativo|Inativo)$", description="Filtrar por status"),
+    status: Optional[Literal["Ativo", "Inativo"]] = Query(None, description="Filtrar por status"),
     employee_service: EmployeeService = Depends(get_employee_service),
     current_user: UserResponseDto = Depends(get_current_admin_user)
 ):
@@ -82,42 +80,48 @@ async def list_employees(
     ### Parâmetros de paginação:
     - **skip**: Número de registros para pular (padrão: 0)
     - **limit**: Número máximo de registros para retornar (padrão: 100, máximo: 500)
+    - **cursor**: Paginação por cursor, alternativa ao skip para páginas profundas.
+      Use 0 na primeira página e depois o cabeçalho X-Next-Cursor da resposta anterior
     
     **Nota**: Os parâmetros name e cpf não podem ser usados simultaneamente.
+    O cursor não pode ser combinado com name, cpf ou status.
     """
-    try:
-        # Validar que name e cpf não sejam usados simultaneamente
-        search_params = [name, cpf]
-        provided_search_params = [param for param in search_params if param is not None]
-        
-        if len(provided_search_params) > 1:
+    # Validar que name e cpf não sejam usados simultaneamente
+    if name is not None and cpf is not None:
+        raise HTTPException(
+            status_code=400, 
+            detail="Não é possível buscar por nome e CPF simultaneamente. Use apenas um parâmetro de busca por vez."
+        )
+    
+    if cursor is not None:
+        if name is not None or cpf is not None or status is not None:
             raise HTTPException(
-                status_code=400, 
-                detail="Não é possível buscar por nome e CPF simultaneamente. Use apenas um parâmetro de busca por vez."
+                status_code=400,
+                detail="A paginação por cursor (cursor) não pode ser combinada com name, cpf ou status."
             )
         
-        logger.info(f"Listando funcionários. Skip: {skip}, Limit: {limit}, Name: {name}, CPF: {cpf}, Status: {status}")
-        
-        employees = await employee_service.get_employees_with_filters(
-            skip=skip,
-            limit=limit,
-            name=name,
-            cpf=cpf,
-            status=status
-        )
-        
-        logger.info(f"Retornando {len(employees)} funcionários")
-        return EmployeesListResponse(employees=employees, total=len(employees))
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao listar funcionários: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+        employees = await employee_service.get_employees_after(cursor, limit)
+        logger.info("Retornando %s funcionários após o id %s", len(employees), cursor)
+        return ModelJSONResponse(EmployeesListResponse(employees=employees, total=len(employees)),
+                                 headers=next_cursor_headers(employees, limit))
+    
+    logger.info("Listando funcionários. Skip: %s, Limit: %s, Name: %s, CPF: %s, Status: %s", skip, limit, name, cpf, status)
+    
+    employees = await employee_service.get_employees_with_filters(
+        skip=skip,
+        limit=limit,
+        name=name,
+        cpf=cpf,
+        status=status
+    )
+    
+    logger.info("Retornando %s funcionários", len(employees))
+    return ModelJSONResponse(EmployeesListResponse(employees=employees, total=len(employees)))
 
 
 @router.get("/{employee_id}", response_model=EmployeeResponse)
 async def get_employee(
+    request: Request,
     employee_id: int,
     employee_service: EmployeeService = Depends(get_employee_service),
     current_user: UserResponseDto = Depends(get_current_admin_user)
@@ -128,23 +132,18 @@ async def get_employee(
     Requer autenticação: Administrador
     
     - **employee_id**: ID único do funcionário
+    
+    Responde 304 sem corpo quando o If-None-Match coincide com o ETag atual.
     """
-    try:
-        logger.info(f"Buscando funcionário por ID: {employee_id}")
-        employee = await employee_service.get_employee_by_id(employee_id)
-        
-        if not employee:
-            logger.warning(f"Funcionário não encontrado. ID: {employee_id}")
-            raise HTTPException(status_code=404, detail="Funcionário não encontrado")
-        
-        logger.info(f"Funcionário encontrado: {employee.name}")
-        return employee
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao buscar funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Buscando funcionário por ID: %s", employee_id)
+    employee = await employee_service.get_employee_by_id(employee_id)
+    
+    if not employee:
+        logger.warning("Funcionário não encontrado. ID: %s", employee_id)
+        raise HTTPException(status_code=404, detail="Funcionário não encontrado")
+    
+    logger.info("Funcionário encontrado: %s", employee.name)
+    return conditional_model_response(request, employee, cache_control="private, no-cache")
 
 
 @router.put("/{employee_id}", response_model=EmployeeResponse)
@@ -167,25 +166,15 @@ async def update_employee(
     
     Apenas os campos fornecidos serão atualizados.
     """
-    try:
-        logger.info(f"Atualizando funcionário ID: {employee_id}")
-        employee = await employee_service.update_employee(employee_id, employee_request)
-        
-        if not employee:
-            logger.warning(f"Funcionário não encontrado para atualização. ID: {employee_id}")
-            raise HTTPException(status_code=404, detail="Funcionário não encontrado")
-        
-        logger.info(f"Funcionário atualizado com sucesso: {employee.name}")
-        return employee
-        
-    except HTTPException:
-        raise
-    except ValueError as e:
-        logger.warning(f"Erro de validação ao atualizar funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Erro inesperado ao atualizar funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Atualizando funcionário ID: %s", employee_id)
+    employee = await employee_service.update_employee(employee_id, employee_request)
+    
+    if not employee:
+        logger.warning("Funcionário não encontrado para atualização. ID: %s", employee_id)
+        raise HTTPException(status_code=404, detail="Funcionário não encontrado")
+    
+    logger.info("Funcionário atualizado com sucesso: %s", employee.name)
+    return employee
 
 
 @router.delete("/{employee_id}", status_code=204)
@@ -202,22 +191,15 @@ async def delete_employee(
     **Atenção**: Esta operação é irreversível. O funcionário será 
     permanentemente removido do banco de dados.
     """
-    try:
-        logger.info(f"Removendo funcionário ID: {employee_id}")
-        deleted = await employee_service.delete_employee(employee_id)
-        
-        if not deleted:
-            logger.warning(f"Funcionário não encontrado para remoção. ID: {employee_id}")
-            raise HTTPException(status_code=404, detail="Funcionário não encontrado")
-        
-        logger.info(f"Funcionário removido com sucesso. ID: {employee_id}")
-        return
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao remover funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Removendo funcionário ID: %s", employee_id)
+    deleted = await employee_service.delete_employee(employee_id)
+    
+    if not deleted:
+        logger.warning("Funcionário não encontrado para remoção. ID: %s", employee_id)
+        raise HTTPException(status_code=404, detail="Funcionário não encontrado")
+    
+    logger.info("Funcionário removido com sucesso. ID: %s", employee_id)
+    return
 
 
 # Endpoints específicos para ativação/desativação
@@ -236,22 +218,15 @@ async def activate_employee(
     
     Endpoint de conveniência para ativar funcionários rapidamente.
     """
-    try:
-        logger.info(f"Ativando funcionário ID: {employee_id}")
-        employee = await employee_service.update_employee_status(employee_id, "Ativo")
-        
-        if not employee:
-            logger.warning(f"Funcionário não encontrado para ativação. ID: {employee_id}")
-            raise HTTPException(status_code=404, detail="Funcionário não encontrado")
-        
-        logger.info(f"Funcionário ativado com sucesso: {employee.name}")
-        return employee
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao ativar funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Ativando funcionário ID: %s", employee_id)
+    employee = await employee_service.update_employee_status(employee_id, "Ativo")
+    
+    if not employee:
+        logger.warning("Funcionário não encontrado para ativação. ID: %s", employee_id)
+        raise HTTPException(status_code=404, detail="Funcionário não encontrado")
+    
+    logger.info("Funcionário ativado com sucesso: %s", employee.name)
+    return employee
 
 
 @router.patch("/{employee_id}/deactivate", response_model=EmployeeResponse)
@@ -269,19 +244,12 @@ async def deactivate_employee(
     
     Endpoint de conveniência para desativar funcionários rapidamente.
     """
-    try:
-        logger.info(f"Desativando funcionário ID: {employee_id}")
-        employee = await employee_service.update_employee_status(employee_id, "Inativo")
-        
-        if not employee:
-            logger.warning(f"Funcionário não encontrado para desativação. ID: {employee_id}")
-            raise HTTPException(status_code=404, detail="Funcionário não encontrado")
-        
-        logger.info(f"Funcionário desativado com sucesso: {employee.name}")
-        return employee
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Erro inesperado ao desativar funcionário {employee_id}: {e}")
-        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+    logger.info("Desativando funcionário ID: %s", employee_id)
+    employee = await employee_service.update_employee_status(employee_id, "Inativo")
+    
+    if not employee:
+        logger.warning("Funcionário não encontrado para desativação. ID: %s", employee_id)
+        raise HTTPException(status_code=404, detail="Funcionário não encontrado")
+    
+    logger.info("Funcionário desativado com sucesso: %s", employee.name)
+    return employee
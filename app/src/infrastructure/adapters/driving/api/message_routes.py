@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, Query, Depends, Request
 from typing import Optional
 from app.src.application.services.message_service import MessageService
 from app.src.application.dtos.message_dto import (
@@ -15,13 +15,23 @@ from app.src.infrastructure.driven.persistence.message_repository_impl import Me
 from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
     get_current_admin_or_vendedor_user
 )
+from app.src.infrastructure.adapters.driving.api.model_response import ModelJSONResponse, conditional_model_response, next_cursor_headers
+
+# Criar instâncias dos serviços
+message_repository = MessageRepositoryImpl()
+message_service = MessageService(message_repository)
 
 router = APIRouter(prefix="/messages", tags=["Messages"])
 
-def get_message_service() -> MessageService:
+# Requisições fixas das rotas de status: construídas (e validadas) uma única vez
+_PENDING_REQUEST = MessageUpdateStatusRequest(status=MessageStatus.PENDING)
+_CONTACT_INITIATED_REQUEST = MessageUpdateStatusRequest(status=MessageStatus.CONTACT_INITIATED)
+_FINISHED_REQUEST = MessageUpdateStatusRequest(status=MessageStatus.FINISHED)
+_CANCELLED_REQUEST = MessageUpdateStatusRequest(status=MessageStatus.CANCELLED)
+
+async def get_message_service() -> MessageService:
     """Dependency injection para o serviço de mensagens"""
-    message_repository = MessageRepositoryImpl()
-    return MessageService(message_repository)
+    return message_service
 
 @router.post("/", response_model=MessageCreatedResponse, status_code=201)
 async def create_message(
@@ -34,18 +44,16 @@ async def create_message(
     Status inicial: "Pendente"
     responsible_id e service_start_time: não preenchidos na criação
     """
-    try:
-        return message_service.create_message(request)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.create_message(request)
 
 @router.get("/", response_model=MessagesListResponse)
 async def list_messages(
-    status: Optional[str] = Query(None, description="Filtrar por status"),
+    status: Optional[MessageStatus] = Query(None, description="Filtrar por status"),
     responsible_id: Optional[int] = Query(None, description="Filtrar por ID do responsável"),
     vehicle_id: Optional[int] = Query(None, description="Filtrar por ID do veículo"),
     page: int = Query(1, ge=1, description="Número da página"),
     limit: int = Query(10, ge=1, le=100, description="Itens por página"),
+    cursor: Optional[int] = Query(None, ge=1, description="Paginação por cursor: cabeçalho X-Next-Cursor da resposta anterior"),
     message_service: MessageService = Depends(get_message_service),
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
 ):
@@ -58,17 +66,33 @@ async def list_messages(
     - status: Filtrar por status da mensagem
     - responsible_id: Filtrar por funcionário responsável
     - vehicle_id: Filtrar por veículo relacionado
+    
+    Paginação por cursor (alternativa a page para páginas profundas):
+    - cursor: cabeçalho X-Next-Cursor da resposta anterior (enviado por páginas cheias
+      em ambos os modos, já que os dois ordenam por id decrescente); nesse modo page
+      é ignorado e total/page/total_pages vêm null
     """
-    try:
-        return message_service.get_messages_with_filters(
-            status=status,
+    # Status já validado contra MessageStatus pelo FastAPI (422 se inválido), antes de tocar o banco
+    status_value = status.value if status is not None else None
+    
+    if cursor is not None:
+        messages_response = await message_service.get_messages_before(
+            before_id=cursor,
+            status=status_value,
+            responsible_id=responsible_id,
+            vehicle_id=vehicle_id,
+            limit=limit
+        )
+    else:
+        messages_response = await message_service.get_messages_with_filters(
+            status=status_value,
             responsible_id=responsible_id,
             vehicle_id=vehicle_id,
             page=page,
             limit=limit
         )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    
+    return ModelJSONResponse(messages_response, headers=next_cursor_headers(messages_response.messages, limit))
 
 @router.patch("/{message_id}/start-service", response_model=MessageResponse)
 async def start_service(
@@ -87,12 +111,7 @@ async def start_service(
     - Define service_start_time com horário atual
     - Atualiza status para "Contato iniciado"
     """
-    try:
-        return message_service.start_service(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.start_service(message_id, request)
 
 @router.patch("/{message_id}/status", response_model=MessageResponse)
 async def update_status(
@@ -112,15 +131,11 @@ async def update_status(
     - Finalizado
     - Cancelado
     """
-    try:
-        return message_service.update_status(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.update_status(message_id, request)
 
 @router.get("/{message_id}", response_model=MessageResponse)
 async def get_message(
+    request: Request,
     message_id: int,
     message_service: MessageService = Depends(get_message_service),
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
@@ -129,13 +144,11 @@ async def get_message(
     Buscar mensagem por ID
     
     Requer autenticação: Administrador ou Vendedor
+    
+    Responde 304 sem corpo quando o If-None-Match coincide com o ETag atual.
     """
-    try:
-        return message_service.get_message_by_id(message_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    message = await message_service.get_message_by_id(message_id)
+    return conditional_model_response(request, message, cache_control="private, no-cache")
 
 # Rotas específicas para atualização de status (seguindo padrão do sistema)
 @router.patch("/{message_id}/pending", response_model=MessageResponse)
@@ -145,13 +158,7 @@ async def set_pending_status(
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
 ):
     """Definir status como 'Pendente' - Requer autenticação: Administrador ou Vendedor"""
-    request = MessageUpdateStatusRequest(status=MessageStatus.PENDING)
-    try:
-        return message_service.update_status(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.update_status(message_id, _PENDING_REQUEST)
 
 @router.patch("/{message_id}/contact-initiated", response_model=MessageResponse)
 async def set_contact_initiated_status(
@@ -160,13 +167,7 @@ async def set_contact_initiated_status(
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
 ):
     """Definir status como 'Contato iniciado' - Requer autenticação: Administrador ou Vendedor"""
-    request = MessageUpdateStatusRequest(status=MessageStatus.CONTACT_INITIATED)
-    try:
-        return message_service.update_status(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.update_status(message_id, _CONTACT_INITIATED_REQUEST)
 
 @router.patch("/{message_id}/finished", response_model=MessageResponse)
 async def set_finished_status(
@@ -175,13 +176,7 @@ async def set_finished_status(
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
 ):
     """Definir status como 'Finalizado' - Requer autenticação: Administrador ou Vendedor"""
-    request = MessageUpdateStatusRequest(status=MessageStatus.FINISHED)
-    try:
-        return message_service.update_status(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.update_status(message_id, _FINISHED_REQUEST)
 
 @router.patch("/{message_id}/cancelled", response_model=MessageResponse)
 async def set_cancelled_status(
@@ -190,10 +185,4 @@ async def set_cancelled_status(
     current_user: UserResponseDto = Depends(get_current_admin_or_vendedor_user)
 ):
     """Definir status como 'Cancelado' - Requer autenticação: Administrador ou Vendedor"""
-    request = MessageUpdateStatusRequest(status=MessageStatus.CANCELLED)
-    try:
-        return message_service.update_status(message_id, request)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await message_service.update_status(message_id, _CANCELLED_REQUEST)
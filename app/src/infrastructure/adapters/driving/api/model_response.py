@@ -0,0 +1,56 @@
+import hashlib
+from typing import Dict, Optional, Sequence
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """
+    Resposta JSON serializada direto de um modelo Pydantic já validado.
+
+    O FastAPI devolve instâncias de Response sem passar pelo serialize_response,
+    então o modelo montado pelo serviço não é revalidado contra o response_model
+    nem convertido em dict para depois virar JSON: o pydantic-core gera os bytes
+    em uma única passada. O response_model continua na rota para o OpenAPI.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content, by_alias=True)
+
+
+def conditional_model_response(request: Request, content: BaseModel, cache_control: str = "no-cache") -> Response:
+    """
+    Resposta JSON com ETag do corpo, devolvendo 304 sem corpo se o cliente já tem a versão atual.
+
+    O ETag é o hash do JSON serializado: imagens e dados do carro mudam sem um
+    único updated_at que cubra tudo, então só o corpo identifica a versão com segurança.
+    Rotas autenticadas devem passar cache_control="private, no-cache".
+    """
+    response = ModelJSONResponse(content)
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return response
+
+
+def next_cursor_headers(items: Sequence, limit: int) -> Optional[Dict[str, str]]:
+    """
+    Cabeçalho X-Next-Cursor das listagens paginadas por cursor.
+
+    Página cheia indica que pode haver mais registros: o id do último item é o
+    valor a enviar no parâmetro cursor da próxima requisição. Página incompleta
+    é a última e não leva o cabeçalho.
+    """
+    if items and len(items) == limit:
+        return {"X-Next-Cursor": str(items[-1].id)}
+    return None
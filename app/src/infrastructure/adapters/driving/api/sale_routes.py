@@ -1,9 +1,9 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Optional, List
+from typing import Optional
 from app.src.application.services.sale_service import SaleService
 from app.src.application.dtos.sale_dto import (
     CreateSaleRequest, UpdateSaleRequest, UpdateSaleStatusRequest,
-    SaleResponse, SaleListResponse, SalesListResponse
+    SaleResponse, SalesListResponse
 )
 from app.src.application.dtos.user_dto import UserResponseDto
 from app.src.infrastructure.driven.persistence.sale_repository_impl import SaleRepositoryImpl
@@ -17,21 +17,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Criar instâncias dos serviços
+sale_repository = SaleRepositoryImpl()
+sale_service = SaleService(sale_repository, CarRepository(), MotorcycleRepository())
+
 # Router para as rotas de vendas
 router = APIRouter(prefix="/sales", tags=["Sales"])
 
 
-def get_sale_service() -> SaleService:
+async def get_sale_service() -> SaleService:
     """
     Dependency injection para o serviço de vendas.
     
     Returns:
         SaleService: Instância do serviço de vendas
     """
-    sale_repository = SaleRepositoryImpl()
-    car_repository = CarRepository()
-    motorcycle_repository = MotorcycleRepository()
-    return SaleService(sale_repository, car_repository, motorcycle_repository)
+    return sale_service
 
 
 @router.post("/", response_model=SaleResponse, status_code=201)
@@ -487,7 +488,6 @@ async def get_sales_statistics(
         logger.info("Recebida solicitação para obter estatísticas das vendas")
         
         # Usando o repositório diretamente para estatísticas
-        sale_repository = SaleRepositoryImpl()
         statistics = await sale_repository.get_sales_statistics()
         
         logger.info("Estatísticas obtidas com sucesso")
@@ -13,12 +13,15 @@ from app.src.infrastructure.adapters.driving.api.auth_dependencies import (
     get_current_admin_or_vendedor_user
 )
 
+# Criar instâncias dos serviços
+vehicle_image_repository = VehicleImageRepositoryImpl()
+vehicle_image_service = VehicleImageService(vehicle_image_repository)
+
 router = APIRouter(prefix="/vehicles", tags=["Vehicle Images"])
 
-def get_vehicle_image_service() -> VehicleImageService:
+async def get_vehicle_image_service() -> VehicleImageService:
     """Dependency injection para o serviço de imagens"""
-    vehicle_image_repository = VehicleImageRepositoryImpl()
-    return VehicleImageService(vehicle_image_repository)
+    return vehicle_image_service
 
 # Rotas para Carros
 @router.post("/cars/{car_id}/images", response_model=List[ImageUploadResponse])
@@ -41,7 +44,9 @@ async def upload_car_images(
     - Primeira imagem é definida como principal automaticamente
     """
     try:
-        return image_service.upload_images("cars", car_id, files)
+        return await image_service.upload_images("cars", car_id, files)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -57,7 +62,7 @@ async def get_car_images(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        return image_service.get_vehicle_images(car_id, "cars")
+        return await image_service.get_vehicle_images(car_id, "cars")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -76,7 +81,7 @@ async def delete_car_image(
     Não é possível deletar se for a única imagem (mínimo 1).
     """
     try:
-        success = image_service.delete_image(image_id)
+        success = await image_service.delete_image(image_id)
         if success:
             return {"message": "Imagem deletada com sucesso"}
         else:
@@ -97,7 +102,7 @@ async def set_car_primary_image(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        success = image_service.set_primary_image(car_id, request.image_id)
+        success = await image_service.set_primary_image(car_id, request.image_id)
         if success:
             return {"message": "Imagem principal definida com sucesso"}
         else:
@@ -118,7 +123,7 @@ async def reorder_car_images(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        success = image_service.reorder_images(car_id, request.image_positions)
+        success = await image_service.reorder_images(car_id, request.image_positions)
         if success:
             return {"message": "Imagens reordenadas com sucesso"}
         else:
@@ -147,7 +152,9 @@ async def upload_motorcycle_images(
     - Primeira imagem é definida como principal automaticamente
     """
     try:
-        return image_service.upload_images("motorcycles", motorcycle_id, files)
+        return await image_service.upload_images("motorcycles", motorcycle_id, files)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -163,7 +170,7 @@ async def get_motorcycle_images(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        return image_service.get_vehicle_images(motorcycle_id, "motorcycles")
+        return await image_service.get_vehicle_images(motorcycle_id, "motorcycles")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -182,7 +189,7 @@ async def delete_motorcycle_image(
     Não é possível deletar se for a única imagem (mínimo 1).
     """
     try:
-        success = image_service.delete_image(image_id)
+        success = await image_service.delete_image(image_id)
         if success:
             return {"message": "Imagem deletada com sucesso"}
         else:
@@ -203,7 +210,7 @@ async def set_motorcycle_primary_image(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        success = image_service.set_primary_image(motorcycle_id, request.image_id)
+        success = await image_service.set_primary_image(motorcycle_id, request.image_id)
         if success:
             return {"message": "Imagem principal definida com sucesso"}
         else:
@@ -224,7 +231,7 @@ async def reorder_motorcycle_images(
     Requer autenticação: Administrador ou Vendedor
     """
     try:
-        success = image_service.reorder_images(motorcycle_id, request.image_positions)
+        success = await image_service.reorder_images(motorcycle_id, request.image_positions)
         if success:
             return {"message": "Imagens reordenadas com sucesso"}
         else:
@@ -1,7 +1,10 @@
 from sqlalchemy import create_engine, Engine, text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import asyncio
+import functools
 import os
 import time
 import logging
@@ -16,6 +19,17 @@ logger = logging.getLogger(__name__)
 # Base class for all models
 Base = declarative_base()
 
+# Connection pool capacity; the thread pool used by run_in_thread is sized to match it
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Um thread por conexão possível: com mais threads elas só esperariam no pool_timeout,
+# com menos o pool nunca seria usado por completo
+_db_executor = ThreadPoolExecutor(
+    max_workers=DB_POOL_SIZE + DB_MAX_OVERFLOW,
+    thread_name_prefix="db"
+)
+
 def get_connection_url() -> str:
     """
     Build database connection URL from environment variables or default values.
@@ -48,11 +62,14 @@ def get_engine() -> Engine:
             engine = create_engine(
                 connection_url,
                 echo=os.getenv("SQL_ECHO", "False").lower() == "true",
-                pool_pre_ping=True,
+                # Pre-ping ligado por padrão: o servidor pode derrubar conexões ociosas antes do
+                # pool_recycle (wait_timeout reduzido, restart, failover). Desligue com
+                # DB_POOL_PRE_PING=false apenas se wait_timeout for garantidamente maior que 3600s
+                pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "True").lower() == "true",
                 pool_recycle=3600,
                 pool_timeout=30,
-                pool_size=5,
-                max_overflow=10,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
                 connect_args={
                     "connect_timeout": 60,
                     "read_timeout": 60,
@@ -88,6 +105,19 @@ def get_session_factory():
         _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return _session_factory
 
+def run_in_thread(func):
+    """
+    Decorator for repository methods that use a blocking (sync) Session.
+    Turns the method into a coroutine executed in the database thread pool
+    (DB_POOL_SIZE + DB_MAX_OVERFLOW workers), so database I/O does not block
+    the event loop and never has more threads waiting than pooled connections.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_db_executor, functools.partial(func, *args, **kwargs))
+    return wrapper
+
 @contextmanager
 def get_db_session():
     """
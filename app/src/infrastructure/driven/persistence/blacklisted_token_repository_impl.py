@@ -1,7 +1,5 @@
-from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from app.src.domain.entities.blacklisted_token_model import BlacklistedToken
 from app.src.domain.ports.blacklisted_token_repository import BlacklistedTokenRepositoryInterface
@@ -62,6 +60,25 @@ class BlacklistedTokenRepositoryImpl(BlacklistedTokenRepositoryInterface):
             logger.error(f"Erro inesperado ao verificar token na blacklist: {str(e)}")
             return False
     
+    async def get_active_blacklisted_jtis(self) -> List[str]:
+        """
+        Lista os JTIs dos tokens blacklisted que ainda não expiraram.
+        """
+        try:
+            with get_db_session() as session:
+                rows = session.query(BlacklistedToken.jti)\
+                    .filter(BlacklistedToken.expires_at > datetime.utcnow())\
+                    .all()
+                
+                return [row.jti for row in rows]
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao listar tokens ativos da blacklist: {str(e)}")
+            raise Exception(f"Erro ao listar tokens ativos da blacklist: {str(e)}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao listar tokens ativos da blacklist: {str(e)}")
+            raise Exception(f"Erro inesperado ao listar tokens ativos da blacklist: {str(e)}")
+    
     async def get_blacklisted_token_by_jti(self, jti: str) -> Optional[BlacklistedToken]:
         """
         Busca um token blacklisted pelo JTI.
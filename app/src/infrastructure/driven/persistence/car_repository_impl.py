@@ -1,11 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, desc, asc
+from sqlalchemy import and_, desc, asc, insert
 from typing import Optional, List
 from app.src.domain.entities.car_model import Car
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 from app.src.domain.ports.car_repository import CarRepositoryInterface
 from app.src.infrastructure.driven.database.connection_mysql import get_db_session
+from app.src.infrastructure.driven.persistence.persistence_utils import column_values, database_now
 from decimal import Decimal
 import logging
 
@@ -24,31 +26,30 @@ class CarRepository(CarRepositoryInterface):
     async def create_car(self, motor_vehicle: MotorVehicle, car: Car) -> Car:
         """
         Cria um novo carro no banco de dados.
-        Primeiro insere o motor_vehicle, depois o car com o ID gerado.
+        Executa dois INSERTs diretos (motor_vehicle e car) na mesma transação,
+        sem flush/refresh do ORM.
         """
         try:
             with get_db_session() as session:
-                # Primeiro, insere o motor_vehicle
-                session.add(motor_vehicle)
-                session.flush()  # Para obter o ID gerado
+                # Timestamps definidos aqui (relógio do banco) para não precisar recarregar as linhas após o INSERT
+                now = database_now(session)
+                motor_vehicle.created_at = now
+                motor_vehicle.updated_at = now
+                car.updated_at = now
                 
-                # Agora usa o ID gerado para criar o car
+                # INSERT do motor_vehicle; o ID gerado vem do próprio resultado (lastrowid)
+                result = session.execute(insert(MotorVehicle).values(**column_values(motor_vehicle)))
+                motor_vehicle.id = result.inserted_primary_key[0]
+                
+                # INSERT do car com o ID gerado, na mesma transação
                 car.vehicle_id = motor_vehicle.id
-                session.add(car)
+                session.execute(insert(Car).values(**column_values(car)))
                 
                 session.commit()
                 
-                # Refresh para obter todos os dados atualizados
-                session.refresh(motor_vehicle)
-                session.refresh(car)
-                
-                # Eager load do relacionamento para evitar lazy loading após o fechamento da sessão
+                # As entidades não foram adicionadas à sessão, então já estão desconectadas
                 car.motor_vehicle = motor_vehicle
                 
-                # Fazer expunge para desconectar os objetos da sessão
-                session.expunge(motor_vehicle)
-                session.expunge(car)
-                
                 logger.info(f"Carro criado com sucesso. ID: {motor_vehicle.id}")
                 return car
                 
@@ -65,14 +66,13 @@ class CarRepository(CarRepositoryInterface):
         """
         try:
             with get_db_session() as session:
-                car = session.query(Car).filter(Car.vehicle_id == car_id).first()
+                car = (session.query(Car)
+                       .options(selectinload(Car.motor_vehicle).undefer(MotorVehicle.additional_description))
+                       .filter(Car.vehicle_id == car_id)
+                       .first())
                 if car:
-                    # Carregar o motor_vehicle relacionado
-                    motor_vehicle = session.query(MotorVehicle).filter(MotorVehicle.id == car_id).first()
-                    car.motor_vehicle = motor_vehicle
-                    
                     # Fazer expunge para desconectar os objetos da sessão
-                    session.expunge(motor_vehicle)
+                    session.expunge(car.motor_vehicle)
                     session.expunge(car)
                     
                 return car
@@ -114,6 +114,8 @@ class CarRepository(CarRepositoryInterface):
                 session.commit()
                 session.refresh(existing_car)
                 session.refresh(existing_motor_vehicle)
+                # refresh não carrega colunas adiadas; o valor é o que acabou de ser gravado
+                set_committed_value(existing_motor_vehicle, 'additional_description', motor_vehicle.additional_description)
                 
                 # Associar o motor_vehicle ao car
                 existing_car.motor_vehicle = existing_motor_vehicle
@@ -230,7 +232,7 @@ class CarRepository(CarRepositoryInterface):
                 # Query base
                 query = session.query(Car, MotorVehicle).join(
                     MotorVehicle, Car.vehicle_id == MotorVehicle.id
-                )
+                ).options(undefer(MotorVehicle.additional_description))
                 
                 # Aplicar filtros
                 query = self._apply_filters(query, status, min_price, max_price)
@@ -1,13 +1,20 @@
 from typing import Optional, List
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from app.src.domain.ports.client_repository import ClientRepositoryInterface
-from app.src.domain.entities.client_model import Client, Address
+from app.src.domain.entities.client_model import Client, ClientSummary
 from app.src.infrastructure.driven.database.connection_mysql import get_db_session
+from app.src.infrastructure.driven.persistence.entity_cache import EntityCache
+from app.src.infrastructure.driven.persistence.name_search import name_contains_filter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache das buscas por id/email/CPF (detalhe do cliente, validações de cadastro e vendas)
+CLIENT_CACHE_TTL_SECONDS = 60
+CLIENT_CACHE_MAX_SIZE = 10_000
+_client_cache = EntityCache(Client, ttl_seconds=CLIENT_CACHE_TTL_SECONDS, max_size=CLIENT_CACHE_MAX_SIZE)
+
 
 class ClientRepository(ClientRepositoryInterface):
     """
@@ -17,12 +24,11 @@ class ClientRepository(ClientRepositoryInterface):
     def __init__(self):
         pass
     
-    async def create_client(self, address: Optional[Address], client: Client) -> Client:
+    async def create_client(self, client: Client) -> Client:
         """
         Cria um novo cliente no banco de dados.
         
         Args:
-            address: Dados do endereço (opcional)
             client: Dados do cliente
             
         Returns:
@@ -35,26 +41,15 @@ class ClientRepository(ClientRepositoryInterface):
             logger.info(f"Criando cliente no banco: {client.name}")
             
             with get_db_session() as session:
-                # Criar endereço se fornecido
-                if address:
-                    session.add(address)
-                    session.flush()  # Para obter o ID do endereço
-                    client.address_id = address.id
-                    logger.info(f"Endereço criado com ID: {address.id}")
-                
                 # Criar cliente
                 session.add(client)
                 session.commit()
                 
-                # Recarregar para ter os relacionamentos
+                # Recarregar para obter os valores gerados pelo banco
                 session.refresh(client)
-                if client.address_id:
-                    client.address = session.get(Address, client.address_id)
                 
-                # Fazer expunge para desconectar os objetos da sessão
+                # Fazer expunge para desconectar o objeto da sessão
                 session.expunge(client)
-                if client.address:
-                    session.expunge(client.address)
                 
                 logger.info(f"Cliente criado com sucesso. ID: {client.id}")
                 return client
@@ -76,18 +71,22 @@ class ClientRepository(ClientRepositoryInterface):
         Returns:
             Optional[Client]: O cliente encontrado ou None
         """
+        cache_key = ("id", client_id)
+        cached_client = _client_cache.get(cache_key)
+        if cached_client is not None:
+            return cached_client
+        
         try:
             logger.info(f"Buscando cliente por ID: {client_id}")
             
             with get_db_session() as session:
-                client = session.query(Client).options(joinedload(Client.address)).filter(Client.id == client_id).first()
+                client = session.query(Client).filter(Client.id == client_id).first()
                 
                 if client:
                     logger.info(f"Cliente encontrado: {client.name}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(client)
-                    if client.address:
-                        session.expunge(client.address)
+                    _client_cache.put(cache_key, client)
                 else:
                     logger.info(f"Cliente não encontrado com ID: {client_id}")
                 
@@ -100,13 +99,12 @@ class ClientRepository(ClientRepositoryInterface):
             logger.error(f"Erro inesperado ao buscar cliente por ID {client_id}: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
-    async def update_client(self, client_id: int, address: Optional[Address], client: Client) -> Optional[Client]:
+    async def update_client(self, client_id: int, client: Client) -> Optional[Client]:
         """
         Atualiza um cliente existente.
         
         Args:
             client_id: ID do cliente
-            address: Dados atualizados do endereço (opcional)
             client: Dados atualizados do cliente
             
         Returns:
@@ -119,48 +117,36 @@ class ClientRepository(ClientRepositoryInterface):
             logger.info(f"Atualizando cliente ID: {client_id}")
             
             with get_db_session() as session:
-                # Buscar cliente existente
-                existing_client = session.query(Client).filter(Client.id == client_id).first()
-                if not existing_client:
+                # UPDATE direto (Core), sem carregar a entidade nem passar pelo unit of work
+                result = session.execute(
+                    update(Client)
+                    .where(Client.id == client_id)
+                    .values(
+                        name=client.name,
+                        email=client.email,
+                        phone=client.phone,
+                        cpf=client.cpf,
+                        street=client.street,
+                        city=client.city,
+                        state=client.state,
+                        zip_code=client.zip_code,
+                        country=client.country
+                    )
+                )
+                if result.rowcount == 0:
                     logger.warning(f"Cliente não encontrado para atualização. ID: {client_id}")
                     return None
                 
-                # Atualizar endereço se fornecido
-                if address:
-                    if existing_client.address_id:
-                        # Atualizar endereço existente
-                        existing_address = session.get(Address, existing_client.address_id)
-                        if existing_address:
-                            existing_address.street = address.street
-                            existing_address.city = address.city
-                            existing_address.state = address.state
-                            existing_address.zip_code = address.zip_code
-                            existing_address.country = address.country
-                            logger.info(f"Endereço atualizado. ID: {existing_address.id}")
-                    else:
-                        # Criar novo endereço
-                        session.add(address)
-                        session.flush()
-                        existing_client.address_id = address.id
-                        logger.info(f"Novo endereço criado. ID: {address.id}")
-                
-                # Atualizar dados do cliente
-                existing_client.name = client.name
-                existing_client.email = client.email
-                existing_client.phone = client.phone
-                existing_client.cpf = client.cpf
-                
                 session.commit()
                 
-                # Recarregar para ter os relacionamentos atualizados
-                session.refresh(existing_client)
-                if existing_client.address_id:
-                    existing_client.address = session.get(Address, existing_client.address_id)
+                # UPDATE via Core não dispara os eventos do mapper: invalidar o cache manualmente
+                _client_cache.invalidate(client_id)
                 
-                # Fazer expunge para desconectar os objetos da sessão
+                # Carregar os valores atualizados pelo banco
+                existing_client = session.get(Client, client_id)
+                
+                # Fazer expunge para desconectar o objeto da sessão
                 session.expunge(existing_client)
-                if existing_client.address:
-                    session.expunge(existing_client.address)
                 
                 logger.info(f"Cliente atualizado com sucesso. ID: {client_id}")
                 return existing_client
@@ -195,7 +181,7 @@ class ClientRepository(ClientRepositoryInterface):
                     logger.warning(f"Cliente não encontrado para remoção. ID: {client_id}")
                     return False
                 
-                # Remover cliente (o endereço será mantido devido ao ON DELETE SET NULL)
+                # Remover cliente
                 session.delete(client)
                 session.commit()
                 
@@ -209,7 +195,7 @@ class ClientRepository(ClientRepositoryInterface):
             logger.error(f"Erro inesperado ao remover cliente {client_id}: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
-    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[Client]:
+    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[ClientSummary]:
         """
         Busca todos os clientes com paginação.
         
@@ -218,26 +204,21 @@ class ClientRepository(ClientRepositoryInterface):
             limit: Número máximo de registros para retornar
             
         Returns:
-            List[Client]: Lista de clientes encontrados
+            List[ClientSummary]: Resumos dos clientes para a listagem
         """
         try:
             logger.info(f"Buscando todos os clientes. Skip: {skip}, Limit: {limit}")
             
             with get_db_session() as session:
-                clients = (session.query(Client)
-                          .options(joinedload(Client.address))
-                          .offset(skip)
-                          .limit(limit)
-                          .all())
-                
-                # Fazer expunge para desconectar os objetos da sessão
-                for client in clients:
-                    session.expunge(client)
-                    if client.address:
-                        session.expunge(client.address)
+                # Listagem lê apenas as colunas necessárias, sem instanciar entidades do ORM
+                clients = session.execute(
+                    select(*Client.list_columns())
+                    .offset(skip)
+                    .limit(limit)
+                ).all()
                 
                 logger.info(f"Encontrados {len(clients)} clientes")
-                return clients
+                return [ClientSummary._make(row) for row in clients]
                 
         except SQLAlchemyError as e:
             logger.error(f"Erro de banco ao buscar todos os clientes: {e}")
@@ -246,6 +227,39 @@ class ClientRepository(ClientRepositoryInterface):
             logger.error(f"Erro inesperado ao buscar todos os clientes: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
+    async def get_clients_after(self, cursor_id: int, limit: int = 100) -> List[ClientSummary]:
+        """
+        Busca a próxima página de clientes a partir de um cursor.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[ClientSummary]: Resumos dos clientes para a listagem
+        """
+        try:
+            logger.info(f"Buscando clientes após o id {cursor_id}. Limit: {limit}")
+            
+            with get_db_session() as session:
+                # Range scan na PRIMARY KEY: custo constante, independente da profundidade da página
+                clients = session.execute(
+                    select(*Client.list_columns())
+                    .where(Client.id > cursor_id)
+                    .order_by(Client.id)
+                    .limit(limit)
+                ).all()
+                
+                logger.info(f"Encontrados {len(clients)} clientes")
+                return [ClientSummary._make(row) for row in clients]
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Erro de banco ao buscar clientes após o id {cursor_id}: {e}")
+            raise Exception(f"Erro de banco de dados: {str(e)}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao buscar clientes após o id {cursor_id}: {e}")
+            raise Exception(f"Erro inesperado: {str(e)}")
+    
     async def get_client_by_email(self, email: str) -> Optional[Client]:
         """
         Busca um cliente pelo email.
@@ -256,18 +270,22 @@ class ClientRepository(ClientRepositoryInterface):
         Returns:
             Optional[Client]: O cliente encontrado ou None
         """
+        cache_key = ("email", email)
+        cached_client = _client_cache.get(cache_key)
+        if cached_client is not None:
+            return cached_client
+        
         try:
             logger.info(f"Buscando cliente por email: {email}")
             
             with get_db_session() as session:
-                client = session.query(Client).options(joinedload(Client.address)).filter(Client.email == email).first()
+                client = session.query(Client).filter(Client.email == email).first()
                 
                 if client:
                     logger.info(f"Cliente encontrado com email: {email}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(client)
-                    if client.address:
-                        session.expunge(client.address)
+                    _client_cache.put(cache_key, client)
                 else:
                     logger.info(f"Cliente não encontrado com email: {email}")
                 
@@ -290,18 +308,22 @@ class ClientRepository(ClientRepositoryInterface):
         Returns:
             Optional[Client]: O cliente encontrado ou None
         """
+        cache_key = ("cpf", cpf)
+        cached_client = _client_cache.get(cache_key)
+        if cached_client is not None:
+            return cached_client
+        
         try:
             logger.info(f"Buscando cliente por CPF: {cpf}")
             
             with get_db_session() as session:
-                client = session.query(Client).options(joinedload(Client.address)).filter(Client.cpf == cpf).first()
+                client = session.query(Client).filter(Client.cpf == cpf).first()
                 
                 if client:
                     logger.info(f"Cliente encontrado com CPF: {cpf}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(client)
-                    if client.address:
-                        session.expunge(client.address)
+                    _client_cache.put(cache_key, client)
                 else:
                     logger.info(f"Cliente não encontrado com CPF: {cpf}")
                 
@@ -314,7 +336,7 @@ class ClientRepository(ClientRepositoryInterface):
             logger.error(f"Erro inesperado ao buscar cliente por CPF {cpf}: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
-    async def search_clients_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Client]:
+    async def search_clients_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[ClientSummary]:
         """
         Busca clientes por nome (busca parcial).
         
@@ -324,27 +346,22 @@ class ClientRepository(ClientRepositoryInterface):
             limit: Número máximo de registros para retornar
             
         Returns:
-            List[Client]: Lista de clientes encontrados
+            List[ClientSummary]: Resumos dos clientes para a listagem
         """
         try:
             logger.info(f"Buscando clientes por nome: {name}")
             
             with get_db_session() as session:
-                clients = (session.query(Client)
-                          .options(joinedload(Client.address))
-                          .filter(Client.name.contains(name))
-                          .offset(skip)
-                          .limit(limit)
-                          .all())
-                
-                # Fazer expunge para desconectar os objetos da sessão
-                for client in clients:
-                    session.expunge(client)
-                    if client.address:
-                        session.expunge(client.address)
+                # Listagem lê apenas as colunas necessárias, sem instanciar entidades do ORM
+                clients = session.execute(
+                    select(*Client.list_columns())
+                    .filter(name_contains_filter(Client.name, name))
+                    .offset(skip)
+                    .limit(limit)
+                ).all()
                 
                 logger.info(f"Encontrados {len(clients)} clientes com nome contendo '{name}'")
-                return clients
+                return [ClientSummary._make(row) for row in clients]
                 
         except SQLAlchemyError as e:
             logger.error(f"Erro de banco ao buscar clientes por nome {name}: {e}")
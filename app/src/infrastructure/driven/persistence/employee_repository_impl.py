@@ -1,14 +1,20 @@
 from typing import Optional, List
-from sqlalchemy.orm import joinedload
+from sqlalchemy import insert, inspect, update
 from sqlalchemy.exc import SQLAlchemyError
 from app.src.domain.ports.employee_repository import EmployeeRepositoryInterface
 from app.src.domain.entities.employee_model import Employee
-from app.src.domain.entities.client_model import Address
 from app.src.infrastructure.driven.database.connection_mysql import get_db_session
+from app.src.infrastructure.driven.persistence.entity_cache import EntityCache
+from app.src.infrastructure.driven.persistence.name_search import name_contains_filter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache das buscas por id (detalhe do funcionário)
+EMPLOYEE_CACHE_TTL_SECONDS = 30
+EMPLOYEE_CACHE_MAX_SIZE = 10_000
+_employee_cache = EntityCache(Employee, ttl_seconds=EMPLOYEE_CACHE_TTL_SECONDS, max_size=EMPLOYEE_CACHE_MAX_SIZE)
+
 
 class EmployeeRepository(EmployeeRepositoryInterface):
     """
@@ -18,12 +24,11 @@ class EmployeeRepository(EmployeeRepositoryInterface):
     def __init__(self):
         pass
     
-    async def create_employee(self, address: Optional[Address], employee: Employee) -> Employee:
+    async def create_employee(self, employee: Employee) -> Employee:
         """
         Cria um novo funcionário no banco de dados.
         
         Args:
-            address: Dados do endereço (opcional)
             employee: Dados do funcionário
             
         Returns:
@@ -36,26 +41,15 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.info(f"Criando funcionário no banco: {employee.name}")
             
             with get_db_session() as session:
-                # Criar endereço se fornecido
-                if address:
-                    session.add(address)
-                    session.flush()  # Para obter o ID do endereço
-                    employee.address_id = address.id
-                    logger.info(f"Endereço criado com ID: {address.id}")
-                
                 # Criar funcionário
                 session.add(employee)
                 session.commit()
                 
-                # Recarregar para ter os relacionamentos
+                # Recarregar para obter os valores gerados pelo banco
                 session.refresh(employee)
-                if employee.address_id:
-                    employee.address = session.get(Address, employee.address_id)
                 
-                # Fazer expunge para desconectar os objetos da sessão
+                # Fazer expunge para desconectar o objeto da sessão
                 session.expunge(employee)
-                if employee.address:
-                    session.expunge(employee.address)
                 
                 logger.info(f"Funcionário criado com sucesso. ID: {employee.id}")
                 return employee
@@ -67,6 +61,57 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.error(f"Erro inesperado ao criar funcionário: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
+    async def create_employees(self, employees: List[Employee]) -> List[Employee]:
+        """
+        Cria vários funcionários em uma única transação.
+        
+        Args:
+            employees: Funcionários a serem criados
+            
+        Returns:
+            List[Employee]: Os funcionários criados com IDs gerados, na mesma ordem recebida
+            
+        Raises:
+            Exception: Se houver erro na criação
+        """
+        if not employees:
+            return []
+        
+        try:
+            logger.info(f"Criando {len(employees)} funcionários no banco")
+            
+            column_keys = [attr.key for attr in inspect(Employee).column_attrs]
+            with get_db_session() as session:
+                # Um único INSERT multi-linhas (executemany) em vez de um INSERT por funcionário
+                session.execute(insert(Employee), [
+                    {key: employee.__dict__[key] for key in column_keys if key in employee.__dict__}
+                    for employee in employees
+                ])
+                
+                # MySQL não tem RETURNING: recarregar pela chave única de email
+                created = {
+                    employee.email: employee
+                    for employee in session.query(Employee)
+                    .filter(Employee.email.in_([employee.email for employee in employees]))
+                }
+                created_employees = [created[employee.email] for employee in employees]
+                
+                # Expunge antes do commit para manter os atributos carregados
+                for employee in created_employees:
+                    session.expunge(employee)
+                
+                session.commit()
+                
+                logger.info(f"{len(created_employees)} funcionários criados com sucesso")
+                return created_employees
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Erro de banco ao criar funcionários em lote: {e}")
+            raise Exception(f"Erro de banco de dados: {str(e)}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao criar funcionários em lote: {e}")
+            raise Exception(f"Erro inesperado: {str(e)}")
+    
     async def get_employee_by_id(self, employee_id: int) -> Optional[Employee]:
         """
         Busca um funcionário pelo ID.
@@ -77,18 +122,22 @@ class EmployeeRepository(EmployeeRepositoryInterface):
         Returns:
             Optional[Employee]: O funcionário encontrado ou None
         """
+        cache_key = ("id", employee_id)
+        cached_employee = _employee_cache.get(cache_key)
+        if cached_employee is not None:
+            return cached_employee
+        
         try:
             logger.info(f"Buscando funcionário por ID: {employee_id}")
             
             with get_db_session() as session:
-                employee = session.query(Employee).options(joinedload(Employee.address)).filter(Employee.id == employee_id).first()
+                employee = session.query(Employee).filter(Employee.id == employee_id).first()
                 
                 if employee:
                     logger.info(f"Funcionário encontrado: {employee.name}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
+                    _employee_cache.put(cache_key, employee)
                 else:
                     logger.info(f"Funcionário não encontrado com ID: {employee_id}")
                 
@@ -101,13 +150,12 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.error(f"Erro inesperado ao buscar funcionário por ID {employee_id}: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
-    async def update_employee(self, employee_id: int, address: Optional[Address], employee: Employee) -> Optional[Employee]:
+    async def update_employee(self, employee_id: int, employee: Employee) -> Optional[Employee]:
         """
         Atualiza um funcionário existente.
         
         Args:
             employee_id: ID do funcionário
-            address: Dados atualizados do endereço (opcional)
             employee: Dados atualizados do funcionário
             
         Returns:
@@ -120,49 +168,37 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.info(f"Atualizando funcionário ID: {employee_id}")
             
             with get_db_session() as session:
-                # Buscar funcionário existente
-                existing_employee = session.query(Employee).filter(Employee.id == employee_id).first()
-                if not existing_employee:
+                # UPDATE direto (Core), sem carregar a entidade nem passar pelo unit of work
+                result = session.execute(
+                    update(Employee)
+                    .where(Employee.id == employee_id)
+                    .values(
+                        name=employee.name,
+                        email=employee.email,
+                        phone=employee.phone,
+                        cpf=employee.cpf,
+                        street=employee.street,
+                        city=employee.city,
+                        state=employee.state,
+                        zip_code=employee.zip_code,
+                        country=employee.country,
+                        status=employee.status
+                    )
+                )
+                if result.rowcount == 0:
                     logger.warning(f"Funcionário não encontrado para atualização. ID: {employee_id}")
                     return None
                 
-                # Atualizar endereço se fornecido
-                if address:
-                    if existing_employee.address_id:
-                        # Atualizar endereço existente
-                        existing_address = session.get(Address, existing_employee.address_id)
-                        if existing_address:
-                            existing_address.street = address.street
-                            existing_address.city = address.city
-                            existing_address.state = address.state
-                            existing_address.zip_code = address.zip_code
-                            existing_address.country = address.country
-                            logger.info(f"Endereço atualizado. ID: {existing_address.id}")
-                    else:
-                        # Criar novo endereço
-                        session.add(address)
-                        session.flush()
-                        existing_employee.address_id = address.id
-                        logger.info(f"Novo endereço criado. ID: {address.id}")
-                
-                # Atualizar dados do funcionário
-                existing_employee.name = employee.name
-                existing_employee.email = employee.email
-                existing_employee.phone = employee.phone
-                existing_employee.cpf = employee.cpf
-                existing_employee.status = employee.status
-                
                 session.commit()
                 
-                # Recarregar para ter os relacionamentos atualizados
-                session.refresh(existing_employee)
-                if existing_employee.address_id:
-                    existing_employee.address = session.get(Address, existing_employee.address_id)
+                # UPDATE via Core não dispara os eventos do mapper: invalidar o cache manualmente
+                _employee_cache.invalidate(employee_id)
                 
-                # Fazer expunge para desconectar os objetos da sessão
+                # Carregar os valores atualizados pelo banco
+                existing_employee = session.get(Employee, employee_id)
+                
+                # Fazer expunge para desconectar o objeto da sessão
                 session.expunge(existing_employee)
-                if existing_employee.address:
-                    session.expunge(existing_employee.address)
                 
                 logger.info(f"Funcionário atualizado com sucesso. ID: {employee_id}")
                 return existing_employee
@@ -202,15 +238,11 @@ class EmployeeRepository(EmployeeRepositoryInterface):
                 employee.status = status
                 session.commit()
                 
-                # Recarregar para ter os relacionamentos
+                # Recarregar para obter os valores gerados pelo banco
                 session.refresh(employee)
-                if employee.address_id:
-                    employee.address = session.get(Address, employee.address_id)
                 
-                # Fazer expunge para desconectar os objetos da sessão
+                # Fazer expunge para desconectar o objeto da sessão
                 session.expunge(employee)
-                if employee.address:
-                    session.expunge(employee.address)
                 
                 logger.info(f"Status do funcionário atualizado com sucesso. ID: {employee_id}")
                 return employee
@@ -245,7 +277,7 @@ class EmployeeRepository(EmployeeRepositoryInterface):
                     logger.warning(f"Funcionário não encontrado para remoção. ID: {employee_id}")
                     return False
                 
-                # Remover funcionário (o endereço será mantido devido ao ON DELETE SET NULL)
+                # Remover funcionário
                 session.delete(employee)
                 session.commit()
                 
@@ -275,7 +307,6 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             
             with get_db_session() as session:
                 employees = (session.query(Employee)
-                           .options(joinedload(Employee.address))
                            .offset(skip)
                            .limit(limit)
                            .all())
@@ -283,8 +314,6 @@ class EmployeeRepository(EmployeeRepositoryInterface):
                 # Fazer expunge para desconectar os objetos da sessão
                 for employee in employees:
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
                 
                 logger.info(f"Encontrados {len(employees)} funcionários")
                 return employees
@@ -296,6 +325,42 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.error(f"Erro inesperado ao buscar todos os funcionários: {e}")
             raise Exception(f"Erro inesperado: {str(e)}")
     
+    async def get_employees_after(self, cursor_id: int, limit: int = 100) -> List[Employee]:
+        """
+        Busca a próxima página de funcionários a partir de um cursor.
+        
+        Args:
+            cursor_id: Último id da página anterior (0 para a primeira página)
+            limit: Número máximo de registros para retornar
+            
+        Returns:
+            List[Employee]: Lista de funcionários encontrados
+        """
+        try:
+            logger.info(f"Buscando funcionários após o id {cursor_id}. Limit: {limit}")
+            
+            with get_db_session() as session:
+                # Range scan na PRIMARY KEY: custo constante, independente da profundidade da página
+                employees = (session.query(Employee)
+                           .filter(Employee.id > cursor_id)
+                           .order_by(Employee.id)
+                           .limit(limit)
+                           .all())
+                
+                # Fazer expunge para desconectar os objetos da sessão
+                for employee in employees:
+                    session.expunge(employee)
+                
+                logger.info(f"Encontrados {len(employees)} funcionários")
+                return employees
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Erro de banco ao buscar funcionários após o id {cursor_id}: {e}")
+            raise Exception(f"Erro de banco de dados: {str(e)}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao buscar funcionários após o id {cursor_id}: {e}")
+            raise Exception(f"Erro inesperado: {str(e)}")
+    
     async def get_employee_by_email(self, email: str) -> Optional[Employee]:
         """
         Busca um funcionário pelo email.
@@ -310,14 +375,12 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.info(f"Buscando funcionário por email: {email}")
             
             with get_db_session() as session:
-                employee = session.query(Employee).options(joinedload(Employee.address)).filter(Employee.email == email).first()
+                employee = session.query(Employee).filter(Employee.email == email).first()
                 
                 if employee:
                     logger.info(f"Funcionário encontrado com email: {email}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
                 else:
                     logger.info(f"Funcionário não encontrado com email: {email}")
                 
@@ -344,14 +407,12 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.info(f"Buscando funcionário por CPF: {cpf}")
             
             with get_db_session() as session:
-                employee = session.query(Employee).options(joinedload(Employee.address)).filter(Employee.cpf == cpf).first()
+                employee = session.query(Employee).filter(Employee.cpf == cpf).first()
                 
                 if employee:
                     logger.info(f"Funcionário encontrado com CPF: {cpf}")
-                    # Fazer expunge para desconectar os objetos da sessão
+                    # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
                 else:
                     logger.info(f"Funcionário não encontrado com CPF: {cpf}")
                 
@@ -381,8 +442,7 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             
             with get_db_session() as session:
                 employees = (session.query(Employee)
-                           .options(joinedload(Employee.address))
-                           .filter(Employee.name.contains(name))
+                           .filter(name_contains_filter(Employee.name, name))
                            .offset(skip)
                            .limit(limit)
                            .all())
@@ -390,8 +450,6 @@ class EmployeeRepository(EmployeeRepositoryInterface):
                 # Fazer expunge para desconectar os objetos da sessão
                 for employee in employees:
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
                 
                 logger.info(f"Encontrados {len(employees)} funcionários com nome contendo '{name}'")
                 return employees
@@ -419,9 +477,11 @@ class EmployeeRepository(EmployeeRepositoryInterface):
             logger.info(f"Buscando funcionários por status: {status}")
             
             with get_db_session() as session:
+                # ix_employees_status guarda (status, id) no InnoDB: filtro e ordenação
+                # saem do índice, sem filesort, e a paginação fica determinística
                 employees = (session.query(Employee)
-                           .options(joinedload(Employee.address))
                            .filter(Employee.status == status)
+                           .order_by(Employee.id)
                            .offset(skip)
                            .limit(limit)
                            .all())
@@ -429,8 +489,6 @@ class EmployeeRepository(EmployeeRepositoryInterface):
                 # Fazer expunge para desconectar os objetos da sessão
                 for employee in employees:
                     session.expunge(employee)
-                    if employee.address:
-                        session.expunge(employee.address)
                 
                 logger.info(f"Encontrados {len(employees)} funcionários com status '{status}'")
                 return employees
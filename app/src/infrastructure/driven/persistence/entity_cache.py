@@ -0,0 +1,85 @@
+"""
+Cache em memória (por processo) para buscas pontuais de entidades muito lidas
+"""
+
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Hashable, Optional
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+class EntityCache:
+    """
+    Cache LRU com TTL de entidades, indexado por chaves de busca (ex.: ("email", valor)).
+
+    Armazena apenas o dicionário de colunas (nunca o estado do ORM) e devolve
+    a cada acerto uma nova instância desanexada, então quem a recebe pode
+    alterá-la sem afetar o cache. A invalidação acontece nos eventos
+    after_update/after_delete do mapper; o TTL limita a defasagem entre processos.
+    """
+
+    def __init__(self, entity_cls: type, ttl_seconds: float, max_size: int):
+        self._entity_cls = entity_cls
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+
+        event.listen(entity_cls, "after_update", self._on_change)
+        event.listen(entity_cls, "after_delete", self._on_change)
+
+    # Metadados do mapper lidos só no primeiro uso: o cache é criado no import dos
+    # repositórios, antes de todas as entidades relacionadas estarem registradas, e
+    # column_attrs força a configuração de todos os mappers
+    @cached_property
+    def _mapper(self):
+        return inspect(self._entity_cls)
+
+    @cached_property
+    def _column_keys(self) -> tuple:
+        return tuple(attr.key for attr in self._mapper.column_attrs)
+
+    @cached_property
+    def _pk_key(self) -> str:
+        return self._mapper.primary_key[0].key
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna uma cópia desanexada da entidade ou None se ausente/expirada."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, values = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return self._build_entity(values)
+
+    def put(self, key: Hashable, entity: Any) -> None:
+        """Guarda os valores de colunas da entidade sob a chave informada."""
+        values = {column_key: getattr(entity, column_key) for column_key in self._column_keys}
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, values)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, pk: Any) -> None:
+        """Remove todas as chaves que apontam para a entidade com a PK informada."""
+        stale_keys = [key for key, (_, values) in self._entries.items() if values[self._pk_key] == pk]
+        for key in stale_keys:
+            del self._entries[key]
+
+    def _on_change(self, mapper, connection, target) -> None:
+        self.invalidate(getattr(target, self._pk_key))
+
+    def _build_entity(self, values: dict) -> Any:
+        entity = self._mapper.class_manager.new_instance()
+        for column_key, value in values.items():
+            set_committed_value(entity, column_key, value)
+        make_transient_to_detached(entity)
+        return entity
@@ -1,15 +1,24 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime
 from app.src.domain.entities.message_model import Message
 from app.src.domain.ports.message_repository import MessageRepository
-from app.src.infrastructure.driven.database.connection_mysql import get_session_factory
+from app.src.domain.exceptions import NotFoundError
+from app.src.infrastructure.driven.database.connection_mysql import get_session_factory, run_in_thread
 
 class MessageRepositoryImpl(MessageRepository):
     
     def __init__(self):
-        self.session_factory = get_session_factory()
+        pass
     
+    @property
+    def session_factory(self):
+        # Resolvido no primeiro uso: o repositório pode ser criado na importação
+        # das rotas sem abrir conexão com o banco
+        return get_session_factory()
+    
+    @run_in_thread
     def create(self, message: Message) -> Message:
         """Criar uma nova mensagem"""
         session: Session = self.session_factory()
@@ -24,6 +33,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def find_by_id(self, message_id: int) -> Optional[Message]:
         """Buscar mensagem por ID"""
         session: Session = self.session_factory()
@@ -36,6 +46,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def find_all_with_filters(
         self, 
         status: Optional[str] = None,
@@ -47,17 +58,7 @@ class MessageRepositoryImpl(MessageRepository):
         """Buscar mensagens com filtros opcionais"""
         session: Session = self.session_factory()
         try:
-            query = session.query(Message)
-            
-            # Aplicar filtros se fornecidos
-            if status:
-                query = query.filter(Message.status == status)
-            
-            if responsible_id:
-                query = query.filter(Message.responsible_id == responsible_id)
-            
-            if vehicle_id:
-                query = query.filter(Message.vehicle_id == vehicle_id)
+            query = self._apply_filters(session.query(Message), status, responsible_id, vehicle_id)
             
             # Ordenar por data de criação (mais recentes primeiro)
             query = query.order_by(Message.created_at.desc())
@@ -74,6 +75,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def update(self, message: Message) -> Message:
         """Atualizar uma mensagem"""
         session: Session = self.session_factory()
@@ -82,7 +84,7 @@ class MessageRepositoryImpl(MessageRepository):
             existing_message = session.query(Message).filter(Message.id == message.id).first()
             
             if not existing_message:
-                raise ValueError(f"Mensagem com ID {message.id} não encontrada")
+                raise NotFoundError(f"Mensagem com ID {message.id} não encontrada")
             
             # Atualizar os campos da mensagem existente
             existing_message.responsible_id = message.responsible_id
@@ -105,6 +107,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def update_by_id(self, message_id: int, updates: Dict[str, Any]) -> Message:
         """Atualizar uma mensagem por ID com campos específicos"""
         session: Session = self.session_factory()
@@ -113,7 +116,7 @@ class MessageRepositoryImpl(MessageRepository):
             message = session.query(Message).filter(Message.id == message_id).first()
             
             if not message:
-                raise ValueError(f"Mensagem com ID {message_id} não encontrada")
+                raise NotFoundError(f"Mensagem com ID {message_id} não encontrada")
             
             # Aplicar as atualizações
             for field, value in updates.items():
@@ -133,6 +136,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def delete(self, message_id: int) -> bool:
         """Deletar uma mensagem"""
         session: Session = self.session_factory()
@@ -149,6 +153,7 @@ class MessageRepositoryImpl(MessageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def count_with_filters(
         self,
         status: Optional[str] = None,
@@ -158,18 +163,87 @@ class MessageRepositoryImpl(MessageRepository):
         """Contar mensagens com filtros"""
         session: Session = self.session_factory()
         try:
-            query = session.query(Message)
+            query = self._apply_filters(session.query(Message), status, responsible_id, vehicle_id)
+            return query.count()
+            
+        finally:
+            session.close()
+    
+    @run_in_thread
+    def find_page_with_filters(
+        self,
+        status: Optional[str] = None,
+        responsible_id: Optional[int] = None,
+        vehicle_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[Message], int]:
+        """Buscar uma página de mensagens e o total filtrado em uma única consulta"""
+        session: Session = self.session_factory()
+        try:
+            # COUNT(*) OVER() é calculado sobre todas as linhas filtradas, antes do LIMIT
+            query = self._apply_filters(
+                session.query(Message, func.count().over().label("total")),
+                status, responsible_id, vehicle_id
+            )
+            # Mesma ordem da paginação por cursor (id DESC): o X-Next-Cursor de uma página
+            # por offset continua exatamente de onde ela parou
+            rows = query.order_by(Message.id.desc()).offset(offset).limit(limit).all()
+            
+            if rows:
+                total = rows[0].total
+            elif offset == 0:
+                total = 0
+            else:
+                # Página além do fim: sem linhas não há total, então contar à parte
+                total = self._apply_filters(session.query(Message), status, responsible_id, vehicle_id).count()
+            
+            messages = [row.Message for row in rows]
+            for message in messages:
+                session.expunge(message)
             
-            if status:
-                query = query.filter(Message.status == status)
+            return messages, total
             
-            if responsible_id:
-                query = query.filter(Message.responsible_id == responsible_id)
+        finally:
+            session.close()
+    
+    @run_in_thread
+    def find_before_id_with_filters(
+        self,
+        before_id: Optional[int] = None,
+        status: Optional[str] = None,
+        responsible_id: Optional[int] = None,
+        vehicle_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Message]:
+        """Buscar a próxima página de mensagens por cursor, sem OFFSET e sem contagem"""
+        session: Session = self.session_factory()
+        try:
+            query = self._apply_filters(session.query(Message), status, responsible_id, vehicle_id)
+            if before_id is not None:
+                query = query.filter(Message.id < before_id)
             
-            if vehicle_id:
-                query = query.filter(Message.vehicle_id == vehicle_id)
+            # id cresce com created_at, então id DESC mantém "mais recentes primeiro"
+            # e a busca continua do cursor por um intervalo da PRIMARY KEY
+            messages = query.order_by(Message.id.desc()).limit(limit).all()
+            for message in messages:
+                session.expunge(message)
             
-            return query.count()
+            return messages
             
         finally:
             session.close()
+    
+    @staticmethod
+    def _apply_filters(query, status: Optional[str], responsible_id: Optional[int], vehicle_id: Optional[int]):
+        """Aplicar os filtros opcionais de listagem/contagem de mensagens"""
+        if status:
+            query = query.filter(Message.status == status)
+        
+        if responsible_id:
+            query = query.filter(Message.responsible_id == responsible_id)
+        
+        if vehicle_id:
+            query = query.filter(Message.vehicle_id == vehicle_id)
+        
+        return query
@@ -1,11 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload, contains_eager
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, desc, asc
+from sqlalchemy import and_, desc, asc, insert
 from typing import Optional, List
 from app.src.domain.ports.motorcycle_repository import MotorcycleRepositoryInterface
 from app.src.domain.entities.motorcycle_model import Motorcycle
 from app.src.domain.entities.motor_vehicle_model import MotorVehicle
 from app.src.infrastructure.driven.database.connection_mysql import get_db_session
+from app.src.infrastructure.driven.persistence.persistence_utils import column_values, database_now
 from decimal import Decimal
 import logging
 
@@ -24,31 +26,30 @@ class MotorcycleRepository(MotorcycleRepositoryInterface):
     async def create_motorcycle(self, motor_vehicle: MotorVehicle, motorcycle: Motorcycle) -> Motorcycle:
         """
         Cria uma nova moto no banco de dados.
-        Primeiro insere o motor_vehicle, depois a motorcycle com o ID gerado.
+        Executa dois INSERTs diretos (motor_vehicle e motorcycle) na mesma transação,
+        sem flush/refresh do ORM.
         """
         try:
             with get_db_session() as session:
-                # Primeiro, insere o motor_vehicle
-                session.add(motor_vehicle)
-                session.flush()  # Para obter o ID gerado
+                # Timestamps definidos aqui (relógio do banco) para não precisar recarregar as linhas após o INSERT
+                now = database_now(session)
+                motor_vehicle.created_at = now
+                motor_vehicle.updated_at = now
+                motorcycle.updated_at = now
                 
-                # Agora usa o ID gerado para criar a motorcycle
+                # INSERT do motor_vehicle; o ID gerado vem do próprio resultado (lastrowid)
+                result = session.execute(insert(MotorVehicle).values(**column_values(motor_vehicle)))
+                motor_vehicle.id = result.inserted_primary_key[0]
+                
+                # INSERT da motorcycle com o ID gerado, na mesma transação
                 motorcycle.vehicle_id = motor_vehicle.id
-                session.add(motorcycle)
+                session.execute(insert(Motorcycle).values(**column_values(motorcycle)))
                 
                 session.commit()
                 
-                # Refresh para obter todos os dados atualizados
-                session.refresh(motor_vehicle)
-                session.refresh(motorcycle)
-                
-                # Eager load do relacionamento para evitar lazy loading após o fechamento da sessão
+                # As entidades não foram adicionadas à sessão, então já estão desconectadas
                 motorcycle.motor_vehicle = motor_vehicle
                 
-                # Fazer expunge para desconectar os objetos da sessão
-                session.expunge(motor_vehicle)
-                session.expunge(motorcycle)
-                
                 logger.info(f"Moto criada com sucesso. ID: {motor_vehicle.id}")
                 return motorcycle
                 
@@ -65,14 +66,13 @@ class MotorcycleRepository(MotorcycleRepositoryInterface):
         """
         try:
             with get_db_session() as session:
-                motorcycle = session.query(Motorcycle).filter(Motorcycle.vehicle_id == motorcycle_id).first()
+                motorcycle = (session.query(Motorcycle)
+                       .options(selectinload(Motorcycle.motor_vehicle).undefer(MotorVehicle.additional_description))
+                       .filter(Motorcycle.vehicle_id == motorcycle_id)
+                       .first())
                 if motorcycle:
-                    # Carregar o motor_vehicle relacionado
-                    motor_vehicle = session.query(MotorVehicle).filter(MotorVehicle.id == motorcycle_id).first()
-                    motorcycle.motor_vehicle = motor_vehicle
-                    
                     # Fazer expunge para desconectar os objetos da sessão
-                    session.expunge(motor_vehicle)
+                    session.expunge(motorcycle.motor_vehicle)
                     session.expunge(motorcycle)
                     
                 return motorcycle
@@ -120,6 +120,8 @@ class MotorcycleRepository(MotorcycleRepositoryInterface):
                 session.commit()
                 session.refresh(existing_motorcycle)
                 session.refresh(existing_motor_vehicle)
+                # refresh não carrega colunas adiadas; o valor é o que acabou de ser gravado
+                set_committed_value(existing_motor_vehicle, 'additional_description', motor_vehicle.additional_description)
                 
                 # Associar o motor_vehicle à motorcycle
                 existing_motorcycle.motor_vehicle = existing_motor_vehicle
@@ -234,7 +236,11 @@ class MotorcycleRepository(MotorcycleRepositoryInterface):
             
             with get_db_session() as session:
                 # Query base juntando as tabelas
-                query = session.query(Motorcycle).join(MotorVehicle)
+                # contains_eager reaproveita o JOIN para popular motor_vehicle na mesma query
+                query = (session.query(Motorcycle)
+                         .join(Motorcycle.motor_vehicle)
+                         .options(contains_eager(Motorcycle.motor_vehicle)
+                                  .undefer(MotorVehicle.additional_description)))
                 
                 # Aplicar filtros condicionalmente
                 filters = []
@@ -258,11 +264,7 @@ class MotorcycleRepository(MotorcycleRepositoryInterface):
                 # Aplicar paginação
                 motorcycles = query.offset(skip).limit(limit).all()
                 
-                # Carregar eager load dos relacionamentos para evitar lazy loading
                 for motorcycle in motorcycles:
-                    # Forçar o carregamento do motor_vehicle
-                    _ = motorcycle.motor_vehicle.model
-                    
                     # Fazer expunge para desconectar os objetos da sessão
                     session.expunge(motorcycle.motor_vehicle)
                     session.expunge(motorcycle)
@@ -0,0 +1,27 @@
+"""
+Filtro de busca parcial por nome sobre índices FULLTEXT com parser ngram
+"""
+
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql.elements import ColumnElement
+
+# Tamanho dos tokens do parser ngram do MySQL (ngram_token_size padrão)
+NGRAM_TOKEN_SIZE = 2
+
+
+def name_contains_filter(column, name: str) -> ColumnElement:
+    """
+    Condição equivalente a "coluna contém o termo", resolvida pelo índice FULLTEXT ngram.
+
+    O termo entre aspas no modo booleano casa a sequência contígua de ngrams, ou seja,
+    o termo como substring da coluna. Termos menores que um token não estão no índice
+    e usam LIKE. O índice precisa ter sido criado sem stopwords (ver migrations/schema_008).
+
+    Args:
+        column: Coluna com índice FULLTEXT ngram (ex: Employee.name)
+        name: Nome ou parte do nome buscado
+    """
+    term = name.strip().replace('"', '')
+    if len(term) >= NGRAM_TOKEN_SIZE:
+        return match(column, against=f'"{term}"').in_boolean_mode()
+    return column.contains(term)
@@ -0,0 +1,29 @@
+"""
+Auxiliares compartilhados pelos repositórios que inserem entidades via Core
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session
+
+
+def column_values(entity) -> dict:
+    """
+    Extrai os valores de colunas já definidos em uma entidade ainda não persistida.
+    """
+    return {
+        attr.key: entity.__dict__[attr.key]
+        for attr in inspect(type(entity)).column_attrs
+        if attr.key in entity.__dict__
+    }
+
+
+def database_now(session: Session) -> datetime:
+    """
+    Horário atual do banco (CURRENT_TIMESTAMP), o mesmo relógio dos defaults das colunas.
+
+    Usado quando os timestamps precisam ser conhecidos antes do INSERT, para não
+    recarregar as linhas depois; evita misturar o horário local da aplicação com o do MySQL.
+    """
+    return session.execute(select(func.current_timestamp())).scalar_one()
@@ -1,5 +1,5 @@
 from typing import Optional, List
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import selectinload
 from sqlalchemy import and_, or_, desc, asc
 from app.src.domain.ports.sale_repository import SaleRepositoryInterface
 from app.src.domain.entities.sale_model import Sale
@@ -16,7 +16,13 @@ class SaleRepositoryImpl(SaleRepositoryInterface):
     """
 
     def __init__(self):
-        self.session_factory = get_session_factory()
+        pass
+    
+    @property
+    def session_factory(self):
+        # Resolvido no primeiro uso: o repositório pode ser criado na importação
+        # das rotas sem abrir conexão com o banco
+        return get_session_factory()
 
     def _apply_value_ordering(self, query, order_by_value: Optional[str]):
         """
@@ -1,13 +1,18 @@
-from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional
 from app.src.domain.entities.user_model import User
 from app.src.domain.ports.user_repository import UserRepositoryInterface
 from app.src.infrastructure.driven.database.connection_mysql import get_db_session
+from app.src.infrastructure.driven.persistence.entity_cache import EntityCache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache das buscas por ID/email (executadas em toda requisição autenticada)
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 10_000
+_user_cache = EntityCache(User, ttl_seconds=USER_CACHE_TTL_SECONDS, max_size=USER_CACHE_MAX_SIZE)
+
 
 class UserRepositoryImpl(UserRepositoryInterface):
     """
@@ -45,12 +50,18 @@ class UserRepositoryImpl(UserRepositoryInterface):
         """
         Busca um usuário pelo ID.
         """
+        cache_key = ("id", user_id)
+        cached_user = _user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        
         try:
             with get_db_session() as session:
                 user = session.query(User).filter(User.id == user_id).first()
                 if user:
                     # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(user)
+                    _user_cache.put(cache_key, user)
                     
                 return user
                 
@@ -65,12 +76,18 @@ class UserRepositoryImpl(UserRepositoryInterface):
         """
         Busca um usuário pelo email.
         """
+        cache_key = ("email", email)
+        cached_user = _user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        
         try:
             with get_db_session() as session:
                 user = session.query(User).filter(User.email == email).first()
                 if user:
                     # Fazer expunge para desconectar o objeto da sessão
                     session.expunge(user)
+                    _user_cache.put(cache_key, user)
                     
                 return user
                 
@@ -99,6 +116,9 @@ class UserRepositoryImpl(UserRepositoryInterface):
                 existing_user.employee_id = user.employee_id
                 
                 session.commit()
+                # Invalidar também após o commit: uma leitura entre o flush e o commit
+                # poderia ter recolocado no cache a versão antiga
+                _user_cache.invalidate(user_id)
                 session.refresh(existing_user)
                 
                 # Fazer expunge para desconectar o objeto da sessão
@@ -126,6 +146,7 @@ class UserRepositoryImpl(UserRepositoryInterface):
                 
                 session.delete(user)
                 session.commit()
+                _user_cache.invalidate(user_id)
                 
                 logger.info(f"Usuário deletado com sucesso. ID: {user_id}")
                 return True
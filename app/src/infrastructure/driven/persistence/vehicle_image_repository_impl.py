@@ -1,15 +1,22 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.src.domain.entities.vehicle_image_model import VehicleImage
+from sqlalchemy import insert, select, text
+from app.src.domain.entities.vehicle_image_model import VehicleImage, VehicleImageSummary
 from app.src.domain.ports.vehicle_image_repository import VehicleImageRepository
-from app.src.infrastructure.driven.database.connection_mysql import get_session_factory
+from app.src.infrastructure.driven.database.connection_mysql import get_session_factory, run_in_thread
 
 class VehicleImageRepositoryImpl(VehicleImageRepository):
     
     def __init__(self):
-        self.session_factory = get_session_factory()
+        pass
     
+    @property
+    def session_factory(self):
+        # Resolvido no primeiro uso: o repositório pode ser criado na importação
+        # das rotas sem abrir conexão com o banco
+        return get_session_factory()
+    
+    @run_in_thread
     def create(self, vehicle_image: VehicleImage) -> VehicleImage:
         """Criar uma nova imagem de veículo"""
         session: Session = self.session_factory()
@@ -24,23 +31,90 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
-    def find_by_vehicle_id(self, vehicle_id: int) -> List[VehicleImage]:
-        """Buscar todas as imagens de um veículo ordenadas por position"""
+    @run_in_thread
+    def create_many(self, vehicle_images: List[VehicleImage]) -> List[VehicleImage]:
+        """Criar várias imagens de veículo com um único INSERT multi-linhas"""
+        if not vehicle_images:
+            return vehicle_images
+        
         session: Session = self.session_factory()
         try:
-            images = session.query(VehicleImage)\
-                .filter(VehicleImage.vehicle_id == vehicle_id)\
-                .order_by(VehicleImage.position.asc())\
-                .all()
+            # Bulk INSERT do ORM: um executemany (VALUES múltiplos no driver) em vez
+            # de um INSERT por imagem para obter o lastrowid de cada linha
+            session.execute(insert(VehicleImage), [
+                {
+                    "vehicle_id": vehicle_image.vehicle_id,
+                    "filename": vehicle_image.filename,
+                    "path": vehicle_image.path,
+                    "thumbnail_path": vehicle_image.thumbnail_path,
+                    "position": vehicle_image.position,
+                    "is_primary": vehicle_image.is_primary,
+                }
+                for vehicle_image in vehicle_images
+            ])
             
-            # Expunge para evitar problemas de sessão
-            for image in images:
-                session.expunge(image)
+            # MySQL não tem RETURNING: recuperar ids e uploaded_at pela chave única (vehicle_id, position)
+            vehicle_ids = {vehicle_image.vehicle_id for vehicle_image in vehicle_images}
+            positions = {vehicle_image.position for vehicle_image in vehicle_images}
+            generated = {
+                (row.vehicle_id, row.position): row
+                for row in session.execute(
+                    select(VehicleImage.vehicle_id, VehicleImage.position,
+                           VehicleImage.id, VehicleImage.uploaded_at)
+                    .where(VehicleImage.vehicle_id.in_(vehicle_ids),
+                           VehicleImage.position.in_(positions))
+                )
+            }
+            session.commit()
             
-            return images
+            for vehicle_image in vehicle_images:
+                row = generated[(vehicle_image.vehicle_id, vehicle_image.position)]
+                vehicle_image.id = row.id
+                vehicle_image.uploaded_at = row.uploaded_at
+            return vehicle_images
+        except Exception as e:
+            session.rollback()
+            raise e
         finally:
             session.close()
     
+    @run_in_thread
+    def find_by_vehicle_id(self, vehicle_id: int) -> List[VehicleImageSummary]:
+        """Buscar todas as imagens de um veículo ordenadas por position (resumos somente leitura)"""
+        session: Session = self.session_factory()
+        try:
+            # Galeria é só leitura: colunas avulsas evitam instanciar entidades do ORM
+            rows = session.execute(
+                select(*VehicleImage.summary_columns())
+                .where(VehicleImage.vehicle_id == vehicle_id)
+                .order_by(VehicleImage.position.asc())
+            )
+            return [VehicleImageSummary._make(row) for row in rows]
+        finally:
+            session.close()
+    
+    @run_in_thread
+    def find_by_vehicle_ids(self, vehicle_ids: List[int]) -> Dict[int, List[VehicleImageSummary]]:
+        """Buscar as imagens de vários veículos em uma consulta, agrupadas por vehicle_id e ordenadas por position"""
+        images_by_vehicle: Dict[int, List[VehicleImageSummary]] = {vehicle_id: [] for vehicle_id in vehicle_ids}
+        if not vehicle_ids:
+            return images_by_vehicle
+        
+        session: Session = self.session_factory()
+        try:
+            rows = session.execute(
+                select(*VehicleImage.summary_columns())
+                .where(VehicleImage.vehicle_id.in_(vehicle_ids))
+                .order_by(VehicleImage.vehicle_id, VehicleImage.position.asc())
+            )
+            for row in rows:
+                image = VehicleImageSummary._make(row)
+                images_by_vehicle[image.vehicle_id].append(image)
+            return images_by_vehicle
+        finally:
+            session.close()
+    
+    @run_in_thread
     def find_by_id(self, image_id: int) -> Optional[VehicleImage]:
         """Buscar imagem por ID"""
         session: Session = self.session_factory()
@@ -52,6 +126,7 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def count_by_vehicle_id(self, vehicle_id: int) -> int:
         """Contar quantas imagens um veículo possui"""
         session: Session = self.session_factory()
@@ -62,6 +137,7 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def delete_by_id(self, image_id: int) -> bool:
         """Deletar uma imagem por ID"""
         session: Session = self.session_factory()
@@ -78,6 +154,7 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def delete_by_vehicle_id(self, vehicle_id: int) -> bool:
         """Deletar todas as imagens de um veículo"""
         session: Session = self.session_factory()
@@ -93,14 +170,31 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def update_positions(self, vehicle_id: int, positions: List[tuple]) -> bool:
         """Atualizar posições das imagens: [(image_id, new_position), ...]"""
+        if not positions:
+            return True
+        
         session: Session = self.session_factory()
         try:
-            for image_id, new_position in positions:
-                session.query(VehicleImage)\
-                    .filter(VehicleImage.id == image_id, VehicleImage.vehicle_id == vehicle_id)\
-                    .update({VehicleImage.position: new_position})
+            # Um único UPDATE com CASE em vez de um UPDATE por imagem.
+            # ORDER BY position evita colisão na chave única (vehicle_id, position)
+            # quando as posições são compactadas para baixo.
+            params = {"vehicle_id": vehicle_id}
+            when_clauses = []
+            for index, (image_id, new_position) in enumerate(positions):
+                params[f"id_{index}"] = image_id
+                params[f"position_{index}"] = new_position
+                when_clauses.append(f"WHEN :id_{index} THEN :position_{index}")
+            id_list = ", ".join(f":id_{index}" for index in range(len(positions)))
+            
+            session.execute(text(
+                f"UPDATE {VehicleImage.__tablename__} "
+                f"SET position = CASE id {' '.join(when_clauses)} END "
+                f"WHERE vehicle_id = :vehicle_id AND id IN ({id_list}) "
+                f"ORDER BY position"
+            ), params)
             
             session.commit()
             return True
@@ -110,22 +204,34 @@ class VehicleImageRepositoryImpl(VehicleImageRepository):
         finally:
             session.close()
     
+    @run_in_thread
     def set_primary_image(self, vehicle_id: int, image_id: int) -> bool:
         """Definir uma imagem como principal"""
         session: Session = self.session_factory()
         try:
-            # Primeiro, remover primary de todas as imagens do veículo
-            session.query(VehicleImage)\
-                .filter(VehicleImage.vehicle_id == vehicle_id)\
-                .update({VehicleImage.is_primary: False})
+            # Um único UPDATE troca a principal: só a principal atual e a nova são tocadas.
+            # ORDER BY is_primary DESC desmarca a atual antes de marcar a nova, evitando
+            # colisão no índice único de imagem principal por veículo.
+            matched = session.execute(text(
+                f"UPDATE {VehicleImage.__tablename__} "
+                f"SET is_primary = (id = :image_id) "
+                f"WHERE vehicle_id = :vehicle_id AND (is_primary OR id = :image_id) "
+                f"ORDER BY is_primary DESC"
+            ), {"vehicle_id": vehicle_id, "image_id": image_id}).rowcount
             
-            # Depois, definir a imagem específica como primary
-            updated = session.query(VehicleImage)\
-                .filter(VehicleImage.id == image_id, VehicleImage.vehicle_id == vehicle_id)\
-                .update({VehicleImage.is_primary: True})
+            # Com duas linhas casadas a imagem existe; com uma, pode ter sido apenas a
+            # principal antiga (imagem de outro veículo/inexistente), então confirmar
+            if matched < 2:
+                exists = session.execute(
+                    select(VehicleImage.id)
+                    .where(VehicleImage.id == image_id, VehicleImage.vehicle_id == vehicle_id)
+                ).first() is not None
+                if not exists:
+                    session.rollback()
+                    return False
             
             session.commit()
-            return updated > 0
+            return True
         except Exception as e:
             session.rollback()
             raise e
@@ -0,0 +1,27 @@
+"""
+Módulo para atualização periódica do cache em memória da blacklist de tokens
+"""
+
+import asyncio
+from app.src.infrastructure.driven.persistence.user_repository_impl import UserRepositoryImpl
+from app.src.infrastructure.driven.persistence.blacklisted_token_repository_impl import BlacklistedTokenRepositoryImpl
+from app.src.application.services.user_service import UserService, BLACKLIST_REFRESH_INTERVAL_SECONDS
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_blacklist_cache_periodically():
+    """
+    Recarrega o cache da blacklist a cada BLACKLIST_REFRESH_INTERVAL_SECONDS.
+    Esta função roda como tarefa em segundo plano durante a vida da aplicação.
+    """
+    user_service = UserService(UserRepositoryImpl(), BlacklistedTokenRepositoryImpl())
+
+    while True:
+        try:
+            await user_service.refresh_blacklist_cache()
+        except Exception as e:
+            logger.error(f"❌ Erro ao atualizar cache da blacklist: {str(e)}")
+
+        await asyncio.sleep(BLACKLIST_REFRESH_INTERVAL_SECONDS)
@@ -0,0 +1,22 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.src.application.dtos.user_dto import UserResponseDto
+from app.src.infrastructure.adapters.driving.api.auth_dependencies import get_current_admin_or_vendedor_user
+
+
+def _fake_admin() -> UserResponseDto:
+    return UserResponseDto(id=1, email="admin@carsales.com", role="Administrador")
+
+
+@pytest.fixture
+def api_client():
+    """
+    Cliente HTTP da aplicação com usuário autenticado fixo.
+
+    O lifespan não é executado (sem banco nem tarefas em segundo plano) e erros
+    internos viram resposta 500 em vez de serem relançados no teste.
+    """
+    app.dependency_overrides[get_current_admin_or_vendedor_user] = _fake_admin
+    yield TestClient(app, raise_server_exceptions=False)
+    app.dependency_overrides.clear()
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_application_imports_in_a_fresh_interpreter():
+    # Processo novo: no processo do pytest o conftest já importou app.main e
+    # registrou todas as entidades, o que esconderia problemas de ordem de import
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.main"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,31 @@
+import pytest
+from fastapi import APIRouter
+from app.main import app
+from app.src.infrastructure.adapters.driving.api.application_routes import ensure_unique_routes
+
+
+def _noop():
+    return None
+
+
+def test_application_registers_each_route_once():
+    ensure_unique_routes(app.routes)
+
+
+def test_same_path_with_other_methods_is_not_a_duplicate():
+    router = APIRouter()
+    router.add_api_route("/items", _noop, methods=["GET"])
+    router.add_api_route("/items", _noop, methods=["POST"])
+
+    ensure_unique_routes(router.routes)
+
+
+def test_router_included_twice_is_rejected():
+    sub_router = APIRouter(prefix="/items")
+    sub_router.add_api_route("/", _noop, methods=["GET"])
+    router = APIRouter()
+    router.include_router(sub_router)
+    router.include_router(sub_router)
+
+    with pytest.raises(RuntimeError, match="/items/"):
+        ensure_unique_routes(router.routes)
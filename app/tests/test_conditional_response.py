@@ -0,0 +1,65 @@
+from datetime import datetime
+import pytest
+from app.main import app
+from app.src.application.services.client_service import ClientService
+from app.src.domain.entities.client_model import Client
+from app.src.infrastructure.adapters.driving.api.client_routes import get_client_service
+
+
+class SingleClientRepository:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client_by_id(self, client_id):
+        return self.client if client_id == self.client.id else None
+
+
+@pytest.fixture
+def stored_client(api_client):
+    client = Client(name="Ana Souza", email="ana@email.com", cpf="123.456.789-00", city="Curitiba")
+    client.id = 1
+    client.created_at = client.updated_at = datetime(2024, 1, 1, 10, 0)
+    app.dependency_overrides[get_client_service] = lambda: ClientService(SingleClientRepository(client))
+    return client
+
+
+def test_detail_response_carries_etag(api_client, stored_client):
+    response = api_client.get("/api/clients/1")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.json()["name"] == "Ana Souza"
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"outro", {etag}',
+    "*",
+])
+def test_matching_if_none_match_returns_empty_304(api_client, stored_client, if_none_match):
+    etag = api_client.get("/api/clients/1").headers["ETag"]
+
+    response = api_client.get("/api/clients/1", headers={"If-None-Match": if_none_match.format(etag=etag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_changed_entity_gets_new_etag(api_client, stored_client):
+    etag = api_client.get("/api/clients/1").headers["ETag"]
+    stored_client.phone = "(41) 99999-0000"
+
+    response = api_client.get("/api/clients/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["phone"] == "(41) 99999-0000"
+
+
+def test_unknown_entity_is_404_even_with_if_none_match(api_client, stored_client):
+    response = api_client.get("/api/clients/2", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
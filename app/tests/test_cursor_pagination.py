@@ -0,0 +1,83 @@
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from app.src.application.services.client_service import ClientService
+from app.src.application.services.message_service import MessageService
+from app.src.domain.entities.client_model import ClientSummary
+from app.main import app
+from app.src.infrastructure.adapters.driving.api.client_routes import get_client_service
+from app.src.infrastructure.adapters.driving.api.message_routes import get_message_service
+
+
+class InMemoryClientRepository:
+    def __init__(self, ids):
+        self.rows = [ClientSummary(i, f"Cliente {i}", f"c{i}@email.com", None, f"{i:011d}", None) for i in ids]
+
+    async def get_clients_after(self, cursor_id, limit):
+        return [row for row in self.rows if row.id > cursor_id][:limit]
+
+
+class InMemoryMessageRepository:
+    def __init__(self, ids):
+        now = datetime(2024, 1, 1)
+        self.rows = sorted(
+            (
+                SimpleNamespace(
+                    id=i, responsible_id=None, vehicle_id=None, name=f"Contato {i}", email=f"m{i}@email.com",
+                    phone=None, message="Olá", status="Pendente", service_start_time=None,
+                    created_at=now, updated_at=now
+                )
+                for i in ids
+            ),
+            key=lambda row: row.id,
+            reverse=True
+        )
+
+    async def find_page_with_filters(self, status=None, responsible_id=None, vehicle_id=None, limit=100, offset=0):
+        return self.rows[offset:offset + limit], len(self.rows)
+
+    async def find_before_id_with_filters(self, before_id=None, status=None, responsible_id=None, vehicle_id=None, limit=100):
+        return [row for row in self.rows if before_id is None or row.id < before_id][:limit]
+
+
+def _walk(api_client, url, params, items_of):
+    """Percorre as páginas seguindo X-Next-Cursor e devolve os ids na ordem recebida."""
+    seen = []
+    while True:
+        response = api_client.get(url, params=params)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in items_of(response.json()))
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            return seen
+        params = {**params, "cursor": next_cursor}
+        params.pop("page", None)
+
+
+# Ids com lacunas (registros removidos) e total múltiplo do limite, o caso em que a
+# última página cheia ainda emite o cabeçalho e a seguinte vem vazia
+@pytest.mark.parametrize("ids", [[1, 2, 3, 5, 8, 13, 21], [2, 4, 6, 8, 10, 12]])
+def test_client_cursor_visits_every_client_once_in_order(api_client, ids):
+    app.dependency_overrides[get_client_service] = lambda: ClientService(InMemoryClientRepository(ids))
+
+    seen = _walk(api_client, "/api/clients/", {"cursor": 0, "limit": 3}, lambda body: body)
+
+    assert seen == ids
+
+
+@pytest.mark.parametrize("ids", [[1, 2, 3, 5, 8, 13, 21], [2, 4, 6, 8, 10, 12]])
+def test_message_offset_page_continues_with_cursor(api_client, ids):
+    app.dependency_overrides[get_message_service] = lambda: MessageService(InMemoryMessageRepository(ids))
+
+    seen = _walk(api_client, "/api/messages/", {"page": 1, "limit": 3}, lambda body: body["messages"])
+
+    assert seen == sorted(ids, reverse=True)
+
+
+def test_message_cursor_page_has_no_totals(api_client):
+    app.dependency_overrides[get_message_service] = lambda: MessageService(InMemoryMessageRepository([1, 2, 3]))
+
+    body = api_client.get("/api/messages/", params={"cursor": 3, "limit": 10}).json()
+
+    assert [message["id"] for message in body["messages"]] == [2, 1]
+    assert body["total"] is None and body["page"] is None and body["total_pages"] is None
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import inspect
+from app.src.domain.entities.client_model import Client
+from app.src.infrastructure.driven.persistence import entity_cache as entity_cache_module
+from app.src.infrastructure.driven.persistence.entity_cache import EntityCache
+
+
+def _client(client_id: int, email: str = "ana@email.com") -> Client:
+    client = Client(name="Ana Souza", email=email, cpf="123.456.789-00", city="Curitiba")
+    client.id = client_id
+    return client
+
+
+@pytest.fixture
+def cache() -> EntityCache:
+    return EntityCache(Client, ttl_seconds=60, max_size=2)
+
+
+def test_get_returns_detached_copy(cache):
+    cache.put(("email", "ana@email.com"), _client(1))
+
+    first = cache.get(("email", "ana@email.com"))
+    second = cache.get(("email", "ana@email.com"))
+
+    assert first is not second
+    assert (first.id, first.name, first.city) == (1, "Ana Souza", "Curitiba")
+    assert inspect(first).detached
+
+
+def test_changes_to_returned_entity_do_not_leak_into_cache(cache):
+    cache.put(("email", "ana@email.com"), _client(1))
+
+    cache.get(("email", "ana@email.com")).name = "Outro Nome"
+
+    assert cache.get(("email", "ana@email.com")).name == "Ana Souza"
+
+
+def test_expired_entry_is_dropped(cache, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(entity_cache_module.time, "monotonic", lambda: now)
+    cache.put(("id", 1), _client(1))
+
+    now += 61
+
+    assert cache.get(("id", 1)) is None
+
+
+def test_invalidate_removes_every_key_of_the_entity(cache):
+    cache.put(("id", 1), _client(1))
+    cache.put(("email", "ana@email.com"), _client(1))
+
+    cache.invalidate(1)
+
+    assert cache.get(("id", 1)) is None
+    assert cache.get(("email", "ana@email.com")) is None
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.put(("id", 1), _client(1))
+    cache.put(("id", 2), _client(2, "bia@email.com"))
+    cache.get(("id", 1))
+    cache.put(("id", 3), _client(3, "caio@email.com"))
+
+    assert cache.get(("id", 2)) is None
+    assert cache.get(("id", 1)).id == 1
+    assert cache.get(("id", 3)).id == 3
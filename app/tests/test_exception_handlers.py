@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+from app.main import app
+from app.src.application.services.client_service import ClientService
+from app.src.application.services.message_service import MessageService
+from app.src.infrastructure.adapters.driving.api.client_routes import get_client_service
+from app.src.infrastructure.adapters.driving.api.message_routes import get_message_service
+
+
+class StubClientRepository:
+    def __init__(self, existing_email=None, error=None):
+        self.existing_email = existing_email
+        self.error = error
+
+    async def get_client_by_email(self, email):
+        return SimpleNamespace(id=1, email=email) if email == self.existing_email else None
+
+    async def get_client_by_cpf(self, cpf):
+        return None
+
+    async def get_client_by_id(self, client_id):
+        raise self.error
+
+
+class StubMessageRepository:
+    def __init__(self, message=None):
+        self.message = message
+
+    async def find_by_id(self, message_id):
+        return self.message
+
+
+_NEW_CLIENT = {"name": "Ana Souza", "email": "ana@email.com", "cpf": "123.456.789-00"}
+
+
+def test_business_rule_error_returns_400(api_client):
+    app.dependency_overrides[get_client_service] = lambda: ClientService(StubClientRepository(existing_email="ana@email.com"))
+
+    response = api_client.post("/api/clients/", json=_NEW_CLIENT)
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Já existe um cliente cadastrado com o email: ana@email.com"}
+
+
+def test_not_found_error_returns_404(api_client):
+    app.dependency_overrides[get_message_service] = lambda: MessageService(StubMessageRepository(message=None))
+
+    response = api_client.patch("/api/messages/7/start-service", json={"responsible_id": 1})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Mensagem com ID 7 não encontrada"}
+
+
+def test_conflict_error_returns_409(api_client):
+    message = SimpleNamespace(id=7, responsible_id=3)
+    app.dependency_overrides[get_message_service] = lambda: MessageService(StubMessageRepository(message=message))
+
+    response = api_client.patch("/api/messages/7/start-service", json={"responsible_id": 1})
+
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Mensagem já possui responsável atribuído"}
+
+
+def test_unexpected_error_returns_generic_500(api_client):
+    error = RuntimeError("Lost connection to MySQL server")
+    app.dependency_overrides[get_client_service] = lambda: ClientService(StubClientRepository(error=error))
+
+    response = api_client.get("/api/clients/1")
+
+    assert response.status_code == 500
+    # Detalhes internos ficam no log, nunca na resposta
+    assert response.json() == {"detail": "Erro interno do servidor"}
+
+
+def test_plain_value_error_is_not_a_client_error(api_client):
+    app.dependency_overrides[get_client_service] = lambda: ClientService(StubClientRepository(error=ValueError("bug")))
+
+    response = api_client.get("/api/clients/1")
+
+    assert response.status_code == 500
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from app.src.domain.entities.client_model import Client
+from app.src.domain.entities.employee_model import Employee
+from app.src.infrastructure.driven.persistence.name_search import NGRAM_TOKEN_SIZE, name_contains_filter
+
+
+def _sql(condition) -> str:
+    return str(condition.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize("column", [Client.name, Employee.name])
+def test_term_uses_fulltext_phrase_in_boolean_mode(column):
+    sql = _sql(name_contains_filter(column, "Silva"))
+
+    assert sql.startswith(f"MATCH ({column.class_.__tablename__}.name) AGAINST (")
+    assert "'\"Silva\"'" in sql
+    assert sql.endswith("IN BOOLEAN MODE)")
+
+
+def test_term_is_stripped_before_choosing_the_strategy():
+    # Com espaços, "  a " passaria do tamanho do token; sem eles é uma letra só
+    sql = _sql(name_contains_filter(Client.name, "  a "))
+
+    assert "MATCH" not in sql
+    assert "clients.name LIKE" in sql and "'a'" in sql
+
+
+def test_term_shorter_than_a_token_falls_back_to_like():
+    sql = _sql(name_contains_filter(Client.name, "x" * (NGRAM_TOKEN_SIZE - 1)))
+
+    assert "LIKE" in sql and "MATCH" not in sql
+
+
+def test_quotes_cannot_break_the_phrase_operator():
+    sql = _sql(name_contains_filter(Client.name, 'Ana" -Souza'))
+
+    assert "'\"Ana -Souza\"'" in sql
+
+
+def test_filter_composes_into_a_select():
+    query = select(Client.id).where(name_contains_filter(Client.name, "Ana"))
+
+    assert "WHERE MATCH (clients.name) AGAINST" in _sql(query)
@@ -0,0 +1,80 @@
+import time
+import jwt
+import pytest
+from app.src.application.services import user_service as user_service_module
+from app.src.application.services.user_service import SECRET_KEY, ALGORITHM, UserService
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    user_service_module._token_payload_cache.clear()
+    yield
+    user_service_module._token_payload_cache.clear()
+
+
+@pytest.fixture
+def service() -> UserService:
+    return UserService(user_repository=None)
+
+
+def _token(**claims) -> str:
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def test_decode_token_serves_cached_payload(service):
+    token = _token(sub="1", email="a@b.com", jti="j1", exp=int(time.time()) + 60)
+
+    first = service._decode_token(token)
+    second = service._decode_token(token)
+
+    assert second is first
+    assert first["email"] == "a@b.com"
+
+
+def test_cached_payload_is_read_only(service):
+    token = _token(sub="1", email="a@b.com", jti="j1", exp=int(time.time()) + 60)
+    payload = service._decode_token(token)
+
+    with pytest.raises(TypeError):
+        payload["role"] = "Administrador"
+
+    assert "role" not in service._decode_token(token)
+
+
+def test_expired_cache_entry_is_decoded_again(service, monkeypatch):
+    exp = int(time.time()) + 60
+    token = _token(sub="1", email="a@b.com", jti="j1", exp=exp)
+    first = service._decode_token(token)
+
+    # Só o relógio usado pelo cache avança: a assinatura continua válida para o PyJWT
+    monkeypatch.setattr(user_service_module.time, "time", lambda: exp + 1)
+
+    assert service._decode_token(token) is not first
+
+
+def test_token_without_exp_is_rejected(service):
+    token = _token(sub="1", email="a@b.com", jti="j1")
+
+    with pytest.raises(jwt.MissingRequiredClaimError):
+        service._decode_token(token)
+    assert token not in user_service_module._token_payload_cache
+
+
+@pytest.mark.asyncio
+async def test_verify_token_without_exp_returns_none(service):
+    token = _token(sub="1", email="a@b.com", jti="j1")
+
+    assert await service._verify_token(token) is None
+
+
+def test_cache_evicts_least_recently_used(service, monkeypatch):
+    monkeypatch.setattr(user_service_module, "TOKEN_CACHE_MAX_SIZE", 2)
+    exp = int(time.time()) + 60
+    tokens = [_token(sub=str(i), email="a@b.com", jti=f"j{i}", exp=exp) for i in range(3)]
+
+    service._decode_token(tokens[0])
+    service._decode_token(tokens[1])
+    service._decode_token(tokens[0])
+    service._decode_token(tokens[2])
+
+    assert list(user_service_module._token_payload_cache) == [tokens[0], tokens[2]]
@@ -0,0 +1,44 @@
+USE carsales;
+
+-- Endereço passa a ser armazenado diretamente em clients e employees,
+-- eliminando o JOIN com a tabela addresses em todas as consultas.
+
+ALTER TABLE employees
+    ADD COLUMN street VARCHAR(100) AFTER status,
+    ADD COLUMN city VARCHAR(100) AFTER street,
+    ADD COLUMN state VARCHAR(100) AFTER city,
+    ADD COLUMN zip_code VARCHAR(20) AFTER state,
+    ADD COLUMN country VARCHAR(100) AFTER zip_code;
+
+ALTER TABLE clients
+    ADD COLUMN street VARCHAR(100) AFTER cpf,
+    ADD COLUMN city VARCHAR(100) AFTER street,
+    ADD COLUMN state VARCHAR(100) AFTER city,
+    ADD COLUMN zip_code VARCHAR(20) AFTER state,
+    ADD COLUMN country VARCHAR(100) AFTER zip_code;
+
+-- Copiar endereços existentes
+UPDATE employees e
+JOIN addresses a ON e.address_id = a.id
+SET e.street = a.street,
+    e.city = a.city,
+    e.state = a.state,
+    e.zip_code = a.zip_code,
+    e.country = a.country;
+
+UPDATE clients c
+JOIN addresses a ON c.address_id = a.id
+SET c.street = a.street,
+    c.city = a.city,
+    c.state = a.state,
+    c.zip_code = a.zip_code,
+    c.country = a.country;
+
+-- Remover a referência antiga (nomes gerados automaticamente pelo MySQL em create_tables.sql)
+ALTER TABLE employees DROP FOREIGN KEY employees_ibfk_1;
+ALTER TABLE employees DROP COLUMN address_id;
+
+ALTER TABLE clients DROP FOREIGN KEY clients_ibfk_1;
+ALTER TABLE clients DROP COLUMN address_id;
+
+DROP TABLE addresses;
@@ -0,0 +1,22 @@
+USE carsales;
+
+-- Vocabulário fixo armazenado como ENUM nativo (1 byte por linha em vez da string completa)
+
+-- Normaliza os dados existentes antes da conversão: NULL ou valores fora do vocabulário
+-- fariam o MODIFY para ENUM NOT NULL falhar (ou gravar '' fora do modo estrito)
+UPDATE messages SET status = TRIM(status) WHERE status IS NOT NULL;
+UPDATE messages SET status = 'Pendente'
+    WHERE status IS NULL
+       OR status NOT IN ('Pendente', 'Contato iniciado', 'Finalizado', 'Cancelado');
+
+ALTER TABLE messages
+    MODIFY status ENUM('Pendente', 'Contato iniciado', 'Finalizado', 'Cancelado') NOT NULL DEFAULT 'Pendente';
+
+-- Papéis desconhecidos caem para o perfil de menor privilégio
+UPDATE users SET role = TRIM(role) WHERE role IS NOT NULL;
+UPDATE users SET role = 'Vendedor'
+    WHERE role IS NULL
+       OR role NOT IN ('Vendedor', 'Administrador');
+
+ALTER TABLE users
+    MODIFY role ENUM('Vendedor', 'Administrador') NOT NULL;
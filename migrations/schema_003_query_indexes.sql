@@ -0,0 +1,24 @@
+USE carsales;
+
+-- Índices alinhados às consultas dos repositórios
+
+-- Buscas por email/CPF (também garantem unicidade no banco)
+CREATE UNIQUE INDEX ix_clients_email ON clients (email);
+CREATE UNIQUE INDEX ix_clients_cpf ON clients (cpf);
+
+CREATE UNIQUE INDEX ix_employees_email ON employees (email);
+CREATE UNIQUE INDEX ix_employees_cpf ON employees (cpf);
+CREATE INDEX ix_employees_status ON employees (status);
+
+-- Listagens de veículos filtradas por status e faixa/ordenação de preço
+CREATE INDEX ix_mv_status_price ON motor_vehicles (status, price);
+
+-- Listagem de mensagens por status ordenada por id: já atendida pelo idx_status
+-- existente (o InnoDB anexa a chave primária, então ele equivale a (status, id))
+
+-- Imagem principal de um veículo; substitui idx_vehicle_id (prefixo deste índice e de
+-- unique_vehicle_position, que também atende a FK) e idx_is_primary (nunca consultado
+-- sem vehicle_id)
+CREATE INDEX ix_vi_vehicle_primary ON vehicle_images (vehicle_id, is_primary, position);
+DROP INDEX idx_vehicle_id ON vehicle_images;
+DROP INDEX idx_is_primary ON vehicle_images;
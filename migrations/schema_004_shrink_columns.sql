@@ -0,0 +1,42 @@
+USE carsales;
+
+-- Colunas dimensionadas pelo conteúdo real (linhas menores em sorts, temp tables e rede)
+
+-- Auditoria: linhas que não cabem nos novos tamanhos. Precisam ser corrigidas à mão
+-- (telefone/cor mal formatados, caminhos de arquivo) antes de rodar os ALTERs abaixo;
+-- truncar automaticamente corromperia dados e quebraria caminhos de imagens em disco.
+SELECT 'clients.phone' AS coluna, id, CHAR_LENGTH(phone) AS tamanho FROM clients WHERE CHAR_LENGTH(phone) > 20
+UNION ALL
+SELECT 'employees.phone', id, CHAR_LENGTH(phone) FROM employees WHERE CHAR_LENGTH(phone) > 20
+UNION ALL
+SELECT 'motor_vehicles.fuel_type', id, CHAR_LENGTH(fuel_type) FROM motor_vehicles WHERE CHAR_LENGTH(fuel_type) > 15
+UNION ALL
+SELECT 'motor_vehicles.color', id, CHAR_LENGTH(color) FROM motor_vehicles WHERE CHAR_LENGTH(color) > 30
+UNION ALL
+SELECT 'motor_vehicles.additional_description', id, CHAR_LENGTH(additional_description) FROM motor_vehicles WHERE CHAR_LENGTH(additional_description) > 1000
+UNION ALL
+SELECT 'vehicle_images.filename', id, CHAR_LENGTH(filename) FROM vehicle_images WHERE CHAR_LENGTH(filename) > 128
+UNION ALL
+SELECT 'vehicle_images.path', id, CHAR_LENGTH(path) FROM vehicle_images WHERE CHAR_LENGTH(path) > 255
+UNION ALL
+SELECT 'vehicle_images.thumbnail_path', id, CHAR_LENGTH(thumbnail_path) FROM vehicle_images WHERE CHAR_LENGTH(thumbnail_path) > 255;
+
+-- Modo estrito garante que um valor remanescente maior que o novo tamanho aborte o
+-- ALTER com erro em vez de ser truncado silenciosamente
+SET SESSION sql_mode = CONCAT_WS(',', NULLIF(@@SESSION.sql_mode, ''), 'STRICT_ALL_TABLES');
+
+ALTER TABLE clients
+    MODIFY phone VARCHAR(20);
+
+ALTER TABLE employees
+    MODIFY phone VARCHAR(20);
+
+ALTER TABLE motor_vehicles
+    MODIFY fuel_type VARCHAR(15),
+    MODIFY color VARCHAR(30),
+    MODIFY additional_description VARCHAR(1000);
+
+ALTER TABLE vehicle_images
+    MODIFY filename VARCHAR(128) NOT NULL,
+    MODIFY path VARCHAR(255) NOT NULL,
+    MODIFY thumbnail_path VARCHAR(255) NULL;
@@ -0,0 +1,23 @@
+USE carsales;
+
+-- Ano como inteiro (2 bytes, comparação/ordenação numérica) e preço positivo garantido pelo banco
+
+-- Espaços nas bordas são a única normalização segura do ano
+UPDATE motor_vehicles SET year = TRIM(year) WHERE year <> TRIM(year);
+
+-- Auditoria: anos que não são 4 dígitos (ex.: '2020/2021', vazio, NULL) e preços não
+-- positivos. Precisam ser corrigidos à mão antes do ALTER abaixo; convertê-los
+-- automaticamente gravaria 0 ou um ano truncado
+SELECT 'motor_vehicles.year' AS coluna, id, year AS valor FROM motor_vehicles
+    WHERE year IS NULL OR year NOT REGEXP '^[0-9]{4}$'
+UNION ALL
+SELECT 'motor_vehicles.price', id, CAST(price AS CHAR) FROM motor_vehicles
+    WHERE price <= 0;
+
+-- Modo estrito garante que um valor remanescente inválido aborte o ALTER com erro
+-- em vez de ser convertido silenciosamente
+SET SESSION sql_mode = CONCAT_WS(',', NULLIF(@@SESSION.sql_mode, ''), 'STRICT_ALL_TABLES');
+
+ALTER TABLE motor_vehicles
+    MODIFY year SMALLINT NOT NULL,
+    ADD CONSTRAINT ck_mv_price_positive CHECK (price > 0);
@@ -0,0 +1,21 @@
+USE carsales;
+
+-- Formato de CPF (com ou sem máscara) e email validados pelo banco
+
+-- Auditoria: o ADD CONSTRAINT valida todas as linhas existentes e falha inteiro por
+-- um único registro fora do formato. Corrigir à mão as linhas listadas antes dos ALTERs
+SELECT 'clients' AS tabela, id, cpf, email FROM clients
+    WHERE cpf IS NULL OR cpf NOT REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'
+       OR email IS NULL OR email NOT LIKE '%_@_%'
+UNION ALL
+SELECT 'employees', id, cpf, email FROM employees
+    WHERE cpf IS NULL OR cpf NOT REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'
+       OR email IS NULL OR email NOT LIKE '%_@_%';
+
+ALTER TABLE clients
+    ADD CONSTRAINT ck_clients_cpf CHECK (cpf REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'),
+    ADD CONSTRAINT ck_clients_email CHECK (email LIKE '%_@_%');
+
+ALTER TABLE employees
+    ADD CONSTRAINT ck_employees_cpf CHECK (cpf REGEXP '^[0-9]{3}[.]?[0-9]{3}[.]?[0-9]{3}-?[0-9]{2}$'),
+    ADD CONSTRAINT ck_employees_email CHECK (email LIKE '%_@_%');
@@ -0,0 +1,25 @@
+USE carsales;
+
+-- Garante no máximo uma imagem principal por veículo.
+-- MySQL não suporta índice parcial (WHERE is_primary = 1): a coluna gerada vale
+-- vehicle_id apenas para a imagem principal e NULL para as demais.
+
+-- Antes desta restrição, desmarcar a principal antiga e marcar a nova eram comandos
+-- separados, então um veículo pode ter ficado com mais de uma. Mantém só a de menor
+-- posição (única por veículo, pelo unique_vehicle_position). O GROUP BY materializa
+-- a tabela derivada, o que permite ler e atualizar vehicle_images no mesmo comando
+UPDATE vehicle_images vi
+JOIN (
+    SELECT vehicle_id, MIN(position) AS keep_position
+    FROM vehicle_images
+    WHERE is_primary = 1
+    GROUP BY vehicle_id
+    HAVING COUNT(*) > 1
+) duplicated ON duplicated.vehicle_id = vi.vehicle_id
+SET vi.is_primary = 0
+WHERE vi.is_primary = 1
+  AND vi.position <> duplicated.keep_position;
+
+ALTER TABLE vehicle_images
+    ADD COLUMN primary_vehicle_id BIGINT GENERATED ALWAYS AS (IF(is_primary, vehicle_id, NULL)) VIRTUAL AFTER is_primary,
+    ADD UNIQUE INDEX uq_primary_per_vehicle (primary_vehicle_id);
@@ -0,0 +1,25 @@
+USE carsales;
+
+-- Busca de funcionários por nome via índice FULLTEXT com parser ngram
+-- (equivalente MySQL ao pg_trgm): substitui o LIKE '%nome%', que varre a tabela inteira.
+-- Tokens de 2 caracteres (ngram_token_size padrão); termos menores usam LIKE na aplicação.
+--
+-- Sem stopwords: o parser ngram descarta todo token que contém uma stopword, e a
+-- lista padrão do InnoDB inclui "a" e "i" -- nomes como "Maria" ou "Silva" ficariam
+-- fora do índice. A configuração em vigor na criação fica gravada no índice; o
+-- servidor também sobe com --innodb-ft-enable-stopword=OFF (docker-compose.yaml)
+-- para que reconstruções da tabela mantenham o mesmo comportamento.
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+-- Recria o índice caso já exista (criado antes com a lista de stopwords padrão)
+SET @has_index = (
+    SELECT COUNT(*) FROM information_schema.statistics
+    WHERE table_schema = 'carsales' AND table_name = 'employees' AND index_name = 'ft_employees_name'
+);
+SET @drop_index = IF(@has_index > 0, 'ALTER TABLE employees DROP INDEX ft_employees_name', 'DO 0');
+PREPARE stmt FROM @drop_index;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+ALTER TABLE employees
+    ADD FULLTEXT INDEX ft_employees_name (name) WITH PARSER ngram;
@@ -0,0 +1,22 @@
+USE carsales;
+
+-- Busca de clientes por nome via índice FULLTEXT com parser ngram, como em
+-- schema_008 para funcionários: substitui o LIKE '%nome%', que varre a tabela inteira.
+-- Tokens de 2 caracteres (ngram_token_size padrão); termos menores usam LIKE na aplicação.
+--
+-- Sem stopwords, pelo mesmo motivo de schema_008: com a lista padrão do InnoDB
+-- ("a", "i", ...) o parser ngram descartaria os bigramas de nomes como "Ana" ou "Silva".
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+-- Recria o índice caso já exista (criado antes com a lista de stopwords padrão)
+SET @has_index = (
+    SELECT COUNT(*) FROM information_schema.statistics
+    WHERE table_schema = 'carsales' AND table_name = 'clients' AND index_name = 'ft_clients_name'
+);
+SET @drop_index = IF(@has_index > 0, 'ALTER TABLE clients DROP INDEX ft_clients_name', 'DO 0');
+PREPARE stmt FROM @drop_index;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+ALTER TABLE clients
+    ADD FULLTEXT INDEX ft_clients_name (name) WITH PARSER ngram;